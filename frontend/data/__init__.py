@@ -1,3 +1,15 @@
 from .definitions import *
 from .blocs import *
+from . import definitions as _definitions
 
+
+def __getattr__(name):
+    # The lookup tables in definitions are built on first use; forward them
+    # so they stay available here without being built at import
+    if name in _definitions._LAZY_INDEXES:
+        return getattr(_definitions, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _definitions._LAZY_INDEXES.keys())
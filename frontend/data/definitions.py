@@ -1,5 +1,31 @@
 #!/usr/bin/env python
+import functools
 import json
+import logging
+import os
+import sys
+import threading
+import time
+from types import MappingProxyType
+from typing import NamedTuple
+
+# Names exported by `from .definitions import *`. The lazily built lookup
+# tables (see _LAZY_INDEXES) are left out so a star-import does not build
+# them; the frontend.data package forwards them on attribute access instead.
+__all__ = [
+    "ANZUS", "FIVE_EYES", "AUKUS", "G20", "OECD", "APEC", "CPTPP", "RCEP",
+    "WTO", "PACIFIC_ISLANDS_FORUM", "EAST_ASIA_SUMMIT", "ASEAN_REGIONAL_FORUM",
+    "UNITED_NATIONS", "COMMONWEALTH_OF_NATIONS", "EUD", "IMF",
+    "WORLD_BANK_GROUP", "IAEA", "ANTARCTIC_TREATY", "QUAD", "IORA",
+    "country_name_mappings",
+    "IsoEntry",
+    "find_iso_3166_code",
+    "export_combined_codes_as_dict",
+    "export_combined_codes_as_list",
+    "get_country_by_currency_code",
+    "get_currency_by_country_code",
+    "convert_bloc_to_4217",
+]
 """
 Multinational Political, Economic, Security, and Diplomatic Blocs
 that Australia belongs to as a member state.
@@ -91,7 +117,7 @@ COMMONWEALTH_OF_NATIONS = {"ATG", "AUS", "BHS", "BGD", "BRB", "BLZ", "BWA", "BRN
 # EUD - Euro Dollar users
 # Countries and territories that use the Euro (EUR) as their official currency
 # Includes EU member states in the Eurozone plus other territories that have adopted the Euro
-EUD = {"AND", "AUT", "BEL", "CYP", "EST", "FIN", "FRA", "DEU", "GRC", "IRL", "ITA", "LVA", "LTU", "LUX", "MLT", "MCO", "MNE", "NLD", "PRT", "SMR", "SVK", "SVN", "ESP", "VAT"}
+EUD = frozenset({"AND", "AUT", "BEL", "CYP", "EST", "FIN", "FRA", "DEU", "GRC", "IRL", "ITA", "LVA", "LTU", "LUX", "MLT", "MCO", "MNE", "NLD", "PRT", "SMR", "SVK", "SVN", "ESP", "VAT"})
 
 # International Monetary Fund - International financial institution
 # Established in 1944 to foster global monetary cooperation
@@ -125,1237 +151,480 @@ QUAD = {"AUS", "IND", "JPN", "USA"}
 # Australia joined: 1997 (founding member)
 IORA = {"AUS", "BGD", "COM", "FRA", "IND", "IDN", "IRN", "KEN", "MDG", "MYS", "MUS", "MOZ", "OMN", "SGP", "SOM", "ZAF", "LKA", "TZA", "THA", "ARE", "YEM"}
 
-ISO_3166_CODES = [
-    { "ABW" : "Aruba" },
-    { "AFG" : "Afghanistan" },
-    { "AGO" : "Angola" },
-    { "AIA" : "Anguilla" },
-    { "ALA" : "Åland Islands" },
-    { "ALB" : "Albania" },
-    { "AND" : "Andorra" },
-    { "ARE" : "United Arab Emirates" },
-    { "ARG" : "Argentina" },
-    { "ARM" : "Armenia" },
-    { "ASM" : "American Samoa" },
-    { "ATA" : "Antarctica" },
-    { "ATF" : "French Southern Territories" },
-    { "ATG" : "Antigua and Barbuda" },
-    { "AUS" : "Australia" },
-    { "AUT" : "Austria" },
-    { "AZE" : "Azerbaijan" },
-    { "BDI" : "Burundi" },
-    { "BEL" : "Belgium" },
-    { "BEN" : "Benin" },
-    { "BES" : "Bonaire, Sint Eustatius and Saba" },
-    { "BFA" : "Burkina Faso" },
-    { "BGD" : "Bangladesh" },
-    { "BGR" : "Bulgaria" },
-    { "BHR" : "Bahrain" },
-    { "BHS" : "Bahamas" },
-    { "BIH" : "Bosnia and Herzegovina" },
-    { "BLM" : "Saint Barthélemy" },
-    { "BLR" : "Belarus" },
-    { "BLZ" : "Belize" },
-    { "BMU" : "Bermuda" },
-    { "BOL" : "Bolivia, Plurinational State of" },
-    { "BRA" : "Brazil" },
-    { "BRB" : "Barbados" },
-    { "BRN" : "Brunei Darussalam" },
-    { "BTN" : "Bhutan" },
-    { "BVT" : "Bouvet Island" },
-    { "BWA" : "Botswana" },
-    { "CAF" : "Central African Republic" },
-    { "CAN" : "Canada" },
-    { "CCK" : "Cocos (Keeling) Islands" },
-    { "CHE" : "Switzerland" },
-    { "CHL" : "Chile" },
-    { "CHN" : "China" },
-    { "CIV" : "Côte d'Ivoire" },
-    { "CMR" : "Cameroon" },
-    { "COD" : "Congo, Democratic Republic of the" },
-    { "COG" : "Congo" },
-    { "COK" : "Cook Islands" },
-    { "COL" : "Colombia" },
-    { "COM" : "Comoros" },
-    { "CPV" : "Cabo Verde" },
-    { "CRI" : "Costa Rica" },
-    { "CUB" : "Cuba" },
-    { "CUW" : "Curaçao" },
-    { "CXR" : "Christmas Island" },
-    { "CYM" : "Cayman Islands" },
-    { "CYP" : "Cyprus" },
-    { "CZE" : "Czechia" },
-    { "DEU" : "Germany" },
-    { "DJI" : "Djibouti" },
-    { "DMA" : "Dominica" },
-    { "DNK" : "Denmark" },
-    { "DOM" : "Dominican Republic" },
-    { "DZA" : "Algeria" },
-    { "ECU" : "Ecuador" },
-    { "EGY" : "Egypt" },
-    { "ERI" : "Eritrea" },
-    { "ESH" : "Western Sahara" },
-    { "ESP" : "Spain" },
-    { "EST" : "Estonia" },
-    { "ETH" : "Ethiopia" },
-    { "FIN" : "Finland" },
-    { "FJI" : "Fiji" },
-    { "FLK" : "Falkland Islands (Malvinas)" },
-    { "FRA" : "France" },
-    { "FRO" : "Faroe Islands" },
-    { "FSM" : "Micronesia, Federated States of" },
-    { "GAB" : "Gabon" },
-    { "GBR" : "United Kingdom of Great Britain and Northern Ireland" },
-    { "GEO" : "Georgia" },
-    { "GGY" : "Guernsey" },
-    { "GHA" : "Ghana" },
-    { "GIB" : "Gibraltar" },
-    { "GIN" : "Guinea" },
-    { "GLP" : "Guadeloupe" },
-    { "GMB" : "Gambia" },
-    { "GNB" : "Guinea-Bissau" },
-    { "GNQ" : "Equatorial Guinea" },
-    { "GRC" : "Greece" },
-    { "GRD" : "Grenada" },
-    { "GRL" : "Greenland" },
-    { "GTM" : "Guatemala" },
-    { "GUF" : "French Guiana" },
-    { "GUM" : "Guam" },
-    { "GUY" : "Guyana" },
-    { "HKG" : "Hong Kong" },
-    { "HMD" : "Heard Island and McDonald Islands" },
-    { "HND" : "Honduras" },
-    { "HRV" : "Croatia" },
-    { "HTI" : "Haiti" },
-    { "HUN" : "Hungary" },
-    { "IDN" : "Indonesia" },
-    { "IMN" : "Isle of Man" },
-    { "IND" : "India" },
-    { "IOT" : "British Indian Ocean Territory" },
-    { "IRL" : "Ireland" },
-    { "IRN" : "Iran, Islamic Republic of" },
-    { "IRQ" : "Iraq" },
-    { "ISL" : "Iceland" },
-    { "ISR" : "Israel" },
-    { "ITA" : "Italy" },
-    { "JAM" : "Jamaica" },
-    { "JEY" : "Jersey" },
-    { "JOR" : "Jordan" },
-    { "JPN" : "Japan" },
-    { "KAZ" : "Kazakhstan" },
-    { "KEN" : "Kenya" },
-    { "KGZ" : "Kyrgyzstan" },
-    { "KHM" : "Cambodia" },
-    { "KIR" : "Kiribati" },
-    { "KNA" : "Saint Kitts and Nevis" },
-    { "KOR" : "Korea, Republic of" },
-    { "KWT" : "Kuwait" },
-    { "LAO" : "Lao People's Democratic Republic" },
-    { "LBN" : "Lebanon" },
-    { "LBR" : "Liberia" },
-    { "LBY" : "Libya" },
-    { "LCA" : "Saint Lucia" },
-    { "LIE" : "Liechtenstein" },
-    { "LKA" : "Sri Lanka" },
-    { "LSO" : "Lesotho" },
-    { "LTU" : "Lithuania" },
-    { "LUX" : "Luxembourg" },
-    { "LVA" : "Latvia" },
-    { "MAC" : "Macao" },
-    { "MAF" : "Saint Martin (French part)" },
-    { "MAR" : "Morocco" },
-    { "MCO" : "Monaco" },
-    { "MDA" : "Moldova, Republic of" },
-    { "MDG" : "Madagascar" },
-    { "MDV" : "Maldives" },
-    { "MEX" : "Mexico" },
-    { "MHL" : "Marshall Islands" },
-    { "MKD" : "North Macedonia" },
-    { "MLI" : "Mali" },
-    { "MLT" : "Malta" },
-    { "MMR" : "Myanmar" },
-    { "MNE" : "Montenegro" },
-    { "MNG" : "Mongolia" },
-    { "MNP" : "Northern Mariana Islands" },
-    { "MOZ" : "Mozambique" },
-    { "MRT" : "Mauritania" },
-    { "MSR" : "Montserrat" },
-    { "MTQ" : "Martinique" },
-    { "MUS" : "Mauritius" },
-    { "MWI" : "Malawi" },
-    { "MYS" : "Malaysia" },
-    { "MYT" : "Mayotte" },
-    { "NAM" : "Namibia" },
-    { "NCL" : "New Caledonia" },
-    { "NER" : "Niger" },
-    { "NFK" : "Norfolk Island" },
-    { "NGA" : "Nigeria" },
-    { "NIC" : "Nicaragua" },
-    { "NIU" : "Niue" },
-    { "NLD" : "Netherlands, Kingdom of the" },
-    { "NOR" : "Norway" },
-    { "NPL" : "Nepal" },
-    { "NRU" : "Nauru" },
-    { "NZL" : "New Zealand" },
-    { "OMN" : "Oman" },
-    { "PAK" : "Pakistan" },
-    { "PAN" : "Panama" },
-    { "PCN" : "Pitcairn" },
-    { "PER" : "Peru" },
-    { "PHL" : "Philippines" },
-    { "PLW" : "Palau" },
-    { "PNG" : "Papua New Guinea" },
-    { "POL" : "Poland" },
-    { "PRI" : "Puerto Rico" },
-    { "PRK" : "Korea, Democratic People's Republic of" },
-    { "PRT" : "Portugal" },
-    { "PRY" : "Paraguay" },
-    { "PSE" : "Palestine, State of" },
-    { "PYF" : "French Polynesia" },
-    { "QAT" : "Qatar" },
-    { "REU" : "Réunion" },
-    { "ROU" : "Romania" },
-    { "RUS" : "Russian Federation" },
-    { "RWA" : "Rwanda" },
-    { "SAU" : "Saudi Arabia" },
-    { "SDN" : "Sudan" },
-    { "SEN" : "Senegal" },
-    { "SGP" : "Singapore" },
-    { "SGS" : "South Georgia and the South Sandwich Islands" },
-    { "SHN" : "Saint Helena, Ascension and Tristan da Cunha" },
-    { "SJM" : "Svalbard and Jan Mayen" },
-    { "SLB" : "Solomon Islands" },
-    { "SLE" : "Sierra Leone" },
-    { "SLV" : "El Salvador" },
-    { "SMR" : "San Marino" },
-    { "SOM" : "Somalia" },
-    { "SPM" : "Saint Pierre and Miquelon" },
-    { "SRB" : "Serbia" },
-    { "SSD" : "South Sudan" },
-    { "STP" : "Sao Tome and Principe" },
-    { "SUR" : "Suriname" },
-    { "SVK" : "Slovakia" },
-    { "SVN" : "Slovenia" },
-    { "SWE" : "Sweden" },
-    { "SWZ" : "Eswatini" },
-    { "SXM" : "Sint Maarten (Dutch part)" },
-    { "SYC" : "Seychelles" },
-    { "SYR" : "Syrian Arab Republic" },
-    { "TCA" : "Turks and Caicos Islands" },
-    { "TCD" : "Chad" },
-    { "TGO" : "Togo" },
-    { "THA" : "Thailand" },
-    { "TJK" : "Tajikistan" },
-    { "TKL" : "Tokelau" },
-    { "TKM" : "Turkmenistan" },
-    { "TLS" : "Timor-Leste" },
-    { "TON" : "Tonga" },
-    { "TTO" : "Trinidad and Tobago" },
-    { "TUN" : "Tunisia" },
-    { "TUR" : "Türkiye" },
-    { "TUV" : "Tuvalu" },
-    { "TWN" : "Taiwan, Province of China" },
-    { "TZA" : "Tanzania, United Republic of" },
-    { "UGA" : "Uganda" },
-    { "UKR" : "Ukraine" },
-    { "UMI" : "United States Minor Outlying Islands" },
-    { "URY" : "Uruguay" },
-    { "USA" : "United States of America" },
-    { "UZB" : "Uzbekistan" },
-    { "VAT" : "Holy See" },
-    { "VCT" : "Saint Vincent and the Grenadines" },
-    { "VEN" : "Venezuela, Bolivarian Republic of" },
-    { "VGB" : "Virgin Islands (British)" },
-    { "VIR" : "Virgin Islands (U.S.)" },
-    { "VNM" : "Viet Nam" },
-    { "VUT" : "Vanuatu" },
-    { "WLF" : "Wallis and Futuna" },
-    { "WSM" : "Samoa" },
-    { "YEM" : "Yemen" },
-    { "ZAF" : "South Africa" },
-    { "ZMB" : "Zambia" },
-    { "ZWE" : "Zimbabwe" }
-]
-
-
-ISO_4217_CODES = [
-    {
-        "country": "United Arab Emirates",
-        "currency": "UAE Dirham",
-        "code": "AED"
-    },
-    {
-        "country": "Afghanistan",
-        "currency": "Afghan Afghani",
-        "code": "AFN"
-    },
-    {
-        "country": "Albania",
-        "currency": "Albanian Lek",
-        "code": "ALL"
-    },
-    {
-        "country": "Armenia",
-        "currency": "Armenian Dram",
-        "code": "AMD"
-    },
-    {
-        "country": "Netherlands Antilles",
-        "currency": "Netherlands Antillian Guilder",
-        "code": "ANG"
-    },
-    {
-        "country": "Angola",
-        "currency": "Angolan Kwanza",
-        "code": "AOA"
-    },
-    {
-        "country": "Argentina",
-        "currency": "Argentine Peso",
-        "code": "ARS"
-    },
-    {
-        "country": "Australia",
-        "currency": "Australian Dollar",
-        "code": "AUD"
-    },
-    {
-        "country": "Aruba",
-        "currency": "Aruban Florin",
-        "code": "AWG"
-    },
-    {
-        "country": "Azerbaijan",
-        "currency": "Azerbaijani Manat",
-        "code": "AZN"
-    },
-    {
-        "country": "Bosnia and Herzegovina",
-        "currency": "Bosnia and Herzegovina Mark",
-        "code": "BAM"
-    },
-    {
-        "country": "Barbados",
-        "currency": "Barbados Dollar",
-        "code": "BBD"
-    },
-    {
-        "country": "Bangladesh",
-        "currency": "Bangladeshi Taka",
-        "code": "BDT"
-    },
-    {
-        "country": "Bulgaria",
-        "currency": "Bulgarian Lev",
-        "code": "BGN"
-    },
-    {
-        "country": "Bahrain",
-        "currency": "Bahraini Dinar",
-        "code": "BHD"
-    },
-    {
-        "country": "Burundi",
-        "currency": "Burundian Franc",
-        "code": "BIF"
-    },
-    {
-        "country": "Bermuda",
-        "currency": "Bermudian Dollar",
-        "code": "BMD"
-    },
-    {
-        "country": "Brunei",
-        "currency": "Brunei Dollar",
-        "code": "BND"
-    },
-    {
-        "country": "Bolivia",
-        "currency": "Bolivian Boliviano",
-        "code": "BOB"
-    },
-    {
-        "country": "Brazil",
-        "currency": "Brazilian Real",
-        "code": "BRL"
-    },
-    {
-        "country": "Bahamas",
-        "currency": "Bahamian Dollar",
-        "code": "BSD"
-    },
-    {
-        "country": "Bhutan",
-        "currency": "Bhutanese Ngultrum",
-        "code": "BTN"
-    },
-    {
-        "country": "Botswana",
-        "currency": "Botswana Pula",
-        "code": "BWP"
-    },
-    {
-        "country": "Belarus",
-        "currency": "Belarusian Ruble",
-        "code": "BYN"
-    },
-    {
-        "country": "Belize",
-        "currency": "Belize Dollar",
-        "code": "BZD"
-    },
-    {
-        "country": "Canada",
-        "currency": "Canadian Dollar",
-        "code": "CAD"
-    },
-    {
-        "country": "Democratic Republic of the Congo",
-        "currency": "Congolese Franc",
-        "code": "CDF"
-    },
-    {
-        "country": "Switzerland",
-        "currency": "Swiss Franc",
-        "code": "CHF"
-    },
-    {
-        "country": "Chile",
-        "currency": "Chilean Peso",
-        "code": "CLP"
-    },
-    {
-        "country": "China",
-        "currency": "Chinese Renminbi",
-        "code": "CNY"
-    },
-    {
-        "country": "Colombia",
-        "currency": "Colombian Peso",
-        "code": "COP"
-    },
-    {
-        "country": "Costa Rica",
-        "currency": "Costa Rican Colon",
-        "code": "CRC"
-    },
-    {
-        "country": "Cuba",
-        "currency": "Cuban Peso",
-        "code": "CUP"
-    },
-    {
-        "country": "Cape Verde",
-        "currency": "Cape Verdean Escudo",
-        "code": "CVE"
-    },
-    {
-        "country": "Czech Republic",
-        "currency": "Czech Koruna",
-        "code": "CZK"
-    },
-    {
-        "country": "Djibouti",
-        "currency": "Djiboutian Franc",
-        "code": "DJF"
-    },
-    {
-        "country": "Denmark",
-        "currency": "Danish Krone",
-        "code": "DKK"
-    },
-    {
-        "country": "Dominican Republic",
-        "currency": "Dominican Peso",
-        "code": "DOP"
-    },
-    {
-        "country": "Algeria",
-        "currency": "Algerian Dinar",
-        "code": "DZD"
-    },
-    {
-        "country": "Egypt",
-        "currency": "Egyptian Pound",
-        "code": "EGP"
-    },
-    {
-        "country": "Eritrea",
-        "currency": "Eritrean Nakfa",
-        "code": "ERN"
-    },
-    {
-        "country": "Ethiopia",
-        "currency": "Ethiopian Birr",
-        "code": "ETB"
-    },
-    {
-        "country": "European Union",
-        "currency": "Euro",
-        "code": "EUR"
-    },
-    {
-        "country": "Fiji",
-        "currency": "Fiji Dollar",
-        "code": "FJD"
-    },
-    {
-        "country": "Falkland Islands",
-        "currency": "Falkland Islands Pound",
-        "code": "FKP"
-    },
-    {
-        "country": "Faroe Islands",
-        "currency": "Faroese Króna",
-        "code": "FOK"
-    },
-    {
-        "country": "United Kingdom",
-        "currency": "Pound Sterling",
-        "code": "GBP"
-    },
-    {
-        "country": "Georgia",
-        "currency": "Georgian Lari",
-        "code": "GEL"
-    },
-    {
-        "country": "Guernsey",
-        "currency": "Guernsey Pound",
-        "code": "GGP"
-    },
-    {
-        "country": "Ghana",
-        "currency": "Ghanaian Cedi",
-        "code": "GHS"
-    },
-    {
-        "country": "Gibraltar",
-        "currency": "Gibraltar Pound",
-        "code": "GIP"
-    },
-    {
-        "country": "The Gambia",
-        "currency": "Gambian Dalasi",
-        "code": "GMD"
-    },
-    {
-        "country": "Guinea",
-        "currency": "Guinean Franc",
-        "code": "GNF"
-    },
-    {
-        "country": "Guatemala",
-        "currency": "Guatemalan Quetzal",
-        "code": "GTQ"
-    },
-    {
-        "country": "Guyana",
-        "currency": "Guyanese Dollar",
-        "code": "GYD"
-    },
-    {
-        "country": "Hong Kong",
-        "currency": "Hong Kong Dollar",
-        "code": "HKD"
-    },
-    {
-        "country": "Honduras",
-        "currency": "Honduran Lempira",
-        "code": "HNL"
-    },
-    {
-        "country": "Croatia",
-        "currency": "Croatian Kuna",
-        "code": "HRK"
-    },
-    {
-        "country": "Haiti",
-        "currency": "Haitian Gourde",
-        "code": "HTG"
-    },
-    {
-        "country": "Hungary",
-        "currency": "Hungarian Forint",
-        "code": "HUF"
-    },
-    {
-        "country": "Indonesia",
-        "currency": "Indonesian Rupiah",
-        "code": "IDR"
-    },
-    {
-        "country": "Israel",
-        "currency": "Israeli New Shekel",
-        "code": "ILS"
-    },
-    {
-        "country": "Isle of Man",
-        "currency": "Manx Pound",
-        "code": "IMP"
-    },
-    {
-        "country": "India",
-        "currency": "Indian Rupee",
-        "code": "INR"
-    },
-    {
-        "country": "Iraq",
-        "currency": "Iraqi Dinar",
-        "code": "IQD"
-    },
-    {
-        "country": "Iran",
-        "currency": "Iranian Rial",
-        "code": "IRR"
-    },
-    {
-        "country": "Iceland",
-        "currency": "Icelandic Króna",
-        "code": "ISK"
-    },
-    {
-        "country": "Jersey",
-        "currency": "Jersey Pound",
-        "code": "JEP"
-    },
-    {
-        "country": "Jamaica",
-        "currency": "Jamaican Dollar",
-        "code": "JMD"
-    },
-    {
-        "country": "Jordan",
-        "currency": "Jordanian Dinar",
-        "code": "JOD"
-    },
-    {
-        "country": "Japan",
-        "currency": "Japanese Yen",
-        "code": "JPY"
-    },
-    {
-        "country": "Kenya",
-        "currency": "Kenyan Shilling",
-        "code": "KES"
-    },
-    {
-        "country": "Kyrgyzstan",
-        "currency": "Kyrgyzstani Som",
-        "code": "KGS"
-    },
-    {
-        "country": "Cambodia",
-        "currency": "Cambodian Riel",
-        "code": "KHR"
-    },
-    {
-        "country": "Kiribati",
-        "currency": "Kiribati Dollar",
-        "code": "KID"
-    },
-    {
-        "country": "Comoros",
-        "currency": "Comorian Franc",
-        "code": "KMF"
-    },
-    {
-        "country": "South Korea",
-        "currency": "South Korean Won",
-        "code": "KRW"
-    },
-    {
-        "country": "Kuwait",
-        "currency": "Kuwaiti Dinar",
-        "code": "KWD"
-    },
-    {
-        "country": "Cayman Islands",
-        "currency": "Cayman Islands Dollar",
-        "code": "KYD"
-    },
-    {
-        "country": "Kazakhstan",
-        "currency": "Kazakhstani Tenge",
-        "code": "KZT"
-    },
-    {
-        "country": "Laos",
-        "currency": "Lao Kip",
-        "code": "LAK"
-    },
-    {
-        "country": "Lebanon",
-        "currency": "Lebanese Pound",
-        "code": "LBP"
-    },
-    {
-        "country": "Sri Lanka",
-        "currency": "Sri Lanka Rupee",
-        "code": "LKR"
-    },
-    {
-        "country": "Liberia",
-        "currency": "Liberian Dollar",
-        "code": "LRD"
-    },
-    {
-        "country": "Lesotho",
-        "currency": "Lesotho Loti",
-        "code": "LSL"
-    },
-    {
-        "country": "Libya",
-        "currency": "Libyan Dinar",
-        "code": "LYD"
-    },
-    {
-        "country": "Morocco",
-        "currency": "Moroccan Dirham",
-        "code": "MAD"
-    },
-    {
-        "country": "Moldova",
-        "currency": "Moldovan Leu",
-        "code": "MDL"
-    },
-    {
-        "country": "Madagascar",
-        "currency": "Malagasy Ariary",
-        "code": "MGA"
-    },
-    {
-        "country": "North Macedonia",
-        "currency": "Macedonian Denar",
-        "code": "MKD"
-    },
-    {
-        "country": "Myanmar",
-        "currency": "Burmese Kyat",
-        "code": "MMK"
-    },
-    {
-        "country": "Mongolia",
-        "currency": "Mongolian Tögrög",
-        "code": "MNT"
-    },
-    {
-        "country": "Macau",
-        "currency": "Macanese Pataca",
-        "code": "MOP"
-    },
-    {
-        "country": "Mauritania",
-        "currency": "Mauritanian Ouguiya",
-        "code": "MRU"
-    },
-    {
-        "country": "Mauritius",
-        "currency": "Mauritian Rupee",
-        "code": "MUR"
-    },
-    {
-        "country": "Maldives",
-        "currency": "Maldivian Rufiyaa",
-        "code": "MVR"
-    },
-    {
-        "country": "Malawi",
-        "currency": "Malawian Kwacha",
-        "code": "MWK"
-    },
-    {
-        "country": "Mexico",
-        "currency": "Mexican Peso",
-        "code": "MXN"
-    },
-    {
-        "country": "Malaysia",
-        "currency": "Malaysian Ringgit",
-        "code": "MYR"
-    },
-    {
-        "country": "Mozambique",
-        "currency": "Mozambican Metical",
-        "code": "MZN"
-    },
-    {
-        "country": "Namibia",
-        "currency": "Namibian Dollar",
-        "code": "NAD"
-    },
-    {
-        "country": "Nigeria",
-        "currency": "Nigerian Naira",
-        "code": "NGN"
-    },
-    {
-        "country": "Nicaragua",
-        "currency": "Nicaraguan Córdoba",
-        "code": "NIO"
-    },
-    {
-        "country": "Norway",
-        "currency": "Norwegian Krone",
-        "code": "NOK"
-    },
-    {
-        "country": "Nepal",
-        "currency": "Nepalese Rupee",
-        "code": "NPR"
-    },
-    {
-        "country": "New Zealand",
-        "currency": "New Zealand Dollar",
-        "code": "NZD"
-    },
-    {
-        "country": "Oman",
-        "currency": "Omani Rial",
-        "code": "OMR"
-    },
-    {
-        "country": "Panama",
-        "currency": "Panamanian Balboa",
-        "code": "PAB"
-    },
-    {
-        "country": "Peru",
-        "currency": "Peruvian Sol",
-        "code": "PEN"
-    },
-    {
-        "country": "Papua New Guinea",
-        "currency": "Papua New Guinean Kina",
-        "code": "PGK"
-    },
-    {
-        "country": "Philippines",
-        "currency": "Philippine Peso",
-        "code": "PHP"
-    },
-    {
-        "country": "Pakistan",
-        "currency": "Pakistani Rupee",
-        "code": "PKR"
-    },
-    {
-        "country": "Poland",
-        "currency": "Polish Złoty",
-        "code": "PLN"
-    },
-    {
-        "country": "Paraguay",
-        "currency": "Paraguayan Guaraní",
-        "code": "PYG"
-    },
-    {
-        "country": "Qatar",
-        "currency": "Qatari Riyal",
-        "code": "QAR"
-    },
-    {
-        "country": "Romania",
-        "currency": "Romanian Leu",
-        "code": "RON"
-    },
-    {
-        "country": "Serbia",
-        "currency": "Serbian Dinar",
-        "code": "RSD"
-    },
-    {
-        "country": "Russia",
-        "currency": "Russian Ruble",
-        "code": "RUB"
-    },
-    {
-        "country": "Rwanda",
-        "currency": "Rwandan Franc",
-        "code": "RWF"
-    },
-    {
-        "country": "Saudi Arabia",
-        "currency": "Saudi Riyal",
-        "code": "SAR"
-    },
-    {
-        "country": "Solomon Islands",
-        "currency": "Solomon Islands Dollar",
-        "code": "SBD"
-    },
-    {
-        "country": "Seychelles",
-        "currency": "Seychellois Rupee",
-        "code": "SCR"
-    },
-    {
-        "country": "Sudan",
-        "currency": "Sudanese Pound",
-        "code": "SDG"
-    },
-    {
-        "country": "Sweden",
-        "currency": "Swedish Krona",
-        "code": "SEK"
-    },
-    {
-        "country": "Singapore",
-        "currency": "Singapore Dollar",
-        "code": "SGD"
-    },
-    {
-        "country": "Saint Helena",
-        "currency": "Saint Helena Pound",
-        "code": "SHP"
-    },
-    {
-        "country": "Sierra Leone",
-        "currency": "Sierra Leonean Leone",
-        "code": "SLE"
-    },
-    {
-        "country": "Somalia",
-        "currency": "Somali Shilling",
-        "code": "SOS"
-    },
-    {
-        "country": "Suriname",
-        "currency": "Surinamese Dollar",
-        "code": "SRD"
-    },
-    {
-        "country": "South Sudan",
-        "currency": "South Sudanese Pound",
-        "code": "SSP"
-    },
-    {
-        "country": "São Tomé and Príncipe",
-        "currency": "São Tomé and Príncipe Dobra",
-        "code": "STN"
-    },
-    {
-        "country": "Syria",
-        "currency": "Syrian Pound",
-        "code": "SYP"
-    },
-    {
-        "country": "Eswatini",
-        "currency": "Eswatini Lilangeni",
-        "code": "SZL"
-    },
-    {
-        "country": "Thailand",
-        "currency": "Thai Baht",
-        "code": "THB"
-    },
-    {
-        "country": "Tajikistan",
-        "currency": "Tajikistani Somoni",
-        "code": "TJS"
-    },
-    {
-        "country": "Turkmenistan",
-        "currency": "Turkmenistan Manat",
-        "code": "TMT"
-    },
-    {
-        "country": "Tunisia",
-        "currency": "Tunisian Dinar",
-        "code": "TND"
-    },
-    {
-        "country": "Tonga",
-        "currency": "Tongan Paʻanga",
-        "code": "TOP"
-    },
-    {
-        "country": "Turkey",
-        "currency": "Turkish Lira",
-        "code": "TRY"
-    },
-    {
-        "country": "Trinidad and Tobago",
-        "currency": "Trinidad and Tobago Dollar",
-        "code": "TTD"
-    },
-    {
-        "country": "Tuvalu",
-        "currency": "Tuvaluan Dollar",
-        "code": "TVD"
-    },
-    {
-        "country": "Taiwan",
-        "currency": "New Taiwan Dollar",
-        "code": "TWD"
-    },
-    {
-        "country": "Tanzania",
-        "currency": "Tanzanian Shilling",
-        "code": "TZS"
-    },
-    {
-        "country": "Ukraine",
-        "currency": "Ukrainian Hryvnia",
-        "code": "UAH"
-    },
-    {
-        "country": "Uganda",
-        "currency": "Ugandan Shilling",
-        "code": "UGX"
-    },
-    {
-        "country": "United States",
-        "currency": "United States Dollar",
-        "code": "USD"
-    },
-    {
-        "country": "Uruguay",
-        "currency": "Uruguayan Peso",
-        "code": "UYU"
-    },
-    {
-        "country": "Uzbekistan",
-        "currency": "Uzbekistani So'm",
-        "code": "UZS"
-    },
-    {
-        "country": "Venezuela",
-        "currency": "Venezuelan Bolívar Soberano",
-        "code": "VES"
-    },
-    {
-        "country": "Vietnam",
-        "currency": "Vietnamese Đồng",
-        "code": "VND"
-    },
-    {
-        "country": "Vanuatu",
-        "currency": "Vanuatu Vatu",
-        "code": "VUV"
-    },
-    {
-        "country": "Samoa",
-        "currency": "Samoan Tālā",
-        "code": "WST"
-    },
-    {
-        "country": "CEMAC",
-        "currency": "Central African CFA Franc",
-        "code": "XAF"
-    },
-    {
-        "country": "Organisation of Eastern Caribbean States",
-        "currency": "East Caribbean Dollar",
-        "code": "XCD"
-    },
-    {
-        "country": "International Monetary Fund",
-        "currency": "Special Drawing Rights",
-        "code": "XDR"
-    },
-    {
-        "country": "CFA",
-        "currency": "West African CFA franc",
-        "code": "XOF"
-    },
-    {
-        "country": "Collectivités d'Outre-Mer",
-        "currency": "CFP Franc",
-        "code": "XPF"
-    },
-    {
-        "country": "Yemen",
-        "currency": "Yemeni Rial",
-        "code": "YER"
-    },
-    {
-        "country": "South Africa",
-        "currency": "South African Rand",
-        "code": "ZAR"
-    },
-    {
-        "country": "Zambia",
-        "currency": "Zambian Kwacha",
-        "code": "ZMW"
-    },
-    {
-        "country": "Zimbabwe",
-        "currency": "Zimbabwean Dollar",
-        "code": "ZWL"
-    }
-]
-
-print(f"ISO_3166_CODES: {len(ISO_3166_CODES)}")
-print(f"ISO_4217_CODES: {len(ISO_4217_CODES)}")
-
-# Create a mapping from country names to ISO 3166 codes
-iso_3166_country_to_code = {}
-for entry in ISO_3166_CODES:
-    for code, country in entry.items():
-        iso_3166_country_to_code[country] = code
+# ISO 3166-1 Alpha-3 codes as (code, country) rows. ISO_3166_CODES, the
+# historical list of single-entry dicts, is built from these on first use.
+_ISO_3166 = (
+    ("ABW", "Aruba"),
+    ("AFG", "Afghanistan"),
+    ("AGO", "Angola"),
+    ("AIA", "Anguilla"),
+    ("ALA", "Åland Islands"),
+    ("ALB", "Albania"),
+    ("AND", "Andorra"),
+    ("ARE", "United Arab Emirates"),
+    ("ARG", "Argentina"),
+    ("ARM", "Armenia"),
+    ("ASM", "American Samoa"),
+    ("ATA", "Antarctica"),
+    ("ATF", "French Southern Territories"),
+    ("ATG", "Antigua and Barbuda"),
+    ("AUS", "Australia"),
+    ("AUT", "Austria"),
+    ("AZE", "Azerbaijan"),
+    ("BDI", "Burundi"),
+    ("BEL", "Belgium"),
+    ("BEN", "Benin"),
+    ("BES", "Bonaire, Sint Eustatius and Saba"),
+    ("BFA", "Burkina Faso"),
+    ("BGD", "Bangladesh"),
+    ("BGR", "Bulgaria"),
+    ("BHR", "Bahrain"),
+    ("BHS", "Bahamas"),
+    ("BIH", "Bosnia and Herzegovina"),
+    ("BLM", "Saint Barthélemy"),
+    ("BLR", "Belarus"),
+    ("BLZ", "Belize"),
+    ("BMU", "Bermuda"),
+    ("BOL", "Bolivia, Plurinational State of"),
+    ("BRA", "Brazil"),
+    ("BRB", "Barbados"),
+    ("BRN", "Brunei Darussalam"),
+    ("BTN", "Bhutan"),
+    ("BVT", "Bouvet Island"),
+    ("BWA", "Botswana"),
+    ("CAF", "Central African Republic"),
+    ("CAN", "Canada"),
+    ("CCK", "Cocos (Keeling) Islands"),
+    ("CHE", "Switzerland"),
+    ("CHL", "Chile"),
+    ("CHN", "China"),
+    ("CIV", "Côte d'Ivoire"),
+    ("CMR", "Cameroon"),
+    ("COD", "Congo, Democratic Republic of the"),
+    ("COG", "Congo"),
+    ("COK", "Cook Islands"),
+    ("COL", "Colombia"),
+    ("COM", "Comoros"),
+    ("CPV", "Cabo Verde"),
+    ("CRI", "Costa Rica"),
+    ("CUB", "Cuba"),
+    ("CUW", "Curaçao"),
+    ("CXR", "Christmas Island"),
+    ("CYM", "Cayman Islands"),
+    ("CYP", "Cyprus"),
+    ("CZE", "Czechia"),
+    ("DEU", "Germany"),
+    ("DJI", "Djibouti"),
+    ("DMA", "Dominica"),
+    ("DNK", "Denmark"),
+    ("DOM", "Dominican Republic"),
+    ("DZA", "Algeria"),
+    ("ECU", "Ecuador"),
+    ("EGY", "Egypt"),
+    ("ERI", "Eritrea"),
+    ("ESH", "Western Sahara"),
+    ("ESP", "Spain"),
+    ("EST", "Estonia"),
+    ("ETH", "Ethiopia"),
+    ("FIN", "Finland"),
+    ("FJI", "Fiji"),
+    ("FLK", "Falkland Islands (Malvinas)"),
+    ("FRA", "France"),
+    ("FRO", "Faroe Islands"),
+    ("FSM", "Micronesia, Federated States of"),
+    ("GAB", "Gabon"),
+    ("GBR", "United Kingdom of Great Britain and Northern Ireland"),
+    ("GEO", "Georgia"),
+    ("GGY", "Guernsey"),
+    ("GHA", "Ghana"),
+    ("GIB", "Gibraltar"),
+    ("GIN", "Guinea"),
+    ("GLP", "Guadeloupe"),
+    ("GMB", "Gambia"),
+    ("GNB", "Guinea-Bissau"),
+    ("GNQ", "Equatorial Guinea"),
+    ("GRC", "Greece"),
+    ("GRD", "Grenada"),
+    ("GRL", "Greenland"),
+    ("GTM", "Guatemala"),
+    ("GUF", "French Guiana"),
+    ("GUM", "Guam"),
+    ("GUY", "Guyana"),
+    ("HKG", "Hong Kong"),
+    ("HMD", "Heard Island and McDonald Islands"),
+    ("HND", "Honduras"),
+    ("HRV", "Croatia"),
+    ("HTI", "Haiti"),
+    ("HUN", "Hungary"),
+    ("IDN", "Indonesia"),
+    ("IMN", "Isle of Man"),
+    ("IND", "India"),
+    ("IOT", "British Indian Ocean Territory"),
+    ("IRL", "Ireland"),
+    ("IRN", "Iran, Islamic Republic of"),
+    ("IRQ", "Iraq"),
+    ("ISL", "Iceland"),
+    ("ISR", "Israel"),
+    ("ITA", "Italy"),
+    ("JAM", "Jamaica"),
+    ("JEY", "Jersey"),
+    ("JOR", "Jordan"),
+    ("JPN", "Japan"),
+    ("KAZ", "Kazakhstan"),
+    ("KEN", "Kenya"),
+    ("KGZ", "Kyrgyzstan"),
+    ("KHM", "Cambodia"),
+    ("KIR", "Kiribati"),
+    ("KNA", "Saint Kitts and Nevis"),
+    ("KOR", "Korea, Republic of"),
+    ("KWT", "Kuwait"),
+    ("LAO", "Lao People's Democratic Republic"),
+    ("LBN", "Lebanon"),
+    ("LBR", "Liberia"),
+    ("LBY", "Libya"),
+    ("LCA", "Saint Lucia"),
+    ("LIE", "Liechtenstein"),
+    ("LKA", "Sri Lanka"),
+    ("LSO", "Lesotho"),
+    ("LTU", "Lithuania"),
+    ("LUX", "Luxembourg"),
+    ("LVA", "Latvia"),
+    ("MAC", "Macao"),
+    ("MAF", "Saint Martin (French part)"),
+    ("MAR", "Morocco"),
+    ("MCO", "Monaco"),
+    ("MDA", "Moldova, Republic of"),
+    ("MDG", "Madagascar"),
+    ("MDV", "Maldives"),
+    ("MEX", "Mexico"),
+    ("MHL", "Marshall Islands"),
+    ("MKD", "North Macedonia"),
+    ("MLI", "Mali"),
+    ("MLT", "Malta"),
+    ("MMR", "Myanmar"),
+    ("MNE", "Montenegro"),
+    ("MNG", "Mongolia"),
+    ("MNP", "Northern Mariana Islands"),
+    ("MOZ", "Mozambique"),
+    ("MRT", "Mauritania"),
+    ("MSR", "Montserrat"),
+    ("MTQ", "Martinique"),
+    ("MUS", "Mauritius"),
+    ("MWI", "Malawi"),
+    ("MYS", "Malaysia"),
+    ("MYT", "Mayotte"),
+    ("NAM", "Namibia"),
+    ("NCL", "New Caledonia"),
+    ("NER", "Niger"),
+    ("NFK", "Norfolk Island"),
+    ("NGA", "Nigeria"),
+    ("NIC", "Nicaragua"),
+    ("NIU", "Niue"),
+    ("NLD", "Netherlands, Kingdom of the"),
+    ("NOR", "Norway"),
+    ("NPL", "Nepal"),
+    ("NRU", "Nauru"),
+    ("NZL", "New Zealand"),
+    ("OMN", "Oman"),
+    ("PAK", "Pakistan"),
+    ("PAN", "Panama"),
+    ("PCN", "Pitcairn"),
+    ("PER", "Peru"),
+    ("PHL", "Philippines"),
+    ("PLW", "Palau"),
+    ("PNG", "Papua New Guinea"),
+    ("POL", "Poland"),
+    ("PRI", "Puerto Rico"),
+    ("PRK", "Korea, Democratic People's Republic of"),
+    ("PRT", "Portugal"),
+    ("PRY", "Paraguay"),
+    ("PSE", "Palestine, State of"),
+    ("PYF", "French Polynesia"),
+    ("QAT", "Qatar"),
+    ("REU", "Réunion"),
+    ("ROU", "Romania"),
+    ("RUS", "Russian Federation"),
+    ("RWA", "Rwanda"),
+    ("SAU", "Saudi Arabia"),
+    ("SDN", "Sudan"),
+    ("SEN", "Senegal"),
+    ("SGP", "Singapore"),
+    ("SGS", "South Georgia and the South Sandwich Islands"),
+    ("SHN", "Saint Helena, Ascension and Tristan da Cunha"),
+    ("SJM", "Svalbard and Jan Mayen"),
+    ("SLB", "Solomon Islands"),
+    ("SLE", "Sierra Leone"),
+    ("SLV", "El Salvador"),
+    ("SMR", "San Marino"),
+    ("SOM", "Somalia"),
+    ("SPM", "Saint Pierre and Miquelon"),
+    ("SRB", "Serbia"),
+    ("SSD", "South Sudan"),
+    ("STP", "Sao Tome and Principe"),
+    ("SUR", "Suriname"),
+    ("SVK", "Slovakia"),
+    ("SVN", "Slovenia"),
+    ("SWE", "Sweden"),
+    ("SWZ", "Eswatini"),
+    ("SXM", "Sint Maarten (Dutch part)"),
+    ("SYC", "Seychelles"),
+    ("SYR", "Syrian Arab Republic"),
+    ("TCA", "Turks and Caicos Islands"),
+    ("TCD", "Chad"),
+    ("TGO", "Togo"),
+    ("THA", "Thailand"),
+    ("TJK", "Tajikistan"),
+    ("TKL", "Tokelau"),
+    ("TKM", "Turkmenistan"),
+    ("TLS", "Timor-Leste"),
+    ("TON", "Tonga"),
+    ("TTO", "Trinidad and Tobago"),
+    ("TUN", "Tunisia"),
+    ("TUR", "Türkiye"),
+    ("TUV", "Tuvalu"),
+    ("TWN", "Taiwan, Province of China"),
+    ("TZA", "Tanzania, United Republic of"),
+    ("UGA", "Uganda"),
+    ("UKR", "Ukraine"),
+    ("UMI", "United States Minor Outlying Islands"),
+    ("URY", "Uruguay"),
+    ("USA", "United States of America"),
+    ("UZB", "Uzbekistan"),
+    ("VAT", "Holy See"),
+    ("VCT", "Saint Vincent and the Grenadines"),
+    ("VEN", "Venezuela, Bolivarian Republic of"),
+    ("VGB", "Virgin Islands (British)"),
+    ("VIR", "Virgin Islands (U.S.)"),
+    ("VNM", "Viet Nam"),
+    ("VUT", "Vanuatu"),
+    ("WLF", "Wallis and Futuna"),
+    ("WSM", "Samoa"),
+    ("YEM", "Yemen"),
+    ("ZAF", "South Africa"),
+    ("ZMB", "Zambia"),
+    ("ZWE", "Zimbabwe"),
+)
+
+
+# ISO 4217 currencies as (country, currency, code) rows. Lookup tables are
+# built straight from these tuples; ISO_4217_CODES, the list-of-dicts view,
+# is materialised only when something asks for it.
+_ISO_4217_KEYS = ("country", "currency", "code")
+
+_ISO_4217 = (
+    ("United Arab Emirates", "UAE Dirham", "AED"),
+    ("Afghanistan", "Afghan Afghani", "AFN"),
+    ("Albania", "Albanian Lek", "ALL"),
+    ("Armenia", "Armenian Dram", "AMD"),
+    ("Netherlands Antilles", "Netherlands Antillian Guilder", "ANG"),
+    ("Angola", "Angolan Kwanza", "AOA"),
+    ("Argentina", "Argentine Peso", "ARS"),
+    ("Australia", "Australian Dollar", "AUD"),
+    ("Aruba", "Aruban Florin", "AWG"),
+    ("Azerbaijan", "Azerbaijani Manat", "AZN"),
+    ("Bosnia and Herzegovina", "Bosnia and Herzegovina Mark", "BAM"),
+    ("Barbados", "Barbados Dollar", "BBD"),
+    ("Bangladesh", "Bangladeshi Taka", "BDT"),
+    ("Bulgaria", "Bulgarian Lev", "BGN"),
+    ("Bahrain", "Bahraini Dinar", "BHD"),
+    ("Burundi", "Burundian Franc", "BIF"),
+    ("Bermuda", "Bermudian Dollar", "BMD"),
+    ("Brunei", "Brunei Dollar", "BND"),
+    ("Bolivia", "Bolivian Boliviano", "BOB"),
+    ("Brazil", "Brazilian Real", "BRL"),
+    ("Bahamas", "Bahamian Dollar", "BSD"),
+    ("Bhutan", "Bhutanese Ngultrum", "BTN"),
+    ("Botswana", "Botswana Pula", "BWP"),
+    ("Belarus", "Belarusian Ruble", "BYN"),
+    ("Belize", "Belize Dollar", "BZD"),
+    ("Canada", "Canadian Dollar", "CAD"),
+    ("Democratic Republic of the Congo", "Congolese Franc", "CDF"),
+    ("Switzerland", "Swiss Franc", "CHF"),
+    ("Chile", "Chilean Peso", "CLP"),
+    ("China", "Chinese Renminbi", "CNY"),
+    ("Colombia", "Colombian Peso", "COP"),
+    ("Costa Rica", "Costa Rican Colon", "CRC"),
+    ("Cuba", "Cuban Peso", "CUP"),
+    ("Cape Verde", "Cape Verdean Escudo", "CVE"),
+    ("Czech Republic", "Czech Koruna", "CZK"),
+    ("Djibouti", "Djiboutian Franc", "DJF"),
+    ("Denmark", "Danish Krone", "DKK"),
+    ("Dominican Republic", "Dominican Peso", "DOP"),
+    ("Algeria", "Algerian Dinar", "DZD"),
+    ("Egypt", "Egyptian Pound", "EGP"),
+    ("Eritrea", "Eritrean Nakfa", "ERN"),
+    ("Ethiopia", "Ethiopian Birr", "ETB"),
+    ("European Union", "Euro", "EUR"),
+    ("Fiji", "Fiji Dollar", "FJD"),
+    ("Falkland Islands", "Falkland Islands Pound", "FKP"),
+    ("Faroe Islands", "Faroese Króna", "FOK"),
+    ("United Kingdom", "Pound Sterling", "GBP"),
+    ("Georgia", "Georgian Lari", "GEL"),
+    ("Guernsey", "Guernsey Pound", "GGP"),
+    ("Ghana", "Ghanaian Cedi", "GHS"),
+    ("Gibraltar", "Gibraltar Pound", "GIP"),
+    ("The Gambia", "Gambian Dalasi", "GMD"),
+    ("Guinea", "Guinean Franc", "GNF"),
+    ("Guatemala", "Guatemalan Quetzal", "GTQ"),
+    ("Guyana", "Guyanese Dollar", "GYD"),
+    ("Hong Kong", "Hong Kong Dollar", "HKD"),
+    ("Honduras", "Honduran Lempira", "HNL"),
+    ("Croatia", "Croatian Kuna", "HRK"),
+    ("Haiti", "Haitian Gourde", "HTG"),
+    ("Hungary", "Hungarian Forint", "HUF"),
+    ("Indonesia", "Indonesian Rupiah", "IDR"),
+    ("Israel", "Israeli New Shekel", "ILS"),
+    ("Isle of Man", "Manx Pound", "IMP"),
+    ("India", "Indian Rupee", "INR"),
+    ("Iraq", "Iraqi Dinar", "IQD"),
+    ("Iran", "Iranian Rial", "IRR"),
+    ("Iceland", "Icelandic Króna", "ISK"),
+    ("Jersey", "Jersey Pound", "JEP"),
+    ("Jamaica", "Jamaican Dollar", "JMD"),
+    ("Jordan", "Jordanian Dinar", "JOD"),
+    ("Japan", "Japanese Yen", "JPY"),
+    ("Kenya", "Kenyan Shilling", "KES"),
+    ("Kyrgyzstan", "Kyrgyzstani Som", "KGS"),
+    ("Cambodia", "Cambodian Riel", "KHR"),
+    ("Kiribati", "Kiribati Dollar", "KID"),
+    ("Comoros", "Comorian Franc", "KMF"),
+    ("South Korea", "South Korean Won", "KRW"),
+    ("Kuwait", "Kuwaiti Dinar", "KWD"),
+    ("Cayman Islands", "Cayman Islands Dollar", "KYD"),
+    ("Kazakhstan", "Kazakhstani Tenge", "KZT"),
+    ("Laos", "Lao Kip", "LAK"),
+    ("Lebanon", "Lebanese Pound", "LBP"),
+    ("Sri Lanka", "Sri Lanka Rupee", "LKR"),
+    ("Liberia", "Liberian Dollar", "LRD"),
+    ("Lesotho", "Lesotho Loti", "LSL"),
+    ("Libya", "Libyan Dinar", "LYD"),
+    ("Morocco", "Moroccan Dirham", "MAD"),
+    ("Moldova", "Moldovan Leu", "MDL"),
+    ("Madagascar", "Malagasy Ariary", "MGA"),
+    ("North Macedonia", "Macedonian Denar", "MKD"),
+    ("Myanmar", "Burmese Kyat", "MMK"),
+    ("Mongolia", "Mongolian Tögrög", "MNT"),
+    ("Macau", "Macanese Pataca", "MOP"),
+    ("Mauritania", "Mauritanian Ouguiya", "MRU"),
+    ("Mauritius", "Mauritian Rupee", "MUR"),
+    ("Maldives", "Maldivian Rufiyaa", "MVR"),
+    ("Malawi", "Malawian Kwacha", "MWK"),
+    ("Mexico", "Mexican Peso", "MXN"),
+    ("Malaysia", "Malaysian Ringgit", "MYR"),
+    ("Mozambique", "Mozambican Metical", "MZN"),
+    ("Namibia", "Namibian Dollar", "NAD"),
+    ("Nigeria", "Nigerian Naira", "NGN"),
+    ("Nicaragua", "Nicaraguan Córdoba", "NIO"),
+    ("Norway", "Norwegian Krone", "NOK"),
+    ("Nepal", "Nepalese Rupee", "NPR"),
+    ("New Zealand", "New Zealand Dollar", "NZD"),
+    ("Oman", "Omani Rial", "OMR"),
+    ("Panama", "Panamanian Balboa", "PAB"),
+    ("Peru", "Peruvian Sol", "PEN"),
+    ("Papua New Guinea", "Papua New Guinean Kina", "PGK"),
+    ("Philippines", "Philippine Peso", "PHP"),
+    ("Pakistan", "Pakistani Rupee", "PKR"),
+    ("Poland", "Polish Złoty", "PLN"),
+    ("Paraguay", "Paraguayan Guaraní", "PYG"),
+    ("Qatar", "Qatari Riyal", "QAR"),
+    ("Romania", "Romanian Leu", "RON"),
+    ("Serbia", "Serbian Dinar", "RSD"),
+    ("Russia", "Russian Ruble", "RUB"),
+    ("Rwanda", "Rwandan Franc", "RWF"),
+    ("Saudi Arabia", "Saudi Riyal", "SAR"),
+    ("Solomon Islands", "Solomon Islands Dollar", "SBD"),
+    ("Seychelles", "Seychellois Rupee", "SCR"),
+    ("Sudan", "Sudanese Pound", "SDG"),
+    ("Sweden", "Swedish Krona", "SEK"),
+    ("Singapore", "Singapore Dollar", "SGD"),
+    ("Saint Helena", "Saint Helena Pound", "SHP"),
+    ("Sierra Leone", "Sierra Leonean Leone", "SLE"),
+    ("Somalia", "Somali Shilling", "SOS"),
+    ("Suriname", "Surinamese Dollar", "SRD"),
+    ("South Sudan", "South Sudanese Pound", "SSP"),
+    ("São Tomé and Príncipe", "São Tomé and Príncipe Dobra", "STN"),
+    ("Syria", "Syrian Pound", "SYP"),
+    ("Eswatini", "Eswatini Lilangeni", "SZL"),
+    ("Thailand", "Thai Baht", "THB"),
+    ("Tajikistan", "Tajikistani Somoni", "TJS"),
+    ("Turkmenistan", "Turkmenistan Manat", "TMT"),
+    ("Tunisia", "Tunisian Dinar", "TND"),
+    ("Tonga", "Tongan Paʻanga", "TOP"),
+    ("Turkey", "Turkish Lira", "TRY"),
+    ("Trinidad and Tobago", "Trinidad and Tobago Dollar", "TTD"),
+    ("Tuvalu", "Tuvaluan Dollar", "TVD"),
+    ("Taiwan", "New Taiwan Dollar", "TWD"),
+    ("Tanzania", "Tanzanian Shilling", "TZS"),
+    ("Ukraine", "Ukrainian Hryvnia", "UAH"),
+    ("Uganda", "Ugandan Shilling", "UGX"),
+    ("United States", "United States Dollar", "USD"),
+    ("Uruguay", "Uruguayan Peso", "UYU"),
+    ("Uzbekistan", "Uzbekistani So'm", "UZS"),
+    ("Venezuela", "Venezuelan Bolívar Soberano", "VES"),
+    ("Vietnam", "Vietnamese Đồng", "VND"),
+    ("Vanuatu", "Vanuatu Vatu", "VUV"),
+    ("Samoa", "Samoan Tālā", "WST"),
+    ("CEMAC", "Central African CFA Franc", "XAF"),
+    ("Organisation of Eastern Caribbean States", "East Caribbean Dollar", "XCD"),
+    ("International Monetary Fund", "Special Drawing Rights", "XDR"),
+    ("CFA", "West African CFA franc", "XOF"),
+    ("Collectivités d'Outre-Mer", "CFP Franc", "XPF"),
+    ("Yemen", "Yemeni Rial", "YER"),
+    ("South Africa", "South African Rand", "ZAR"),
+    ("Zambia", "Zambian Kwacha", "ZMW"),
+    ("Zimbabwe", "Zimbabwean Dollar", "ZWL"),
+)
 
 # Create country name mapping for better matching
 country_name_mappings = {
-    # ISO 4217 name -> ISO 3166 name
-    "United Arab Emirates": "United Arab Emirates",
-    "Afghanistan": "Afghanistan",
-    "Albania": "Albania",
-    "Armenia": "Armenia",
-    "Angola": "Angola",
-    "Argentina": "Argentina",
-    "Australia": "Australia",
-    "Aruba": "Aruba",
-    "Azerbaijan": "Azerbaijan",
-    "Bosnia and Herzegovina": "Bosnia and Herzegovina",
-    "Barbados": "Barbados",
-    "Bangladesh": "Bangladesh",
-    "Bulgaria": "Bulgaria",
-    "Bahrain": "Bahrain",
-    "Burundi": "Burundi",
-    "Bermuda": "Bermuda",
+    # ISO 4217 name -> ISO 3166 name, only where the two differ. Identical
+    # names are matched directly against the ISO 3166 table.
     "Brunei": "Brunei Darussalam",
     "Bolivia": "Bolivia, Plurinational State of",
-    "Brazil": "Brazil",
-    "Bahamas": "Bahamas",
-    "Bhutan": "Bhutan",
-    "Botswana": "Botswana",
-    "Belarus": "Belarus",
-    "Belize": "Belize",
-    "Canada": "Canada",
     "Democratic Republic of the Congo": "Congo, Democratic Republic of the",
-    "Switzerland": "Switzerland",
-    "Chile": "Chile",
-    "China": "China",
-    "Colombia": "Colombia",
-    "Costa Rica": "Costa Rica",
-    "Cuba": "Cuba",
     "Cape Verde": "Cabo Verde",
     "Czech Republic": "Czechia",
-    "Djibouti": "Djibouti",
-    "Denmark": "Denmark",
-    "Dominican Republic": "Dominican Republic",
-    "Algeria": "Algeria",
-    "Egypt": "Egypt",
-    "Eritrea": "Eritrea",
-    "Ethiopia": "Ethiopia",
-    "Fiji": "Fiji",
     "Falkland Islands": "Falkland Islands (Malvinas)",
-    "Faroe Islands": "Faroe Islands",
     "United Kingdom": "United Kingdom of Great Britain and Northern Ireland",
-    "Georgia": "Georgia",
-    "Guernsey": "Guernsey",
-    "Ghana": "Ghana",
-    "Gibraltar": "Gibraltar",
     "The Gambia": "Gambia",
-    "Guinea": "Guinea",
-    "Guatemala": "Guatemala",
-    "Guyana": "Guyana",
-    "Hong Kong": "Hong Kong",
-    "Honduras": "Honduras",
-    "Croatia": "Croatia",
-    "Haiti": "Haiti",
-    "Hungary": "Hungary",
-    "Indonesia": "Indonesia",
-    "Israel": "Israel",
-    "Isle of Man": "Isle of Man",
-    "India": "India",
-    "Iraq": "Iraq",
     "Iran": "Iran, Islamic Republic of",
-    "Iceland": "Iceland",
-    "Jersey": "Jersey",
-    "Jamaica": "Jamaica",
-    "Jordan": "Jordan",
-    "Japan": "Japan",
-    "Kenya": "Kenya",
-    "Kyrgyzstan": "Kyrgyzstan",
-    "Cambodia": "Cambodia",
-    "Kiribati": "Kiribati",
-    "Comoros": "Comoros",
     "South Korea": "Korea, Republic of",
-    "Kuwait": "Kuwait",
-    "Cayman Islands": "Cayman Islands",
-    "Kazakhstan": "Kazakhstan",
     "Laos": "Lao People's Democratic Republic",
-    "Lebanon": "Lebanon",
-    "Sri Lanka": "Sri Lanka",
-    "Liberia": "Liberia",
-    "Lesotho": "Lesotho",
-    "Libya": "Libya",
-    "Morocco": "Morocco",
     "Moldova": "Moldova, Republic of",
-    "Madagascar": "Madagascar",
-    "North Macedonia": "North Macedonia",
-    "Myanmar": "Myanmar",
-    "Mongolia": "Mongolia",
     "Macau": "Macao",
-    "Mauritania": "Mauritania",
-    "Mauritius": "Mauritius",
-    "Maldives": "Maldives",
-    "Malawi": "Malawi",
-    "Mexico": "Mexico",
-    "Malaysia": "Malaysia",
-    "Mozambique": "Mozambique",
-    "Namibia": "Namibia",
-    "Nigeria": "Nigeria",
-    "Nicaragua": "Nicaragua",
-    "Norway": "Norway",
-    "Nepal": "Nepal",
-    "New Zealand": "New Zealand",
-    "Oman": "Oman",
-    "Panama": "Panama",
-    "Peru": "Peru",
-    "Papua New Guinea": "Papua New Guinea",
-    "Philippines": "Philippines",
-    "Pakistan": "Pakistan",
-    "Poland": "Poland",
-    "Paraguay": "Paraguay",
-    "Qatar": "Qatar",
-    "Romania": "Romania",
-    "Serbia": "Serbia",
     "Russia": "Russian Federation",
-    "Rwanda": "Rwanda",
-    "Saudi Arabia": "Saudi Arabia",
-    "Solomon Islands": "Solomon Islands",
-    "Seychelles": "Seychelles",
-    "Sudan": "Sudan",
-    "Sweden": "Sweden",
-    "Singapore": "Singapore",
     "Saint Helena": "Saint Helena, Ascension and Tristan da Cunha",
-    "Sierra Leone": "Sierra Leone",
-    "Somalia": "Somalia",
-    "Suriname": "Suriname",
-    "South Sudan": "South Sudan",
     "São Tomé and Príncipe": "Sao Tome and Principe",
     "Syria": "Syrian Arab Republic",
-    "Eswatini": "Eswatini",
-    "Thailand": "Thailand",
-    "Tajikistan": "Tajikistan",
-    "Turkmenistan": "Turkmenistan",
-    "Tunisia": "Tunisia",
-    "Tonga": "Tonga",
     "Turkey": "Türkiye",
-    "Trinidad and Tobago": "Trinidad and Tobago",
-    "Tuvalu": "Tuvalu",
     "Taiwan": "Taiwan, Province of China",
     "Tanzania": "Tanzania, United Republic of",
-    "Ukraine": "Ukraine",
-    "Uganda": "Uganda",
     "United States": "United States of America",
-    "Uruguay": "Uruguay",
-    "Uzbekistan": "Uzbekistan",
     "Venezuela": "Venezuela, Bolivarian Republic of",
-    "Vietnam": "Viet Nam",
-    "Vanuatu": "Vanuatu",
-    "Samoa": "Samoa",
-    "Yemen": "Yemen",
-    "South Africa": "South Africa",
-    "Zambia": "Zambia",
-    "Zimbabwe": "Zimbabwe"
+    "Vietnam": "Viet Nam"
 }
 
-def find_iso_3166_code(country_name):
-    """Find the ISO 3166 code for a given country name from ISO 4217"""
+# Intern the names so lookups against the other tables can match on identity
+country_name_mappings = MappingProxyType({
+    sys.intern(k): sys.intern(v) for k, v in country_name_mappings.items()
+})
+
+# The lookup indexes below are derived from the literals above. They are built
+# on first use rather than at import, so callers that only need a bloc or a
+# raw code table don't pay for them. The old module-level names are still
+# available through the module __getattr__ at the bottom of this file.
+
+@functools.cache
+def _iso_3166_country_to_code():
+    """Mapping from ISO 3166 country names to their Alpha-3 codes"""
+    return MappingProxyType({
+        sys.intern(country): sys.intern(code) for code, country in _ISO_3166
+    })
+
+def _resolve_iso_3166_code(country_name):
+    """Resolve a country name to its ISO 3166 code via the name mappings"""
+    iso_3166_country_to_code = _iso_3166_country_to_code()
+
     # First try direct mapping
     if country_name in country_name_mappings:
         mapped_name = country_name_mappings[country_name]
@@ -1368,114 +637,221 @@ def find_iso_3166_code(country_name):
     
     return None
 
-# Create combined list based on ISO 4217 with ISO 3166 codes
-combined_iso_codes = []
-unmatched_countries = []
+@functools.cache
+def _iso_4217_country_to_code():
+    """ISO 4217 country names composed with the name mappings and ISO 3166 codes"""
+    return MappingProxyType({
+        sys.intern(country): _resolve_iso_3166_code(country)
+        for country, _currency, _code in _ISO_4217
+    })
 
-for entry in ISO_4217_CODES:
-    country_name = entry["country"]
-    iso_3166_code = find_iso_3166_code(country_name)
-    
-    if iso_3166_code:
-        # Create combined entry with ISO 3166 code
-        combined_entry = {
-            "country": country_name,
-            "currency": entry["currency"],
-            "currency_code": entry["code"],
-            "country_code": iso_3166_code
-        }
-        combined_iso_codes.append(combined_entry)
-    else:
-        # Add to unmatched list
-        unmatched_countries.append(country_name)
-
-# Print results
-# print(f"\nCombined ISO codes (4217 + 3166): {len(combined_iso_codes)} entries")
-# print(f"Unmatched countries from ISO 4217: {len(unmatched_countries)} entries")
-# 
-# print("\n=== COMBINED ISO CODES (First 10 entries) ===")
-# for i, entry in enumerate(combined_iso_codes[:10]):
-#     print(f"{i+1:2d}. {entry['country']} ({entry['country_code']}) - {entry['currency']} ({entry['currency_code']})")
-# 
-# print(f"\n... and {len(combined_iso_codes) - 10} more entries")
-# 
-# print("\n=== UNMATCHED COUNTRIES FROM ISO 4217 ===")
-# print("Countries in ISO 4217 that don't have matches in ISO 3166:")
-# for i, country in enumerate(unmatched_countries, 1):
-#     print(f"{i:2d}. {country}")
-# 
-# # Print some statistics
-# print(f"\n=== STATISTICS ===")
-# print(f"Total ISO 3166 codes: {len(ISO_3166_CODES)}")
-# print(f"Total ISO 4217 codes: {len(ISO_4217_CODES)}")
-# print(f"Successfully matched: {len(combined_iso_codes)}")
-# print(f"Unmatched: {len(unmatched_countries)}")
-# print(f"Match rate: {len(combined_iso_codes)/len(ISO_4217_CODES)*100:.1f}%")
+@functools.lru_cache(maxsize=256)
+def find_iso_3166_code(country_name):
+    """Find the ISO 3166 code for a given country name from ISO 4217
+
+    Results are memoized; the tables behind them are read-only, so the cache
+    only needs clearing if the module is reloaded.
+    """
+    try:
+        return _iso_4217_country_to_code()[country_name]
+    except KeyError:
+        # Not an ISO 4217 country name; resolve it the long way
+        return _resolve_iso_3166_code(country_name)
+
+class IsoEntry(NamedTuple):
+    """An ISO 4217 currency joined to its country's ISO 3166 code"""
+    country: str
+    currency: str
+    currency_code: str
+    country_code: str
+
+@functools.cache
+def _combined_indexes():
+    """Combine ISO 4217 entries with ISO 3166 codes in a single pass.
+
+    Returns (combined, unmatched, by_country_code, by_currency_code); both
+    indexes hold the same entry objects as the combined tuple.
+    """
+    combined_iso_codes = []
+    unmatched_countries = []
+    country_codes = []
+    currency_codes = []
+
+    for country_name, currency, currency_code in _ISO_4217:
+        country_name = sys.intern(country_name)
+        iso_3166_code = find_iso_3166_code(country_name)
+        
+        if iso_3166_code:
+            currency_code = sys.intern(currency_code)
+            # Create combined entry with ISO 3166 code
+            combined_entry = IsoEntry(country_name, currency, currency_code, iso_3166_code)
+            combined_iso_codes.append(combined_entry)
+            country_codes.append(iso_3166_code)
+            currency_codes.append(currency_code)
+        else:
+            # Add to unmatched list
+            unmatched_countries.append(country_name)
+
+    # Both indexes share the entry objects; dict(zip()) sizes each table once
+    # from the known key count instead of growing it entry by entry
+    return (
+        tuple(combined_iso_codes),
+        tuple(unmatched_countries),
+        MappingProxyType(dict(zip(country_codes, combined_iso_codes))),
+        MappingProxyType(dict(zip(currency_codes, combined_iso_codes))),
+    )
+
+def _country_to_currency():
+    return _combined_indexes()[2]
+
+def _currency_to_country():
+    return _combined_indexes()[3]
 
 # Export functions for the combined data
+# Both exports hand back the shared, cached objects built by _combined_indexes.
+# They are read-only; callers that need to modify them should copy first.
 def export_combined_codes_as_dict():
-    """Export the combined codes as a dictionary for easy access"""
-    return {entry['country_code']: entry for entry in combined_iso_codes}
+    """Export the combined codes as a read-only mapping keyed by country code"""
+    return _country_to_currency()
 
 def export_combined_codes_as_list():
-    """Export the combined codes as a list"""
-    return combined_iso_codes.copy()
+    """Export the combined codes as an immutable tuple"""
+    return _combined_indexes()[0]
 
 def get_country_by_currency_code(currency_code):
-    """Find country information by currency code"""
-    for entry in combined_iso_codes:
-        if entry['currency_code'] == currency_code:
-            return entry
-    return None
+    """Find country information by currency code, as an IsoEntry"""
+    return _currency_to_country().get(currency_code)
 
 def get_currency_by_country_code(country_code):
-    """Find currency information by country code"""
-    for entry in combined_iso_codes:
-        if entry['country_code'] == country_code:
-            return entry
-    return None
+    """Find currency information by country code, as an IsoEntry"""
+    return _country_to_currency().get(country_code)
+
+logger = logging.getLogger(__name__)
+
+_CODE_CONV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "code_conv.json")
+_CODE_CONV_POLL_SECONDS = 60.0
+
+class _CodeConv:
+    """code_conv.json served from memory and revalidated in the background.
+
+    The file is parsed on first use. After that a daemon thread re-stats it
+    every poll_interval seconds and swaps in a freshly parsed copy when the
+    mtime changes. If a reload fails, the previously loaded data keeps being
+    served.
+    """
+
+    def __init__(self, path, poll_interval=_CODE_CONV_POLL_SECONDS):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._data = None
+        self._mtime = None
+        self._watcher = None
+
+    def get(self):
+        """Return the (code_conv, country_to_currency_code) mappings"""
+        data = self._data
+        if data is None:
+            with self._lock:
+                if self._data is None:
+                    self._load(os.stat(self.path).st_mtime_ns)
+                    self._watcher = threading.Thread(
+                        target=self._watch, name="code-conv-watcher", daemon=True
+                    )
+                    self._watcher.start()
+                data = self._data
+        return data
+
+    def refresh(self):
+        """Reload the file if its mtime has changed since the last load"""
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime != self._mtime:
+                self._load(mtime)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Keeping previously loaded {self.path}: {e}")
+
+    def _watch(self):
+        while True:
+            time.sleep(self.poll_interval)
+            self.refresh()
+
+    def _load(self, mtime):
+        with open(self.path, "r", encoding="utf-8") as f:
+            code_conv = json.load(f)
+
+        country_to_currency_code = {
+            country: entry["currency_code"] for country, entry in code_conv.items()
+        }
+        # Most Eurozone members have no entry in code_conv.json at all
+        country_to_currency_code.update(dict.fromkeys(EUD, "EUD"))
+
+        # Publish both mappings with a single reference assignment so readers
+        # never see one without the other
+        self._data = (MappingProxyType(code_conv), MappingProxyType(country_to_currency_code))
+        self._mtime = mtime
+
+_CODE_CONV = _CodeConv(_CODE_CONV_PATH)
+
+def _code_conv():
+    """Country code -> combined ISO entry mapping loaded from code_conv.json"""
+    return _CODE_CONV.get()[0]
+
+def _country_to_currency_code():
+    """Country code -> currency code, with Eurozone members folded to EUD"""
+    return _CODE_CONV.get()[1]
 
 def convert_bloc_to_4217(bloc):
-    with open("/home/websinthe/code/econcell/frontend/data/code_conv.json", "r", encoding="utf-8") as f:
-        payload = json.load(f)
-    
-    new_set = set()
-    
-    for country in bloc:
-        if country in EUD:
-            new_set.add("EUD")
-        else:
-            new_set.add(payload[country]['currency_code'])
-
-    return new_set
-
-# Create lookup dictionaries for easy access
-COMBINED_CODES_BY_COUNTRY = export_combined_codes_as_dict()
-COMBINED_CODES_LIST = export_combined_codes_as_list()
-
-# Create reverse lookup dictionaries
-CURRENCY_TO_COUNTRY = {entry['currency_code']: entry for entry in combined_iso_codes}
-COUNTRY_TO_CURRENCY = {entry['country_code']: entry for entry in combined_iso_codes}
-
-#print(f"\n=== USAGE EXAMPLES ===")
-#print("# Get country info by currency code:")
-#usd_info = get_country_by_currency_code('USD')
-#if usd_info:
-#    print(f"USD belongs to: {usd_info['country']} ({usd_info['country_code']})")
-#
-#print("\n# Get currency info by country code:")
-#gbr_info = get_currency_by_country_code('GBR')
-#if gbr_info:
-#    print(f"GBR uses: {gbr_info['currency']} ({gbr_info['currency_code']})")
-#
-#print(f"\n# Available lookup dictionaries:")
-#print(f"- COMBINED_CODES_BY_COUNTRY: {len(COMBINED_CODES_BY_COUNTRY)} entries")
-#print(f"- CURRENCY_TO_COUNTRY: {len(CURRENCY_TO_COUNTRY)} entries")
-#print(f"- COUNTRY_TO_CURRENCY: {len(COUNTRY_TO_CURRENCY)} entries")
-#
-#import json
-#
-#
-#
-#print(G20)
-#print(convert_bloc_to_4217(G20))
+    """Convert a bloc of ISO 3166 codes to the set of currency codes it uses
+
+    Raises KeyError for a country code that isn't in code_conv.json.
+    """
+    country_to_currency_code = _country_to_currency_code()
+    return {country_to_currency_code[country] for country in bloc}
+
+@functools.cache
+def _iso_3166_codes():
+    """Legacy {code: country} single-entry dict view of the ISO 3166 rows"""
+    return tuple({code: country} for code, country in _ISO_3166)
+
+@functools.cache
+def _iso_4217_codes():
+    """Legacy list-of-dicts view of the ISO 4217 rows"""
+    return tuple(dict(zip(_ISO_4217_KEYS, row)) for row in _ISO_4217)
+
+# Lazily built lookup tables, exposed under their historical module-level names
+_LAZY_INDEXES = {
+    "ISO_3166_CODES": _iso_3166_codes,
+    "ISO_4217_CODES": _iso_4217_codes,
+    "iso_3166_country_to_code": _iso_3166_country_to_code,
+    "combined_iso_codes": export_combined_codes_as_list,
+    "unmatched_countries": lambda: _combined_indexes()[1],
+    "COMBINED_CODES_BY_COUNTRY": _country_to_currency,
+    "COMBINED_CODES_LIST": export_combined_codes_as_list,
+    "CURRENCY_TO_COUNTRY": _currency_to_country,
+    "COUNTRY_TO_CURRENCY": _country_to_currency,
+}
+
+def __getattr__(name):
+    try:
+        builder = _LAZY_INDEXES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return builder()
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_INDEXES))
+
+def _dump_counts():
+    """Print a summary of the combined ISO tables"""
+    combined, unmatched = _combined_indexes()[:2]
+    print(f"ISO_3166_CODES: {len(_ISO_3166)}")
+    print(f"ISO_4217_CODES: {len(_ISO_4217)}")
+    print(f"Combined ISO codes (4217 + 3166): {len(combined)} entries")
+    print(f"Unmatched countries from ISO 4217: {len(unmatched)} entries")
+    for i, country in enumerate(unmatched, 1):
+        print(f"{i:2d}. {country}")
+    print(f"Match rate: {len(combined)/len(_ISO_4217)*100:.1f}%")
+
+if __name__ == "__main__":
+    _dump_counts()
@@ -55,22 +55,13 @@ def get_original_data_structures():
     return iso_4217_codes, country_name_mappings, iso_3166_country_to_code
 
 
-def demonstrate_original_vs_refactored():
-    """
-    Demonstrate the difference between original approach and refactored function.
+def combine_with_original_approach(iso_4217_codes, country_name_mappings, iso_3166_country_to_code):
     """
-    print("=== ISO Code Matching: Original vs Refactored Approach ===\n")
-    
-    # Get the data structures
-    iso_4217_codes, country_name_mappings, iso_3166_country_to_code = get_original_data_structures()
+    Combine the codes the way the inline code in definitions.py originally did.
     
-    print("1. ORIGINAL APPROACH (Inline Code):")
-    print("   - Code was embedded directly in definitions.py")
-    print("   - No reusability or modularity")
-    print("   - Limited error handling")
-    print("   - No type hints or comprehensive documentation\n")
-    
-    # Simulate original approach
+    Returns:
+        Tuple of (combined_iso_codes, unmatched_countries)
+    """
     combined_iso_codes_original = []
     unmatched_countries_original = []
     
@@ -99,6 +90,31 @@ def demonstrate_original_vs_refactored():
         else:
             unmatched_countries_original.append(country_name)
     
+    return combined_iso_codes_original, unmatched_countries_original
+
+
+def demonstrate_original_vs_refactored():
+    """
+    Demonstrate the difference between original approach and refactored function.
+    """
+    print("=== ISO Code Matching: Original vs Refactored Approach ===\n")
+    
+    # Get the data structures
+    iso_4217_codes, country_name_mappings, iso_3166_country_to_code = get_original_data_structures()
+    
+    print("1. ORIGINAL APPROACH (Inline Code):")
+    print("   - Code was embedded directly in definitions.py")
+    print("   - No reusability or modularity")
+    print("   - Limited error handling")
+    print("   - No type hints or comprehensive documentation\n")
+    
+    # Simulate original approach
+    combined_iso_codes_original, unmatched_countries_original = combine_with_original_approach(
+        iso_4217_codes,
+        country_name_mappings,
+        iso_3166_country_to_code
+    )
+    
     print("2. REFACTORED APPROACH (Standalone Function):")
     print("   - Modular, reusable function")
     print("   - Comprehensive type hints and documentation")
@@ -120,7 +136,9 @@ def demonstrate_original_vs_refactored():
     print("3. RESULTS COMPARISON:")
     print(f"   Original approach - Combined: {len(combined_iso_codes_original)}, Unmatched: {len(unmatched_countries_original)}")
     print(f"   Refactored approach - Combined: {len(combined_iso_codes_refactored)}, Unmatched: {len(unmatched_countries_refactored)}")
-    print(f"   Results identical: {combined_iso_codes_original == combined_iso_codes_refactored and unmatched_countries_original == unmatched_countries_refactored}\n")
+    assert combined_iso_codes_original == combined_iso_codes_refactored
+    assert unmatched_countries_original == unmatched_countries_refactored
+    print("   Results identical: True\n")
     
     # Display sample results
     print("4. SAMPLE COMBINED ENTRIES:")
@@ -217,6 +235,11 @@ def demonstrate_flexibility():
 
 
 if __name__ == "__main__":
+    # The walkthrough is print-heavy; automated checks live in frontend/tests
+    if "--demo" not in sys.argv:
+        print(f"Usage: {os.path.basename(__file__)} --demo")
+        sys.exit(0)
+    
     # Run all demonstrations
     demonstrate_original_vs_refactored()
     demonstrate_error_handling()
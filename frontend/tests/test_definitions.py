@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the ISO 3166 / ISO 4217 lookup tables in frontend.data.definitions.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from frontend.data import definitions
+
+
+# ISO 4217 "countries" that are currency unions or territories with no
+# ISO 3166 entry of their own
+EXPECTED_UNMATCHED = {
+    "Netherlands Antilles",
+    "European Union",
+    "CEMAC",
+    "Organisation of Eastern Caribbean States",
+    "International Monetary Fund",
+    "CFA",
+    "Collectivités d'Outre-Mer",
+}
+
+
+def test_country_name_mappings_only_hold_real_remappings():
+    """Identity entries are redundant with the direct ISO 3166 lookup."""
+    for iso_4217_name, iso_3166_name in definitions.country_name_mappings.items():
+        assert iso_4217_name != iso_3166_name, f"Identity mapping for {iso_4217_name}"
+
+
+def test_combined_match_set():
+    """Every ISO 4217 country is either matched or an expected union/territory."""
+    matched = {entry.country for entry in definitions.export_combined_codes_as_list()}
+    unmatched = set(definitions.unmatched_countries)
+
+    assert unmatched == EXPECTED_UNMATCHED
+    assert len(matched) + len(unmatched) == len({row["country"] for row in definitions.ISO_4217_CODES})
+    assert len(definitions.export_combined_codes_as_list()) == 154
+
+
+def test_find_iso_3166_code():
+    """Remapped, directly matched and unknown names all resolve as expected."""
+    assert definitions.find_iso_3166_code("Russia") == "RUS"
+    assert definitions.find_iso_3166_code("United States") == "USA"
+    assert definitions.find_iso_3166_code("Australia") == "AUS"
+    assert definitions.find_iso_3166_code("Antarctica") == "ATA"
+    assert definitions.find_iso_3166_code("European Union") is None
+    assert definitions.find_iso_3166_code("Atlantis") is None
+
+
+def test_convert_bloc_to_4217():
+    """Eurozone members collapse to EUD; everyone else maps to their own currency."""
+    assert definitions.convert_bloc_to_4217({"AUS", "NZL", "USA"}) == {"AUD", "NZD", "USD"}
+    assert definitions.convert_bloc_to_4217({"FRA", "DEU", "GBR"}) == {"EUD", "GBP"}
+    assert definitions.convert_bloc_to_4217(set()) == set()
+
+
+def test_code_conv_revalidates_and_keeps_stale_data(tmp_path):
+    """A changed file is picked up on refresh; a broken one leaves the old data in place."""
+    path = tmp_path / "code_conv.json"
+    path.write_text(json.dumps({"AUS": {"currency_code": "AUD"}}), encoding="utf-8")
+    code_conv = definitions._CodeConv(str(path), poll_interval=3600)
+
+    assert code_conv.get()[1]["AUS"] == "AUD"
+
+    path.write_text(json.dumps({"AUS": {"currency_code": "XAU"}}), encoding="utf-8")
+    os.utime(path, ns=(0, 1))
+    code_conv.refresh()
+    assert code_conv.get()[1]["AUS"] == "XAU"
+
+    path.write_text("{not json", encoding="utf-8")
+    os.utime(path, ns=(0, 2))
+    code_conv.refresh()
+    assert code_conv.get()[1]["AUS"] == "XAU"
+    assert code_conv.get()[1]["FRA"] == "EUD"
+
+
+def test_package_reexports_lazy_tables():
+    """frontend.data forwards the lazy tables and only the public names."""
+    import frontend.data as data
+
+    for name in definitions._LAZY_INDEXES:
+        assert hasattr(data, name), name
+        assert name in dir(data)
+    assert data.ISO_3166_CODES is definitions.ISO_3166_CODES
+    assert data.iso_3166_country_to_code["Australia"] == "AUS"
+
+    for name in ("logger", "functools", "threading"):
+        assert not hasattr(data, name), name
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for the refactored ISO code matching utilities, covering the cases the
+iso_code_integration_example.py walkthrough demonstrates.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add frontend/data to path, matching how the example imports the matcher
+sys.path.insert(0, str(Path(__file__).parent.parent / "data"))
+
+from iso_code_matcher import combine_iso_currency_and_country_codes, create_iso_3166_lookup_function
+from iso_code_integration_example import combine_with_original_approach, get_original_data_structures
+
+
+@pytest.fixture
+def original_data():
+    """Simplified ISO 4217 rows, name mappings and ISO 3166 lookup."""
+    return get_original_data_structures()
+
+
+@pytest.fixture
+def lookup_func(original_data):
+    _, country_name_mappings, iso_3166_country_to_code = original_data
+    return create_iso_3166_lookup_function(country_name_mappings, iso_3166_country_to_code)
+
+
+def test_refactored_matches_original(original_data, lookup_func):
+    """The standalone function reproduces the original inline logic."""
+    iso_4217_codes, country_name_mappings, iso_3166_country_to_code = original_data
+
+    combined_original, unmatched_original = combine_with_original_approach(
+        iso_4217_codes, country_name_mappings, iso_3166_country_to_code
+    )
+    combined_refactored, unmatched_refactored = combine_iso_currency_and_country_codes(
+        iso_4217_codes, lookup_func
+    )
+
+    assert combined_original == combined_refactored
+    assert unmatched_original == unmatched_refactored
+
+
+@pytest.mark.parametrize("input_row, expected_code", [
+    ({"country": "United States", "currency": "United States Dollar", "code": "USD"}, "USA"),
+    ({"country": "Australia", "currency": "Australian Dollar", "code": "AUD"}, "AUS"),
+    ({"country": "United Kingdom", "currency": "Pound Sterling", "code": "GBP"}, "GBR"),
+    ({"country": "European Union", "currency": "Euro", "code": "EUR"}, "DEU"),
+    ({"country": "Japan", "currency": "Japanese Yen", "code": "JPY"}, "JPN"),
+    ({"country": "Switzerland", "currency": "Swiss Franc", "code": "CHF"}, "CHE"),
+])
+def test_combined_entry(lookup_func, input_row, expected_code):
+    """Each row is combined with its ISO 3166 code."""
+    combined, unmatched = combine_iso_currency_and_country_codes([input_row], lookup_func)
+
+    assert unmatched == []
+    assert combined == [{
+        "country": input_row["country"],
+        "currency": input_row["currency"],
+        "currency_code": input_row["code"],
+        "country_code": expected_code,
+    }]
+
+
+def test_unmatched_country(lookup_func):
+    """Rows without an ISO 3166 match are reported, not combined."""
+    row = {"country": "Atlantis", "currency": "Atlantean Drachma", "code": "XAT"}
+    combined, unmatched = combine_iso_currency_and_country_codes([row], lookup_func)
+
+    assert combined == []
+    assert unmatched == ["Atlantis"]
+
+
+def test_invalid_inputs():
+    """Non-list input and non-callable lookups are rejected."""
+    with pytest.raises(TypeError):
+        combine_iso_currency_and_country_codes("not a list", lambda x: x)
+    with pytest.raises(ValueError):
+        combine_iso_currency_and_country_codes([], "not callable")
+
+
+def test_malformed_entries_are_skipped():
+    """Entries that are not dicts or lack required keys are ignored."""
+    malformed_data = [
+        {"country": "Valid Country", "currency": "Valid Currency", "code": "VAL"},
+        {"country": "Missing Currency"},
+        "not a dictionary",
+        {"country": "Another Valid", "currency": "Valid Currency", "code": "AV2"},
+    ]
+
+    combined, unmatched = combine_iso_currency_and_country_codes(
+        malformed_data, lambda name: "XXX" if name == "Valid Country" else None
+    )
+
+    assert [entry["country"] for entry in combined] == ["Valid Country"]
+    assert unmatched == ["Another Valid"]
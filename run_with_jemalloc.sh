@@ -0,0 +1,37 @@
+#!/bin/bash
+# Run a command with jemalloc preloaded in place of glibc malloc
+#
+# The AI memory manager creates and frees many small objects in bursts
+# during cache eviction and cleanup; jemalloc handles that churn across
+# threads with far less arena lock contention than glibc's ptmalloc2.
+#
+# Usage: ./run_with_jemalloc.sh python test_ai_system.py
+
+if [ $# -eq 0 ]; then
+    echo "Usage: $0 <command> [args...]"
+    exit 1
+fi
+
+JEMALLOC_LIB=""
+for candidate in \
+    /usr/lib/x86_64-linux-gnu/libjemalloc.so.2 \
+    /usr/lib/aarch64-linux-gnu/libjemalloc.so.2 \
+    /usr/lib64/libjemalloc.so.2 \
+    /usr/lib/libjemalloc.so.2 \
+    /usr/local/lib/libjemalloc.so.2; do
+    if [ -f "$candidate" ]; then
+        JEMALLOC_LIB="$candidate"
+        break
+    fi
+done
+
+if [ -n "$JEMALLOC_LIB" ]; then
+    echo "🧠 Preloading jemalloc: $JEMALLOC_LIB"
+    export LD_PRELOAD="$JEMALLOC_LIB${LD_PRELOAD:+:$LD_PRELOAD}"
+else
+    # Without jemalloc, limiting glibc to two arenas still curbs fragmentation
+    echo "⚠️  jemalloc not found (apt install libjemalloc2) - falling back to MALLOC_ARENA_MAX=2"
+    export MALLOC_ARENA_MAX=2
+fi
+
+exec "$@"
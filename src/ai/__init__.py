@@ -8,11 +8,26 @@ including multi-model LLM management, task coordination, and economic analysis w
 __version__ = "0.1.0"
 __author__ = "EconCell Development Team"
 
-from .model_orchestrator import ModelOrchestrator
-from .task_queue import TaskQueue, TaskType, TaskPriority
-from .load_balancer import LoadBalancer, LoadBalancingStrategy
-from .memory_manager import MemoryManager, MemoryType, MemoryPriority
-from .ai_coordinator import AICoordinator, AnalysisType, AnalysisRequest, AnalysisResult
+import importlib
+
+# Public names are resolved from their submodules on first access (PEP 562),
+# so importing a lightweight enum doesn't pull in the whole orchestration stack.
+_LAZY_IMPORTS = {
+    "ModelOrchestrator": ".model_orchestrator",
+    "TaskQueue": ".task_queue",
+    "TaskType": ".task_queue",
+    "TaskPriority": ".task_queue",
+    "LoadBalancer": ".load_balancer",
+    "LoadBalancingStrategy": ".load_balancer",
+    "MemoryManager": ".memory_manager",
+    "MemoryType": ".memory_manager",
+    "MemoryPriority": ".memory_manager",
+    "AICoordinator": ".ai_coordinator",
+    "AnalysisType": ".ai_coordinator",
+    "AnalysisRequest": ".ai_coordinator",
+    "AnalysisResult": ".ai_coordinator",
+    "EconomicContext": ".ai_coordinator",
+}
 
 __all__ = [
     "ModelOrchestrator",
@@ -27,5 +42,20 @@ __all__ = [
     "AICoordinator",
     "AnalysisType",
     "AnalysisRequest",
-    "AnalysisResult"
-]
\ No newline at end of file
+    "AnalysisResult",
+    "EconomicContext"
+]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_IMPORTS.keys())
@@ -6,21 +6,162 @@ load balancing, and memory management for economic analysis workflows.
 """
 
 import asyncio
+import copy
+import functools
 import logging
 import time
-from typing import Dict, List, Optional, Any, Callable, Awaitable
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Callable, Awaitable, ClassVar, Set, Tuple
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from enum import Enum
 import json
 import os
 
+import numpy as np
+
 from .model_orchestrator import ModelOrchestrator, ModelPriority, ModelStatus
-from .task_queue import TaskQueue, TaskType, TaskPriority, TaskStatus
+from .task_queue import Task, TaskQueue, TaskType, TaskPriority, TaskStatus
 from .load_balancer import LoadBalancer, LoadBalancingStrategy
 from .memory_manager import MemoryManager, MemoryType, MemoryPriority
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Task statuses after which a task will not change again
+_FINISHED_TASK_STATUSES = frozenset({
+    TaskStatus.COMPLETED.value,
+    TaskStatus.FAILED.value,
+    TaskStatus.CANCELLED.value,
+    TaskStatus.TIMEOUT.value,
+})
+
+# Time allowed for each verification model to return a result
+_VERIFICATION_TIMEOUT_SECONDS = 120
+
+# System monitor cadence
+_PERF_LOG_INTERVAL_SECONDS = 300
+_HEALTH_CHECK_INTERVAL_SECONDS = 60
+
+
+def _dumps(obj: Any) -> str:
+    """Pretty-print obj as JSON for prompts, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    return json.dumps(obj, indent=2)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON config file; cached by path and modification time"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+# Prompt templates; static text is held once and only the placeholders are
+# filled per request
+_CONTENT_PREAMBLE = """
+        Economic Analysis Context:
+        - Focus: Australian economic conditions and policy implications
+        - Framework: RBA circular flow model and monetary transmission mechanisms
+        - Perspective: Consider both domestic and international factors
+        - Methodology: Apply rigorous economic reasoning with quantitative support
+        
+        Analysis Type: {analysis_type}
+        
+        Original Content:
+        """
+
+_CONTENT_INSTRUCTIONS = """
+        
+        Please provide comprehensive analysis with:
+        1. Clear economic reasoning
+        2. Quantitative evidence where possible
+        3. Policy implications
+        4. Uncertainty assessment
+        5. Australian-specific considerations
+        """
+
+_HYPOTHESIS_TEMPLATE = """
+        Economic Hypothesis Generation Request:
+        
+        Economic Data Summary:
+        {data}
+        
+        Focus Areas: {focus}
+        
+        Please analyze the provided economic data and generate:
+        
+        1. Novel Economic Hypotheses:
+           - Identify unusual patterns or relationships
+           - Propose explanatory mechanisms
+           - Consider Australian economic structure
+        
+        2. Testable Predictions:
+           - Specific, measurable predictions
+           - Timeline for validation
+           - Data requirements for testing
+        
+        3. Policy Implications:
+           - Potential policy responses
+           - Expected effectiveness
+           - Implementation challenges
+        
+        4. Research Priorities:
+           - Areas requiring deeper investigation
+           - Data collection needs
+           - Methodological considerations
+        
+        Format as structured JSON with confidence scores for each hypothesis.
+        """
+
+_VERIFICATION_TEMPLATE = """
+        Verification Request:
+        
+        Original Analysis: {analysis_type}
+        
+        Original Content:
+        {content}
+        
+        Primary Result to Verify:
+        {result}
+        
+        Verification Tasks:
+        1. Assess the logical consistency of the analysis
+        2. Check for factual accuracy
+        3. Evaluate the strength of economic reasoning
+        4. Identify potential biases or errors
+        5. Rate confidence level (0-100%)
+        6. Suggest improvements if needed
+        
+        Please provide structured verification results.
+        """
+
+_POLICY_TEMPLATE = """
+        Policy Analysis Request:
+        
+        Policy Description: {policy}
+        
+        Current Economic Indicators:
+        {indicators}
+        
+        Analysis Requirements:
+        - Assess immediate and long-term impacts
+        - Consider Australian economic structure
+        - Evaluate sector-specific effects
+        - Quantify uncertainty ranges
+        - Provide policy recommendations
+        """
+
 
 class AnalysisType(Enum):
     """Types of economic analysis workflows"""
@@ -48,7 +189,7 @@ class AnalysisRequest:
     callback: Optional[Callable[[Any], Awaitable[None]]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of economic analysis"""
     request_id: str
@@ -61,6 +202,93 @@ class AnalysisResult:
     metadata: Dict[str, Any] = None
 
 
+@dataclass(slots=True)
+class EconomicContext(Mapping):
+    """
+    Analysis context built for each task, sent to the queue as a plain dict
+    
+    The framework fields are fixed per coordinator; caller-provided keys live
+    in extra. Reads like the equivalent dict, with framework fields taking
+    precedence over caller keys of the same name.
+    """
+    economic_framework: str
+    data_sources: Tuple[str, ...]
+    focus_region: str
+    analysis_timestamp: float
+    rba_circular_flow: bool
+    verification_enabled: bool
+    extra: Dict[str, Any] = field(default_factory=dict)
+    
+    _FIELDS: ClassVar[Tuple[str, ...]] = (
+        "economic_framework",
+        "data_sources",
+        "focus_region",
+        "analysis_timestamp",
+        "rba_circular_flow",
+        "verification_enabled",
+    )
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in EconomicContext._FIELDS:
+            return getattr(self, key)
+        return self.extra[key]
+    
+    def __iter__(self):
+        yield from (key for key in self.extra if key not in EconomicContext._FIELDS)
+        yield from EconomicContext._FIELDS
+    
+    def __len__(self) -> int:
+        return len(EconomicContext._FIELDS) + sum(
+            1 for key in self.extra if key not in EconomicContext._FIELDS
+        )
+
+
+class _ResultCache:
+    """Bounded LRU mapping of analysis results with per-entry expiry"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Values in LRU order; reads move entries to the end
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        # Expiry times in write order, which is expiry order as the TTL is fixed
+        self._expiry: "OrderedDict[str, float]" = OrderedDict()
+    
+    def _expire(self):
+        """Drop entries past their TTL, oldest first"""
+        now = time.monotonic()
+        while self._expiry:
+            key, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now:
+                break
+            del self._expiry[key]
+            del self._data[key]
+    
+    def __setitem__(self, key: str, value: Any):
+        self._expiry.pop(key, None)
+        self._expiry[key] = time.monotonic() + self.ttl
+        self._data[key] = value
+        self._data.move_to_end(key)
+        self._expire()
+        while len(self._data) > self.maxsize:
+            evicted, _ = self._data.popitem(last=False)
+            del self._expiry[evicted]
+    
+    def __getitem__(self, key: str) -> Any:
+        self._expire()
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+    
+    def __contains__(self, key: object) -> bool:
+        self._expire()
+        return key in self._data
+    
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._data)
+
+
 class AICoordinator:
     """
     Central AI coordination system for EconCell platform
@@ -74,6 +302,18 @@ class AICoordinator:
     - Economic analysis pipelines
     """
     
+    _ANALYSIS_TO_TASK: ClassVar[Dict[AnalysisType, TaskType]] = {
+        AnalysisType.HYPOTHESIS_GENERATION: TaskType.HYPOTHESIS_GENERATION,
+        AnalysisType.DATA_ANALYSIS: TaskType.DATA_ANALYSIS,
+        AnalysisType.VERIFICATION: TaskType.VERIFICATION,
+        AnalysisType.POLICY_ANALYSIS: TaskType.POLICY_ANALYSIS,
+        AnalysisType.FORECASTING: TaskType.FORECASTING,
+        AnalysisType.RESEARCH_SYNTHESIS: TaskType.RESEARCH_SYNTHESIS,
+        AnalysisType.REPORT_GENERATION: TaskType.REPORT_GENERATION,
+        AnalysisType.MONTE_CARLO_SIMULATION: TaskType.MONTE_CARLO,
+        AnalysisType.CELLULAR_AUTOMATA: TaskType.CELLULAR_AUTOMATA
+    }
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize the AI Coordinator
@@ -94,7 +334,34 @@ class AICoordinator:
         
         # Analysis tracking
         self.active_analyses: Dict[str, AnalysisRequest] = {}
-        self.completed_analyses: Dict[str, AnalysisResult] = {}
+        self.completed_analyses = _ResultCache(
+            maxsize=self.config.get("completed_cache_size", 1024),
+            ttl=self.config.get("completed_ttl_s", 3600)
+        )
+        
+        # Completion tracking: futures resolved with the final task status by
+        # task queue callbacks, and the analyses whose futures have resolved
+        self._task_futures: Dict[str, asyncio.Future] = {}
+        self._finished_analyses: asyncio.Queue = asyncio.Queue()
+        
+        # Backpressure: at most max_concurrent_analyses analyses in flight,
+        # a slot is held from submission until the analysis finishes
+        self._submit_sem = asyncio.Semaphore(self.config.get("max_concurrent_analyses", 10))
+        for event_type in ("task_completed", "task_failed", "task_cancelled"):
+            self.task_queue.register_callback(event_type, self._on_task_finished)
+        
+        # Static prompt and context fragments, rendered once
+        self._content_preambles: Dict[AnalysisType, str] = {
+            analysis_type: _CONTENT_PREAMBLE.format(analysis_type=analysis_type.value)
+            for analysis_type in AnalysisType
+        }
+        self._static_context: Dict[str, Any] = {
+            "economic_framework": "Australian macroeconomic analysis",
+            "data_sources": tuple(self.config["economic_context"]["primary_data_sources"]),
+            "focus_region": self.config["economic_context"]["focus_region"],
+            "rba_circular_flow": True,  # Indicates RBA circular flow context
+            "verification_enabled": self.config.get("multi_model_verification", True)
+        }
         
         # Performance tracking
         self.performance_metrics = {
@@ -104,14 +371,15 @@ class AICoordinator:
             "average_processing_time": 0.0,
             "verification_success_rate": 0.0
         }
+        self._processing_time_sum = 0.0
+        self._processing_time_count = 0
         
         # Verification workflows
         self.verification_models = self.config.get("verification_models", ["llama_70b_verification"])
         self.consensus_threshold = self.config.get("consensus_threshold", 0.7)
         
         # Background tasks
-        self._processor_task: Optional[asyncio.Task] = None
-        self._monitor_task: Optional[asyncio.Task] = None
+        self._bg_tasks: Set[asyncio.Task] = set()
         self._stop_event = asyncio.Event()
         
         logger.info("AICoordinator initialized with load balancing strategy: %s", 
@@ -120,8 +388,8 @@ class AICoordinator:
     def _load_config(self, config_path: Optional[str] = None) -> Dict[str, Any]:
         """Load configuration from file or use defaults"""
         if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            # Parsed once per file version; each coordinator gets its own copy
+            return copy.deepcopy(_read_config(config_path, os.stat(config_path).st_mtime_ns))
         
         return {
             "max_queue_size": 10000,
@@ -131,6 +399,8 @@ class AICoordinator:
             "multi_model_verification": True,
             "max_concurrent_analyses": 10,
             "analysis_timeout_seconds": 300,
+            "completed_cache_size": 1024,
+            "completed_ttl_s": 3600,
             "memory_config": {
                 "max_system_ram_usage": int(160 * 1024**3),
                 "max_gpu_memory_usage": int(60 * 1024**3)
@@ -160,13 +430,13 @@ class AICoordinator:
             
             # Start background processing
             self._stop_event.clear()
-            self._processor_task = asyncio.create_task(self._process_analyses())
-            self._monitor_task = asyncio.create_task(self._monitor_system())
+            self._spawn(self._process_analyses())
+            self._spawn(self._monitor_system())
             
             logger.info("AICoordinator started successfully")
             
         except Exception as e:
-            logger.error(f"Failed to start AICoordinator: {e}")
+            logger.error("Failed to start AICoordinator: %s", e)
             await self.stop()
             raise
     
@@ -177,15 +447,12 @@ class AICoordinator:
         # Stop background tasks
         self._stop_event.set()
         
-        if self._processor_task:
-            self._processor_task.cancel()
-        if self._monitor_task:
-            self._monitor_task.cancel()
+        bg_tasks = tuple(self._bg_tasks)
+        for task in bg_tasks:
+            task.cancel()
         
         # Wait for tasks to complete
-        tasks_to_wait = [t for t in [self._processor_task, self._monitor_task] if t]
-        if tasks_to_wait:
-            await asyncio.gather(*tasks_to_wait, return_exceptions=True)
+        await asyncio.gather(*bg_tasks, return_exceptions=True)
         
         # Stop subsystems
         await self.task_queue.stop()
@@ -195,6 +462,13 @@ class AICoordinator:
         
         logger.info("AICoordinator stopped")
     
+    def _spawn(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """Start a background task that is dropped from _bg_tasks once done"""
+        task = asyncio.create_task(coro)
+        task.add_done_callback(self._bg_tasks.discard)
+        self._bg_tasks.add(task)
+        return task
+    
     async def submit_analysis(self, request: AnalysisRequest) -> str:
         """
         Submit an economic analysis request
@@ -212,21 +486,39 @@ class AICoordinator:
         enhanced_context = self._enhance_context(request.context)
         enhanced_content = self._enhance_content(request.content, request.analysis_type)
         
-        # Submit to task queue
-        task_id = await self.task_queue.submit_task(
-            task_type=task_type,
-            content=enhanced_content,
-            priority=request.priority,
-            context=enhanced_context,
-            preferred_model=request.preferred_models[0] if request.preferred_models else None,
-            timeout_seconds=request.timeout_seconds,
-            callback=request.callback
-        )
+        # Wait for a free analysis slot before allocating any queue state
+        await self._submit_sem.acquire()
         
-        # Track the analysis
-        self.active_analyses[task_id] = request
+        # Submit to task queue
+        task_id = None
+        try:
+            task_id = await self.task_queue.submit_task(
+                task_type=task_type,
+                content=enhanced_content,
+                priority=request.priority,
+                # Tasks carry a plain dict so backends can copy, update or
+                # serialise it; this is the only copy of the caller's context
+                context=dict(enhanced_context),
+                preferred_model=request.preferred_models[0] if request.preferred_models else None,
+                timeout_seconds=request.timeout_seconds,
+                callback=request.callback
+            )
+            
+            # Track the analysis; the slot is released once it finishes
+            self.active_analyses[task_id] = request
+            completion = await self._track_task(task_id)
+            completion.add_done_callback(lambda _: self._submit_sem.release())
+            completion.add_done_callback(lambda _: self._finished_analyses.put_nowait(task_id))
+        except BaseException:
+            # Until the callbacks are attached nothing else releases the
+            # slot or retires the analysis
+            if task_id is not None:
+                self.active_analyses.pop(task_id, None)
+                self._task_futures.pop(task_id, None)
+            self._submit_sem.release()
+            raise
         
-        logger.info(f"Submitted {request.analysis_type.value} analysis with task ID: {task_id}")
+        logger.info("Submitted %s analysis with task ID: %s", request.analysis_type.value, task_id)
         return task_id
     
     async def get_analysis_status(self, request_id: str) -> Optional[Dict[str, Any]]:
@@ -277,34 +569,45 @@ class AICoordinator:
         Returns:
             List of verification results from different models
         """
-        verification_tasks = []
         verification_content = self._prepare_verification_content(content, primary_result, analysis_type)
         
-        for model_name in self.verification_models:
-            # Check if model is available
-            model_status = await self.orchestrator.get_model_status(model_name)
-            if model_status and model_status["status"] == ModelStatus.READY.value:
-                
-                task_id = await self.task_queue.submit_task(
-                    task_type=TaskType.VERIFICATION,
-                    content=verification_content,
-                    priority=TaskPriority.HIGH,
-                    preferred_model=model_name,
-                    timeout_seconds=120
-                )
-                
-                verification_tasks.append(task_id)
+        # Check model availability concurrently
+        model_statuses = await asyncio.gather(
+            *(self.orchestrator.get_model_status(model_name) for model_name in self.verification_models)
+        )
+        ready_models = [
+            model_name
+            for model_name, model_status in zip(self.verification_models, model_statuses)
+            if model_status and model_status["status"] == ModelStatus.READY.value
+        ]
+        if not ready_models:
+            return []
+        
+        # Submit one verification task per ready model
+        task_ids = await asyncio.gather(*(
+            self.task_queue.submit_task(
+                task_type=TaskType.VERIFICATION,
+                content=verification_content,
+                priority=TaskPriority.HIGH,
+                preferred_model=model_name,
+                timeout_seconds=_VERIFICATION_TIMEOUT_SECONDS
+            )
+            for model_name in ready_models
+        ))
         
         # Wait for verification results
-        verification_results = []
-        for task_id in verification_tasks:
-            # This is simplified - in practice you'd wait for task completion
-            # and handle the async nature properly
-            status = await self.task_queue.get_task_status(task_id)
-            if status and status.get("status") == "completed":
-                verification_results.append(status.get("result"))
-        
-        return verification_results
+        futures = await asyncio.gather(*(self._track_task(task_id) for task_id in task_ids))
+        try:
+            await asyncio.wait(futures, timeout=_VERIFICATION_TIMEOUT_SECONDS)
+        finally:
+            for task_id in task_ids:
+                self._task_futures.pop(task_id, None)
+        
+        return [
+            future.result().get("result")
+            for future in futures
+            if future.done() and future.result().get("status") == "completed"
+        ]
     
     async def generate_hypothesis(self, 
                                 economic_data: Dict[str, Any],
@@ -363,21 +666,10 @@ class AICoordinator:
             "australian_context": True
         }
         
-        content = f"""
-        Policy Analysis Request:
-        
-        Policy Description: {policy_description}
-        
-        Current Economic Indicators:
-        {json.dumps(economic_indicators, indent=2)}
-        
-        Analysis Requirements:
-        - Assess immediate and long-term impacts
-        - Consider Australian economic structure
-        - Evaluate sector-specific effects
-        - Quantify uncertainty ranges
-        - Provide policy recommendations
-        """
+        content = _POLICY_TEMPLATE.format_map({
+            "policy": policy_description,
+            "indicators": _dumps(economic_indicators),
+        })
         
         request = AnalysisRequest(
             analysis_type=AnalysisType.POLICY_ANALYSIS,
@@ -392,12 +684,31 @@ class AICoordinator:
     
     async def get_system_performance(self) -> Dict[str, Any]:
         """Get comprehensive system performance metrics"""
-        # Get metrics from all subsystems
-        orchestrator_status = await self.orchestrator.get_model_status()
-        queue_stats = await self.task_queue.get_queue_stats()
-        load_balancer_stats = await self.load_balancer.get_load_balancing_stats()
+        # Get metrics from all subsystems concurrently
+        orchestrator_status, queue_stats, load_balancer_stats = await asyncio.gather(
+            self.orchestrator.get_model_status(),
+            self.task_queue.get_queue_stats(),
+            self.load_balancer.get_load_balancing_stats(),
+            return_exceptions=True
+        )
         memory_stats = self.memory_manager.get_memory_stats()
         
+        # A failing subsystem is reported rather than failing the whole snapshot
+        if isinstance(orchestrator_status, Exception):
+            logger.error("Failed to get model status: %s", orchestrator_status)
+            orchestrator_status = []
+        if isinstance(queue_stats, Exception):
+            logger.error("Failed to get queue stats: %s", queue_stats)
+            queue_stats = {"error": str(queue_stats)}
+        if isinstance(load_balancer_stats, Exception):
+            logger.error("Failed to get load balancing stats: %s", load_balancer_stats)
+            load_balancer_stats = {"error": str(load_balancer_stats)}
+        
+        if self._processing_time_count:
+            self.performance_metrics["average_processing_time"] = (
+                self._processing_time_sum / self._processing_time_count
+            )
+        
         return {
             "ai_coordinator": {
                 "active_analyses": len(self.active_analyses),
@@ -412,121 +723,66 @@ class AICoordinator:
             "memory_manager": memory_stats
         }
     
-    def _analysis_to_task_type(self, analysis_type: AnalysisType) -> TaskType:
+    @staticmethod
+    def _analysis_to_task_type(analysis_type: AnalysisType) -> TaskType:
         """Convert analysis type to task type"""
-        mapping = {
-            AnalysisType.HYPOTHESIS_GENERATION: TaskType.HYPOTHESIS_GENERATION,
-            AnalysisType.DATA_ANALYSIS: TaskType.DATA_ANALYSIS,
-            AnalysisType.VERIFICATION: TaskType.VERIFICATION,
-            AnalysisType.POLICY_ANALYSIS: TaskType.POLICY_ANALYSIS,
-            AnalysisType.FORECASTING: TaskType.FORECASTING,
-            AnalysisType.RESEARCH_SYNTHESIS: TaskType.RESEARCH_SYNTHESIS,
-            AnalysisType.REPORT_GENERATION: TaskType.REPORT_GENERATION,
-            AnalysisType.MONTE_CARLO_SIMULATION: TaskType.MONTE_CARLO,
-            AnalysisType.CELLULAR_AUTOMATA: TaskType.CELLULAR_AUTOMATA
-        }
-        return mapping.get(analysis_type, TaskType.DATA_ANALYSIS)
+        return AICoordinator._ANALYSIS_TO_TASK.get(analysis_type, TaskType.DATA_ANALYSIS)
     
-    def _enhance_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _enhance_context(self, context: Dict[str, Any]) -> EconomicContext:
         """Enhance context with economic analysis framework"""
-        enhanced = context.copy()
-        enhanced.update({
-            "economic_framework": "Australian macroeconomic analysis",
-            "data_sources": self.config["economic_context"]["primary_data_sources"],
-            "focus_region": self.config["economic_context"]["focus_region"],
-            "analysis_timestamp": time.time(),
-            "rba_circular_flow": True,  # Indicates RBA circular flow context
-            "verification_enabled": self.config.get("multi_model_verification", True)
-        })
-        return enhanced
+        return EconomicContext(
+            **self._static_context,
+            analysis_timestamp=time.time(),
+            extra=context
+        )
     
     def _enhance_content(self, content: str, analysis_type: AnalysisType) -> str:
         """Enhance content with analysis-specific instructions"""
-        economic_context = f"""
-        Economic Analysis Context:
-        - Focus: Australian economic conditions and policy implications
-        - Framework: RBA circular flow model and monetary transmission mechanisms
-        - Perspective: Consider both domestic and international factors
-        - Methodology: Apply rigorous economic reasoning with quantitative support
-        
-        Analysis Type: {analysis_type.value}
-        
-        Original Content:
-        {content}
-        
-        Please provide comprehensive analysis with:
-        1. Clear economic reasoning
-        2. Quantitative evidence where possible
-        3. Policy implications
-        4. Uncertainty assessment
-        5. Australian-specific considerations
-        """
-        
-        return economic_context
+        return self._content_preambles[analysis_type] + content + _CONTENT_INSTRUCTIONS
     
     def _prepare_verification_content(self, 
                                     original_content: str, 
                                     primary_result: Any,
                                     analysis_type: AnalysisType) -> str:
         """Prepare content for multi-model verification"""
-        return f"""
-        Verification Request:
-        
-        Original Analysis: {analysis_type.value}
-        
-        Original Content:
-        {original_content}
-        
-        Primary Result to Verify:
-        {json.dumps(primary_result, indent=2) if isinstance(primary_result, dict) else str(primary_result)}
-        
-        Verification Tasks:
-        1. Assess the logical consistency of the analysis
-        2. Check for factual accuracy
-        3. Evaluate the strength of economic reasoning
-        4. Identify potential biases or errors
-        5. Rate confidence level (0-100%)
-        6. Suggest improvements if needed
-        
-        Please provide structured verification results.
-        """
+        return _VERIFICATION_TEMPLATE.format_map({
+            "analysis_type": analysis_type.value,
+            "content": original_content,
+            "result": _dumps(primary_result) if isinstance(primary_result, dict) else str(primary_result),
+        })
     
     def _format_hypothesis_content(self, 
                                  economic_data: Dict[str, Any],
                                  focus_areas: Optional[List[str]]) -> str:
         """Format content for hypothesis generation"""
-        return f"""
-        Economic Hypothesis Generation Request:
-        
-        Economic Data Summary:
-        {json.dumps(economic_data, indent=2)}
-        
-        Focus Areas: {', '.join(focus_areas) if focus_areas else 'General economic patterns'}
-        
-        Please analyze the provided economic data and generate:
-        
-        1. Novel Economic Hypotheses:
-           - Identify unusual patterns or relationships
-           - Propose explanatory mechanisms
-           - Consider Australian economic structure
-        
-        2. Testable Predictions:
-           - Specific, measurable predictions
-           - Timeline for validation
-           - Data requirements for testing
+        return _HYPOTHESIS_TEMPLATE.format_map({
+            "data": _dumps(economic_data),
+            "focus": ", ".join(focus_areas) if focus_areas else "General economic patterns",
+        })
+    
+    async def _track_task(self, task_id: str) -> asyncio.Future:
+        """Return a future that resolves with the task's final status"""
+        future = asyncio.get_running_loop().create_future()
+        self._task_futures[task_id] = future
         
-        3. Policy Implications:
-           - Potential policy responses
-           - Expected effectiveness
-           - Implementation challenges
+        # The task may have finished before the future was registered
+        status = await self.task_queue.get_task_status(task_id)
+        if status and status["status"] in _FINISHED_TASK_STATUSES and not future.done():
+            future.set_result(status)
         
-        4. Research Priorities:
-           - Areas requiring deeper investigation
-           - Data collection needs
-           - Methodological considerations
+        return future
+    
+    async def _on_task_finished(self, task: Task):
+        """Task queue callback resolving the completion future for a task"""
+        # Cancelled tasks say nothing about the model's health
+        if task.assigned_model and task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
+            self.orchestrator.record_request_outcome(
+                task.assigned_model, task.status == TaskStatus.COMPLETED
+            )
         
-        Format as structured JSON with confidence scores for each hypothesis.
-        """
+        future = self._task_futures.get(task.id)
+        if future and not future.done():
+            future.set_result(await self.task_queue.get_task_status(task.id))
     
     async def _process_analyses(self):
         """Background task to process analysis workflows"""
@@ -534,25 +790,27 @@ class AICoordinator:
         
         while not self._stop_event.is_set():
             try:
-                # This is where you'd implement the main analysis processing loop
-                # For now, just a placeholder that monitors active analyses
+                task_id = await self._finished_analyses.get()
+                status = self._task_futures.pop(task_id).result()
+                request = self.active_analyses.get(task_id)
                 
-                for task_id, request in list(self.active_analyses.items()):
-                    status = await self.task_queue.get_task_status(task_id)
-                    
-                    if status and status["status"] == "completed":
-                        # Process completed analysis
-                        await self._handle_completed_analysis(task_id, request, status)
-                    elif status and status["status"] in ["failed", "timeout"]:
-                        # Handle failed analysis
-                        await self._handle_failed_analysis(task_id, request, status)
+                if request is None:
+                    # Cancelled through cancel_analysis
+                    continue
                 
-                await asyncio.sleep(5)  # Check every 5 seconds
+                # Handlers run as background tasks, so an analysis waiting
+                # on verification doesn't hold up the ones finishing after it
+                if status["status"] == "completed":
+                    # Process completed analysis
+                    self._spawn(self._handle_completed_analysis(task_id, request, status))
+                else:
+                    # Handle failed analysis
+                    self._spawn(self._handle_failed_analysis(task_id, request, status))
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Analysis processor error: {e}")
+                logger.error("Analysis processor error: %s", e)
                 await asyncio.sleep(10)
         
         logger.info("Analysis processor stopped")
@@ -561,28 +819,43 @@ class AICoordinator:
         """Background task to monitor system health"""
         logger.info("Started system monitor")
         
+        # Deadlines on the monotonic clock; the first pass logs and checks
+        next_perf_log = next_health_check = time.monotonic()
+        
         while not self._stop_event.is_set():
             try:
-                # Monitor system performance and health
-                performance = await self.get_system_performance()
-                
-                # Log system status periodically
-                if int(time.time()) % 300 == 0:  # Every 5 minutes
-                    logger.info(
-                        f"System status - Active analyses: {performance['ai_coordinator']['active_analyses']}, "
-                        f"Queue size: {performance['task_queue']['pending_tasks']}, "
-                        f"Memory usage: {performance['memory_manager']['system_memory']['utilization']:.1%}"
-                    )
+                now = time.monotonic()
+                need_log = now >= next_perf_log
+                need_health_check = now >= next_health_check
                 
-                # Check for system issues and alerts
-                await self._check_system_health(performance)
+                if need_log or need_health_check:
+                    # Monitor system performance and health
+                    performance = await self.get_system_performance()
+                    
+                    # Log system status periodically
+                    if need_log:
+                        next_perf_log = now + _PERF_LOG_INTERVAL_SECONDS
+                        if logger.isEnabledFor(logging.INFO):
+                            # A failed subsystem reports an error in place of its stats
+                            logger.info(
+                                "System status - Active analyses: %d, Queue size: %s, Memory usage: %.1f%%",
+                                performance['ai_coordinator']['active_analyses'],
+                                performance['task_queue'].get('pending_tasks', "unknown"),
+                                performance['memory_manager']['system_memory']['utilization'] * 100
+                            )
+                    
+                    # Check for system issues and alerts
+                    if need_health_check:
+                        next_health_check = now + _HEALTH_CHECK_INTERVAL_SECONDS
+                        await self._check_system_health(performance)
                 
-                await asyncio.sleep(30)  # Monitor every 30 seconds
+                # Sleep until whichever deadline comes first
+                await asyncio.sleep(max(0.0, min(next_perf_log, next_health_check) - time.monotonic()))
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"System monitor error: {e}")
+                logger.error("System monitor error: %s", e)
                 await asyncio.sleep(60)
         
         logger.info("System monitor stopped")
@@ -630,10 +903,10 @@ class AICoordinator:
             self.performance_metrics["successful_analyses"] += 1
             self._update_average_processing_time(result.processing_time)
             
-            logger.info(f"Completed analysis {task_id} with confidence score {result.confidence_score:.2f}")
+            logger.info("Completed analysis %s with confidence score %.2f", task_id, result.confidence_score)
             
         except Exception as e:
-            logger.error(f"Error handling completed analysis {task_id}: {e}")
+            logger.error("Error handling completed analysis %s: %s", task_id, e)
     
     async def _handle_failed_analysis(self, 
                                     task_id: str, 
@@ -648,7 +921,7 @@ class AICoordinator:
         self.performance_metrics["total_analyses"] += 1
         self.performance_metrics["failed_analyses"] += 1
         
-        logger.warning(f"Analysis {task_id} failed: {status.get('error', 'Unknown error')}")
+        logger.warning("Analysis %s failed: %s", task_id, status.get('error', 'Unknown error'))
     
     def _calculate_confidence_score(self, 
                                   primary_result: Any,
@@ -659,15 +932,14 @@ class AICoordinator:
         
         # This is a simplified confidence calculation
         # In practice, you'd implement sophisticated consensus algorithms
-        consensus_count = 0
-        total_verifications = len(verification_results)
-        
-        for verification in verification_results:
-            # Simplified - assume verification results have consensus indicators
-            if isinstance(verification, dict) and verification.get("consensus", False):
-                consensus_count += 1
-        
-        consensus_ratio = consensus_count / total_verifications if total_verifications > 0 else 0
+        # Simplified - assume verification results have consensus indicators
+        consensus_flags = np.fromiter(
+            (isinstance(verification, dict) and bool(verification.get("consensus", False))
+             for verification in verification_results),
+            dtype=np.uint8,
+            count=len(verification_results)
+        )
+        consensus_ratio = np.count_nonzero(consensus_flags) / consensus_flags.size
         
         # Apply consensus threshold
         if consensus_ratio >= self.consensus_threshold:
@@ -675,37 +947,33 @@ class AICoordinator:
         else:
             return max(0.1, consensus_ratio * 0.7)  # 0.1-0.7 range
     
-    def _update_average_processing_time(self, processing_time: float):
-        """Update average processing time metric"""
-        total_successful = self.performance_metrics["successful_analyses"]
-        current_avg = self.performance_metrics["average_processing_time"]
-        
-        if total_successful == 1:
-            self.performance_metrics["average_processing_time"] = processing_time
-        else:
-            # Running average calculation
-            self.performance_metrics["average_processing_time"] = (
-                (current_avg * (total_successful - 1) + processing_time) / total_successful
-            )
+    def _update_average_processing_time(self, processing_time: Optional[float]):
+        """Accumulate a processing time; the average is derived when metrics are read"""
+        if processing_time is None:
+            return
+        self._processing_time_sum += processing_time
+        self._processing_time_count += 1
     
     async def _check_system_health(self, performance: Dict[str, Any]):
         """Check system health and trigger alerts if needed"""
         # Memory usage check
         memory_util = performance["memory_manager"]["system_memory"]["utilization"]
         if memory_util > 0.9:
-            logger.warning(f"High memory usage detected: {memory_util:.1%}")
+            logger.warning("High memory usage detected: %.1f%%", memory_util * 100)
         
-        # Queue backlog check
-        pending_tasks = performance["task_queue"]["pending_tasks"]
+        # Queue backlog check, skipped when the queue stats are unavailable
+        pending_tasks = performance["task_queue"].get("pending_tasks", 0)
         if pending_tasks > 1000:
-            logger.warning(f"Large task queue backlog: {pending_tasks} pending tasks")
+            logger.warning("Large task queue backlog: %d pending tasks", pending_tasks)
         
         # Model health check
         models = performance["model_orchestrator"]["models"]
-        unhealthy_models = [
-            model for model in models 
-            if model.get("health_score", 1.0) < 0.5
-        ]
+        health_scores = np.fromiter(
+            (model.get("health_score", 1.0) for model in models),
+            dtype=np.float64,
+            count=len(models)
+        )
+        unhealthy = np.flatnonzero(health_scores < 0.5)
         
-        if unhealthy_models:
-            logger.warning(f"Unhealthy models detected: {[m['name'] for m in unhealthy_models]}")
\ No newline at end of file
+        if unhealthy.size:
+            logger.warning("Unhealthy models detected: %s", [models[i]['name'] for i in unhealthy])
\ No newline at end of file
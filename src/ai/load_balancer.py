@@ -5,20 +5,69 @@ Intelligently distributes tasks across available models based on capabilities,
 current load, performance metrics, and resource utilization.
 """
 
-import asyncio
+import bisect
 import logging
+import random
 import time
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-import statistics
 from collections import defaultdict, deque
 
+import numpy as np
+from numba import njit
+
 from .model_orchestrator import ModelOrchestrator, ModelPriority, ModelStatus
 from .task_queue import TaskType, TaskPriority
 
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent requests per model
+_MODEL_CAPACITY: Dict[str, int] = {
+    "qwen_32b_primary": 2,
+    "llama_70b_verification": 1,
+    "qwen_7b_specialized": 3
+}
+
+# Capability score per (model, task type); unlisted pairs score 0.6
+_MODEL_CAPABILITY: Dict[Tuple[str, TaskType], float] = {
+    (model_name, task_type): score
+    for model_name, row in {
+        "qwen_32b_primary": {
+            TaskType.HYPOTHESIS_GENERATION: 0.9,
+            TaskType.DATA_ANALYSIS: 0.9,
+            TaskType.POLICY_ANALYSIS: 0.8,
+            TaskType.FORECASTING: 0.8,
+            TaskType.RESEARCH_SYNTHESIS: 0.9,
+        },
+        "llama_70b_verification": {
+            TaskType.VERIFICATION: 0.95,
+            TaskType.DATA_ANALYSIS: 0.8,
+            TaskType.RESEARCH_SYNTHESIS: 0.85,
+        },
+        "qwen_7b_specialized": {
+            TaskType.DATA_ENRICHMENT: 0.9,
+            TaskType.ANOMALY_DETECTION: 0.8,
+            TaskType.REPORT_GENERATION: 0.7,
+        }
+    }.items()
+    for task_type, score in row.items()
+}
+
+
+@njit(cache=True)
+def _score_rows(features: np.ndarray, weights: np.ndarray,
+                capability: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Weighted feature sum scaled by task capability for the given rows, capped at 1"""
+    scores = np.empty(rows.shape[0])
+    for i in range(rows.shape[0]):
+        row = rows[i]
+        total = 0.0
+        for k in range(weights.shape[0]):
+            total += features[row, k] * weights[k]
+        scores[i] = min(1.0, total * capability[row])
+    return scores
+
 
 class LoadBalancingStrategy(Enum):
     """Load balancing strategies"""
@@ -30,7 +79,7 @@ class LoadBalancingStrategy(Enum):
     INTELLIGENT = "intelligent"  # AI-driven load balancing
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelMetrics:
     """Performance metrics for a model"""
     model_name: str
@@ -40,17 +89,29 @@ class ModelMetrics:
     failed_requests: int = 0
     average_response_time: float = 0.0
     response_times: deque = field(default_factory=lambda: deque(maxlen=100))
-    error_rate: float = 0.0
-    throughput_per_minute: float = 0.0
     resource_efficiency: float = 1.0
     health_score: float = 1.0
-    last_request_time: float = field(default_factory=time.time)
+    last_request_time: float = field(default_factory=time.monotonic)  # monotonic clock
+    _response_time_sum: float = field(default=0.0, repr=False)
     
     def update_response_time(self, response_time: float):
         """Update response time metrics"""
+        # Keep a running sum over the window instead of re-averaging it
+        if len(self.response_times) == self.response_times.maxlen:
+            self._response_time_sum -= self.response_times[0]
         self.response_times.append(response_time)
-        if self.response_times:
-            self.average_response_time = statistics.mean(self.response_times)
+        self._response_time_sum += response_time
+        self.average_response_time = self._response_time_sum / len(self.response_times)
+    
+    @property
+    def error_rate(self) -> float:
+        """Current error rate, derived from the request counters"""
+        return self.calculate_error_rate()
+    
+    @property
+    def throughput_per_minute(self) -> float:
+        """Current throughput, derived from the request counters"""
+        return self.calculate_throughput()
     
     def calculate_error_rate(self) -> float:
         """Calculate current error rate"""
@@ -60,7 +121,7 @@ class ModelMetrics:
     
     def calculate_throughput(self, time_window: float = 300) -> float:
         """Calculate throughput in requests per minute"""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_request_time > time_window:
             return 0.0
         
@@ -69,7 +130,67 @@ class ModelMetrics:
         return self.successful_requests / time_minutes if time_minutes > 0 else 0.0
 
 
-@dataclass
+class ResponseTimeWindow:
+    """
+    Sliding window of recent response times with incrementally maintained
+    statistics
+    
+    Failed tasks are recorded as infinite times. They count towards the
+    window size and success rate, but not towards the time statistics.
+    """
+    
+    def __init__(self, maxlen: int = 50):
+        self.samples: deque = deque(maxlen=maxlen)
+        self._sorted_valid: List[float] = []
+        self._valid_sum = 0.0
+    
+    def append(self, response_time: float):
+        """Add a response time, evicting the oldest once the window is full"""
+        if len(self.samples) == self.samples.maxlen:
+            self._discard(self.samples[0])
+        self.samples.append(response_time)
+        if response_time != float('inf'):
+            bisect.insort(self._sorted_valid, response_time)
+            self._valid_sum += response_time
+    
+    def _discard(self, response_time: float):
+        if response_time != float('inf'):
+            del self._sorted_valid[bisect.bisect_left(self._sorted_valid, response_time)]
+            self._valid_sum -= response_time
+    
+    def __len__(self) -> int:
+        return len(self.samples)
+    
+    def __iter__(self):
+        return iter(self.samples)
+    
+    @property
+    def valid_count(self) -> int:
+        """Number of successful samples in the window"""
+        return len(self._sorted_valid)
+    
+    @property
+    def mean(self) -> float:
+        return self._valid_sum / len(self._sorted_valid)
+    
+    @property
+    def median(self) -> float:
+        valid = self._sorted_valid
+        middle = len(valid) // 2
+        if len(valid) % 2:
+            return valid[middle]
+        return (valid[middle - 1] + valid[middle]) / 2
+    
+    @property
+    def min(self) -> float:
+        return self._sorted_valid[0]
+    
+    @property
+    def max(self) -> float:
+        return self._sorted_valid[-1]
+
+
+@dataclass(slots=True)
 class LoadBalancingDecision:
     """Result of load balancing decision"""
     selected_model: str
@@ -107,16 +228,12 @@ class LoadBalancer:
         self.model_metrics: Dict[str, ModelMetrics] = {}
         self.round_robin_index = 0
         
-        # Task-model affinity tracking
-        self.task_model_performance: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+        # Task-model affinity tracking, keeping the 50 most recent times
+        self.task_model_performance: Dict[Tuple[str, str], ResponseTimeWindow] = defaultdict(ResponseTimeWindow)
         
         # Load balancing weights for weighted strategies
         self.model_weights: Dict[str, float] = {}
         
-        # Performance tracking
-        self._performance_lock = asyncio.Lock()
-        self._metrics_update_task: Optional[asyncio.Task] = None
-        
         # Configuration
         self.config = {
             "response_time_weight": 0.3,
@@ -126,26 +243,161 @@ class LoadBalancer:
             "resource_weight": 0.1,
             "min_requests_for_stats": 5,
             "performance_window": 300,  # 5 minutes
-            "adaptive_weight_adjustment": True
+            "adaptive_weight_adjustment": True,
+            "status_cache_ttl": 0.25  # seconds
         }
         
+        # Orchestrator status snapshot shared by dispatches within the TTL
+        self._status_cache: List[Dict[str, Any]] = []
+        self._status_cache_ts = float("-inf")
+        # Models with spare capacity in that snapshot, as a list and by name
+        self._ready_models: List[Dict[str, Any]] = []
+        self._ready_by_name: Dict[str, Dict[str, Any]] = {}
+        
+        # Scoring features, one row per known model (structure of arrays):
+        # response time, error rate, load, health and resource efficiency
+        # scores, combined by the matching config weights
+        self._model_index: Dict[str, int] = {}
+        self._features = np.zeros((0, 5), dtype=np.float64)
+        self._feature_weights = np.array([
+            self.config["response_time_weight"],
+            self.config["error_rate_weight"],
+            self.config["load_weight"],
+            self.config["health_weight"],
+            self.config["resource_weight"],
+        ], dtype=np.float64)
+        self._capability_vectors: Dict[TaskType, np.ndarray] = {}
+        # Raw per-model values behind the system load figures, in row order
+        self._capacities = np.zeros(0, dtype=np.int64)
+        self._loads = np.zeros(0, dtype=np.int64)
+        self._avg_response_times = np.zeros(0, dtype=np.float64)
+        
         logger.info(f"LoadBalancer initialized with strategy: {strategy.value}")
     
     async def start(self):
-        """Start the load balancer background tasks"""
+        """Start the load balancer"""
         logger.info("Starting LoadBalancer")
-        self._metrics_update_task = asyncio.create_task(self._update_metrics_periodically())
         await self._initialize_model_metrics()
+        # Health changes are pushed by the orchestrator rather than polled
+        self.orchestrator.register_health_callback(self._on_health_update)
     
     async def stop(self):
         """Stop the load balancer"""
         logger.info("Stopping LoadBalancer")
-        if self._metrics_update_task:
-            self._metrics_update_task.cancel()
-            try:
-                await self._metrics_update_task
-            except asyncio.CancelledError:
-                pass
+    
+    @property
+    def strategy(self) -> LoadBalancingStrategy:
+        """Load balancing strategy in use"""
+        return self._strategy
+    
+    @strategy.setter
+    def strategy(self, strategy: LoadBalancingStrategy):
+        # Resolve the selection method once rather than on every dispatch
+        self._strategy = strategy
+        selectors = {
+            LoadBalancingStrategy.INTELLIGENT: self._intelligent_selection,
+            LoadBalancingStrategy.PERFORMANCE_BASED:
+                lambda models, task_type, priority, context:
+                    self._performance_based_selection(models, task_type, priority),
+            LoadBalancingStrategy.RESOURCE_AWARE:
+                lambda models, task_type, priority, context:
+                    self._resource_aware_selection(models, task_type, priority),
+            LoadBalancingStrategy.LEAST_CONNECTIONS:
+                lambda models, task_type, priority, context:
+                    self._least_connections_selection(models, task_type),
+            LoadBalancingStrategy.WEIGHTED_ROUND_ROBIN:
+                lambda models, task_type, priority, context:
+                    self._weighted_round_robin_selection(models, task_type),
+        }
+        self._selector = selectors.get(
+            strategy,
+            lambda models, task_type, priority, context: self._round_robin_selection(models, task_type)
+        )
+    
+    def _get_metrics(self, model_name: str) -> ModelMetrics:
+        """Get metrics for a model, registering it on first use"""
+        metrics = self.model_metrics.get(model_name)
+        if metrics is None:
+            metrics = self.model_metrics[model_name] = ModelMetrics(model_name=model_name)
+            self._model_index[model_name] = len(self._features)
+            self._features = np.vstack([self._features, np.zeros((1, 5))])
+            self._capacities = np.append(self._capacities, self._get_model_capacity(model_name))
+            self._loads = np.append(self._loads, 0)
+            self._avg_response_times = np.append(self._avg_response_times, 0.0)
+            self._capability_vectors.clear()
+            self._update_features(model_name)
+        return metrics
+    
+    def _update_features(self, model_name: str):
+        """Recompute the scoring feature row for a model from its metrics"""
+        metrics = self.model_metrics[model_name]
+        
+        # Response time factor (lower is better), normalized to 2 minutes
+        if metrics.average_response_time > 0:
+            response_time_score = max(0, 1.0 - (metrics.average_response_time / 120))
+        else:
+            response_time_score = 0.5
+        
+        # Load factor (lower load is better)
+        max_capacity = self._get_model_capacity(model_name)
+        load_ratio = metrics.current_load / max_capacity if max_capacity > 0 else 1.0
+        
+        row = self._model_index[model_name]
+        self._loads[row] = metrics.current_load
+        self._avg_response_times[row] = metrics.average_response_time
+        self._features[row] = (
+            response_time_score,
+            1.0 - metrics.error_rate,
+            max(0, 1.0 - load_ratio),
+            metrics.health_score,
+            metrics.resource_efficiency,
+        )
+    
+    def _capability_vector(self, task_type: TaskType) -> np.ndarray:
+        """Capability scores for a task type, aligned with the feature rows"""
+        vector = self._capability_vectors.get(task_type)
+        if vector is None:
+            vector = np.array(
+                [self._get_model_capability_score(name, task_type) for name in self._model_index],
+                dtype=np.float64
+            )
+            self._capability_vectors[task_type] = vector
+        return vector
+    
+    def _score_models(self, model_names: List[str], task_type: TaskType) -> np.ndarray:
+        """Score the given models in one vectorized pass"""
+        indices = np.array([self._model_index.get(name, -1) for name in model_names], dtype=np.intp)
+        known = indices >= 0
+        
+        scores = np.full(len(model_names), 0.5)  # Default score for unknown models
+        scores[known] = _score_rows(
+            self._features, self._feature_weights, self._capability_vector(task_type), indices[known]
+        )
+        return scores
+    
+    async def _get_status_list(self) -> List[Dict[str, Any]]:
+        """Get all model statuses, reusing a snapshot younger than the cache TTL"""
+        if time.monotonic() - self._status_cache_ts >= self.config["status_cache_ttl"]:
+            # Without a model name the orchestrator always returns a list
+            model_status = await self.orchestrator.get_model_status()
+            self._status_cache = model_status
+            self._status_cache_ts = time.monotonic()
+            self._ready_models = [
+                model for model in model_status
+                if model["status"] == ModelStatus.READY.value and
+                   model["current_requests"] < self._get_model_capacity(model["name"])
+            ]
+            self._ready_by_name = {model["name"]: model for model in self._ready_models}
+        return self._status_cache
+    
+    def _invalidate_status_cache(self):
+        """Force the next dispatch to re-read model status"""
+        self._status_cache_ts = float("-inf")
+    
+    def _has_spare_capacity(self, model_name: str) -> bool:
+        """Whether the live load tracked here leaves room for another task"""
+        metrics = self.model_metrics.get(model_name)
+        return metrics is None or metrics.current_load < self._get_model_capacity(model_name)
     
     async def select_model(self, 
                           task_type: TaskType,
@@ -165,14 +417,10 @@ class LoadBalancer:
             LoadBalancingDecision with selected model and reasoning
         """
         # Get available models
-        model_status = await self.orchestrator.get_model_status()
-        if isinstance(model_status, dict):
-            model_status = [model_status]
-        
+        await self._get_status_list()
+        # The snapshot may predate assignments made since it was taken
         available_models = [
-            model for model in model_status 
-            if model["status"] == ModelStatus.READY.value and 
-               model["current_requests"] < self._get_model_capacity(model["name"])
+            model for model in self._ready_models if self._has_spare_capacity(model["name"])
         ]
         
         if not available_models:
@@ -180,33 +428,19 @@ class LoadBalancer:
             return None
         
         # If preferred model is available and suitable, use it
-        if preferred_model:
-            preferred_available = next(
-                (model for model in available_models if model["name"] == preferred_model), 
-                None
+        if (preferred_model in self._ready_by_name and
+            self._has_spare_capacity(preferred_model) and
+            self._is_model_suitable(preferred_model, task_type)):
+            return LoadBalancingDecision(
+                selected_model=preferred_model,
+                confidence=0.9,
+                reasoning="Preferred model specified and available",
+                estimated_wait_time=0.0,
+                estimated_processing_time=self._estimate_processing_time(preferred_model, task_type)
             )
-            if preferred_available and self._is_model_suitable(preferred_model, task_type):
-                return LoadBalancingDecision(
-                    selected_model=preferred_model,
-                    confidence=0.9,
-                    reasoning="Preferred model specified and available",
-                    estimated_wait_time=0.0,
-                    estimated_processing_time=self._estimate_processing_time(preferred_model, task_type)
-                )
         
         # Apply load balancing strategy
-        if self.strategy == LoadBalancingStrategy.INTELLIGENT:
-            return await self._intelligent_selection(available_models, task_type, priority, context)
-        elif self.strategy == LoadBalancingStrategy.PERFORMANCE_BASED:
-            return await self._performance_based_selection(available_models, task_type, priority)
-        elif self.strategy == LoadBalancingStrategy.RESOURCE_AWARE:
-            return await self._resource_aware_selection(available_models, task_type, priority)
-        elif self.strategy == LoadBalancingStrategy.LEAST_CONNECTIONS:
-            return await self._least_connections_selection(available_models, task_type)
-        elif self.strategy == LoadBalancingStrategy.WEIGHTED_ROUND_ROBIN:
-            return await self._weighted_round_robin_selection(available_models, task_type)
-        else:  # ROUND_ROBIN
-            return await self._round_robin_selection(available_models, task_type)
+        return self._selector(available_models, task_type, priority, context)
     
     async def record_task_completion(self, 
                                    model_name: str, 
@@ -222,109 +456,99 @@ class LoadBalancer:
             response_time: Time taken to process the task
             success: Whether the task completed successfully
         """
-        async with self._performance_lock:
-            if model_name not in self.model_metrics:
-                self.model_metrics[model_name] = ModelMetrics(model_name=model_name)
-            
-            metrics = self.model_metrics[model_name]
-            metrics.total_requests += 1
-            metrics.current_load = max(0, metrics.current_load - 1)
-            
-            if success:
-                metrics.successful_requests += 1
-                metrics.update_response_time(response_time)
-            else:
-                metrics.failed_requests += 1
-            
-            metrics.error_rate = metrics.calculate_error_rate()
-            metrics.throughput_per_minute = metrics.calculate_throughput()
-            metrics.last_request_time = time.time()
-            
-            # Update task-model performance tracking
-            task_model_key = (task_type.value, model_name)
-            self.task_model_performance[task_model_key].append(response_time if success else float('inf'))
-            
-            # Keep only recent performance data
-            if len(self.task_model_performance[task_model_key]) > 50:
-                self.task_model_performance[task_model_key] = \
-                    self.task_model_performance[task_model_key][-50:]
+        metrics = self._get_metrics(model_name)
+        metrics.total_requests += 1
+        metrics.current_load = max(0, metrics.current_load - 1)
+        
+        if success:
+            metrics.successful_requests += 1
+            metrics.update_response_time(response_time)
+        else:
+            metrics.failed_requests += 1
+        
+        metrics.last_request_time = time.monotonic()
+        self._update_features(model_name)
+        self._invalidate_status_cache()
+        
+        # Update task-model performance tracking
+        task_model_key = (task_type.value, model_name)
+        self.task_model_performance[task_model_key].append(response_time if success else float('inf'))
     
     async def record_task_assignment(self, model_name: str):
         """Record that a task has been assigned to a model"""
-        async with self._performance_lock:
-            if model_name not in self.model_metrics:
-                self.model_metrics[model_name] = ModelMetrics(model_name=model_name)
-            
-            self.model_metrics[model_name].current_load += 1
+        self._get_metrics(model_name).current_load += 1
+        self._update_features(model_name)
+        self._invalidate_status_cache()
     
     async def get_load_balancing_stats(self) -> Dict[str, Any]:
         """Get comprehensive load balancing statistics"""
-        async with self._performance_lock:
-            stats = {
-                "strategy": self.strategy.value,
-                "total_models": len(self.model_metrics),
-                "model_metrics": {},
-                "task_model_performance": {},
-                "system_load": await self._calculate_system_load()
+        stats = {
+            "strategy": self.strategy.value,
+            "total_models": len(self.model_metrics),
+            "model_metrics": {},
+            "task_model_performance": {},
+            "system_load": self._calculate_system_load()
+        }
+        
+        # Model-specific metrics
+        for model_name, metrics in self.model_metrics.items():
+            stats["model_metrics"][model_name] = {
+                "current_load": metrics.current_load,
+                "total_requests": metrics.total_requests,
+                "success_rate": (metrics.successful_requests / metrics.total_requests 
+                               if metrics.total_requests > 0 else 0.0),
+                "error_rate": metrics.error_rate,
+                "average_response_time": metrics.average_response_time,
+                "throughput_per_minute": metrics.throughput_per_minute,
+                "health_score": metrics.health_score,
+                "resource_efficiency": metrics.resource_efficiency
             }
-            
-            # Model-specific metrics
-            for model_name, metrics in self.model_metrics.items():
-                stats["model_metrics"][model_name] = {
-                    "current_load": metrics.current_load,
-                    "total_requests": metrics.total_requests,
-                    "success_rate": (metrics.successful_requests / metrics.total_requests 
-                                   if metrics.total_requests > 0 else 0.0),
-                    "error_rate": metrics.error_rate,
-                    "average_response_time": metrics.average_response_time,
-                    "throughput_per_minute": metrics.throughput_per_minute,
-                    "health_score": metrics.health_score,
-                    "resource_efficiency": metrics.resource_efficiency
-                }
-            
-            # Task-model performance
-            for (task_type, model_name), times in self.task_model_performance.items():
-                if len(times) >= self.config["min_requests_for_stats"]:
-                    valid_times = [t for t in times if t != float('inf')]
-                    if valid_times:
-                        stats["task_model_performance"][f"{task_type}_{model_name}"] = {
-                            "average_time": statistics.mean(valid_times),
-                            "median_time": statistics.median(valid_times),
-                            "min_time": min(valid_times),
-                            "max_time": max(valid_times),
-                            "sample_size": len(valid_times),
-                            "success_rate": len(valid_times) / len(times)
-                        }
-            
-            return stats
+        
+        # Task-model performance
+        for (task_type, model_name), times in self.task_model_performance.items():
+            if len(times) >= self.config["min_requests_for_stats"]:
+                if times.valid_count:
+                    stats["task_model_performance"][f"{task_type}_{model_name}"] = {
+                        "average_time": times.mean,
+                        "median_time": times.median,
+                        "min_time": times.min,
+                        "max_time": times.max,
+                        "sample_size": times.valid_count,
+                        "success_rate": times.valid_count / len(times)
+                    }
+        
+        return stats
     
-    async def _intelligent_selection(self, 
-                                   available_models: List[Dict[str, Any]], 
-                                   task_type: TaskType,
-                                   priority: TaskPriority,
-                                   context: Optional[Dict[str, Any]]) -> LoadBalancingDecision:
+    def _intelligent_selection(self, 
+                             available_models: List[Dict[str, Any]], 
+                             task_type: TaskType,
+                             priority: TaskPriority,
+                             context: Optional[Dict[str, Any]]) -> LoadBalancingDecision:
         """
         Intelligent model selection using multiple factors
         """
-        model_scores = []
-        
-        for model_info in available_models:
-            model_name = model_info["name"]
-            
-            if not self._is_model_suitable(model_name, task_type):
-                continue
-            
-            score = await self._calculate_model_score(model_name, task_type, priority, context)
-            model_scores.append((model_name, score, self._get_score_reasoning(model_name, score)))
+        model_names = [
+            model_info["name"] for model_info in available_models
+            if self._is_model_suitable(model_info["name"], task_type)
+        ]
         
-        if not model_scores:
+        if not model_names:
             return None
         
-        # Sort by score (highest first)
-        model_scores.sort(key=lambda x: x[1], reverse=True)
+        # Top three scores without sorting the whole fleet: partition out
+        # everything scoring at least the third best, then order just those.
+        # The stable sort keeps ties in model order.
+        scores = self._score_models(model_names, task_type)
+        if len(scores) > 3:
+            candidates = np.flatnonzero(scores >= np.partition(scores, -3)[-3])
+        else:
+            candidates = np.arange(len(scores))
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")][:3]
         
-        selected_model, best_score, reasoning = model_scores[0]
-        alternatives = [model for model, _, _ in model_scores[1:3]]  # Top 2 alternatives
+        selected_model = model_names[ranked[0]]
+        best_score = float(scores[ranked[0]])
+        reasoning = self._get_score_reasoning(selected_model, best_score)
+        alternatives = [model_names[i] for i in ranked[1:]]  # Top 2 alternatives
         
         return LoadBalancingDecision(
             selected_model=selected_model,
@@ -335,10 +559,10 @@ class LoadBalancer:
             estimated_processing_time=self._estimate_processing_time(selected_model, task_type)
         )
     
-    async def _performance_based_selection(self, 
-                                         available_models: List[Dict[str, Any]], 
-                                         task_type: TaskType,
-                                         priority: TaskPriority) -> LoadBalancingDecision:
+    def _performance_based_selection(self, 
+                                   available_models: List[Dict[str, Any]], 
+                                   task_type: TaskType,
+                                   priority: TaskPriority) -> LoadBalancingDecision:
         """
         Select model based on historical performance for similar tasks
         """
@@ -355,17 +579,16 @@ class LoadBalancer:
             task_model_key = (task_type.value, model_name)
             if task_model_key in self.task_model_performance:
                 times = self.task_model_performance[task_model_key]
-                valid_times = [t for t in times if t != float('inf')]
                 
-                if len(valid_times) >= self.config["min_requests_for_stats"]:
-                    avg_time = statistics.mean(valid_times)
+                if times.valid_count >= self.config["min_requests_for_stats"]:
+                    avg_time = times.mean
                     if avg_time < best_performance:
                         best_performance = avg_time
                         best_model = model_name
         
         # If no historical data, fall back to least connections
         if not best_model:
-            return await self._least_connections_selection(available_models, task_type)
+            return self._least_connections_selection(available_models, task_type)
         
         return LoadBalancingDecision(
             selected_model=best_model,
@@ -374,10 +597,10 @@ class LoadBalancer:
             estimated_processing_time=best_performance
         )
     
-    async def _resource_aware_selection(self, 
-                                      available_models: List[Dict[str, Any]], 
-                                      task_type: TaskType,
-                                      priority: TaskPriority) -> LoadBalancingDecision:
+    def _resource_aware_selection(self, 
+                                available_models: List[Dict[str, Any]], 
+                                task_type: TaskType,
+                                priority: TaskPriority) -> LoadBalancingDecision:
         """
         Select model based on current resource utilization
         """
@@ -413,11 +636,14 @@ class LoadBalancer:
             estimated_wait_time=self._estimate_wait_time(best_model)
         )
     
-    async def _least_connections_selection(self, 
-                                         available_models: List[Dict[str, Any]], 
-                                         task_type: TaskType) -> LoadBalancingDecision:
+    def _least_connections_selection(self, 
+                                   available_models: List[Dict[str, Any]], 
+                                   task_type: TaskType) -> LoadBalancingDecision:
         """
         Select model with least current connections
+        
+        Samples two suitable models and takes the less loaded one, which
+        keeps tail latency close to a full scan without sorting the fleet.
         """
         suitable_models = [
             model for model in available_models 
@@ -427,11 +653,12 @@ class LoadBalancer:
         if not suitable_models:
             return None
         
-        # Sort by current load (ascending)
-        suitable_models.sort(key=lambda x: x["current_requests"])
+        # Power of two choices: the less loaded of two random candidates
+        candidates = random.sample(suitable_models, min(2, len(suitable_models)))
+        least_loaded = min(candidates, key=lambda x: x["current_requests"])
         
-        selected_model = suitable_models[0]["name"]
-        current_load = suitable_models[0]["current_requests"]
+        selected_model = least_loaded["name"]
+        current_load = least_loaded["current_requests"]
         
         return LoadBalancingDecision(
             selected_model=selected_model,
@@ -440,9 +667,9 @@ class LoadBalancer:
             estimated_wait_time=current_load * 30  # Rough estimate
         )
     
-    async def _weighted_round_robin_selection(self, 
-                                            available_models: List[Dict[str, Any]], 
-                                            task_type: TaskType) -> LoadBalancingDecision:
+    def _weighted_round_robin_selection(self, 
+                                      available_models: List[Dict[str, Any]], 
+                                      task_type: TaskType) -> LoadBalancingDecision:
         """
         Weighted round robin selection based on model capabilities
         """
@@ -455,13 +682,13 @@ class LoadBalancer:
             return None
         
         # Calculate weights if not already done
-        await self._update_model_weights(suitable_models, task_type)
+        self._update_model_weights(suitable_models, task_type)
         
         # Select based on weighted round robin
         total_weight = sum(self.model_weights.get(model["name"], 1.0) for model in suitable_models)
         
         if total_weight == 0:
-            return await self._round_robin_selection(available_models, task_type)
+            return self._round_robin_selection(available_models, task_type)
         
         # This is a simplified implementation - full weighted round robin would maintain state
         weights = [(model["name"], self.model_weights.get(model["name"], 1.0) / total_weight) 
@@ -478,9 +705,9 @@ class LoadBalancer:
             estimated_wait_time=self._estimate_wait_time(selected_model)
         )
     
-    async def _round_robin_selection(self, 
-                                   available_models: List[Dict[str, Any]], 
-                                   task_type: TaskType) -> LoadBalancingDecision:
+    def _round_robin_selection(self, 
+                             available_models: List[Dict[str, Any]], 
+                             task_type: TaskType) -> LoadBalancingDecision:
         """
         Simple round robin selection
         """
@@ -503,48 +730,15 @@ class LoadBalancer:
             estimated_wait_time=self._estimate_wait_time(selected_model)
         )
     
-    async def _calculate_model_score(self, 
-                                   model_name: str, 
-                                   task_type: TaskType,
-                                   priority: TaskPriority,
-                                   context: Optional[Dict[str, Any]]) -> float:
+    def _calculate_model_score(self, 
+                             model_name: str, 
+                             task_type: TaskType,
+                             priority: TaskPriority,
+                             context: Optional[Dict[str, Any]]) -> float:
         """
         Calculate comprehensive score for model selection
         """
-        if model_name not in self.model_metrics:
-            return 0.5  # Default score for unknown models
-        
-        metrics = self.model_metrics[model_name]
-        score = 0.0
-        
-        # Response time factor (lower is better)
-        if metrics.average_response_time > 0:
-            response_time_score = max(0, 1.0 - (metrics.average_response_time / 120))  # Normalize to 2 minutes
-            score += response_time_score * self.config["response_time_weight"]
-        else:
-            score += 0.5 * self.config["response_time_weight"]
-        
-        # Error rate factor (lower is better)
-        error_rate_score = 1.0 - metrics.error_rate
-        score += error_rate_score * self.config["error_rate_weight"]
-        
-        # Load factor (lower load is better)
-        max_capacity = self._get_model_capacity(model_name)
-        load_ratio = metrics.current_load / max_capacity if max_capacity > 0 else 1.0
-        load_score = max(0, 1.0 - load_ratio)
-        score += load_score * self.config["load_weight"]
-        
-        # Health score
-        score += metrics.health_score * self.config["health_weight"]
-        
-        # Resource efficiency
-        score += metrics.resource_efficiency * self.config["resource_weight"]
-        
-        # Model capability for specific task type
-        capability_score = self._get_model_capability_score(model_name, task_type)
-        score *= capability_score  # Multiply to emphasize capability importance
-        
-        return min(1.0, score)
+        return float(self._score_models([model_name], task_type)[0])
     
     def _is_model_suitable(self, model_name: str, task_type: TaskType) -> bool:
         """Check if a model is suitable for a specific task type"""
@@ -555,38 +749,12 @@ class LoadBalancer:
     def _get_model_capacity(self, model_name: str) -> int:
         """Get maximum concurrent requests for a model"""
         # This would come from model configuration
-        capacity_map = {
-            "qwen_32b_primary": 2,
-            "llama_70b_verification": 1,
-            "qwen_7b_specialized": 3
-        }
-        return capacity_map.get(model_name, 1)
+        return _MODEL_CAPACITY.get(model_name, 1)
     
     def _get_model_capability_score(self, model_name: str, task_type: TaskType) -> float:
         """Get capability score for model-task combination"""
         # This would be based on model specialization and training
-        capability_matrix = {
-            "qwen_32b_primary": {
-                TaskType.HYPOTHESIS_GENERATION: 0.9,
-                TaskType.DATA_ANALYSIS: 0.9,
-                TaskType.POLICY_ANALYSIS: 0.8,
-                TaskType.FORECASTING: 0.8,
-                TaskType.RESEARCH_SYNTHESIS: 0.9,
-            },
-            "llama_70b_verification": {
-                TaskType.VERIFICATION: 0.95,
-                TaskType.DATA_ANALYSIS: 0.8,
-                TaskType.RESEARCH_SYNTHESIS: 0.85,
-            },
-            "qwen_7b_specialized": {
-                TaskType.DATA_ENRICHMENT: 0.9,
-                TaskType.ANOMALY_DETECTION: 0.8,
-                TaskType.REPORT_GENERATION: 0.7,
-            }
-        }
-        
-        model_capabilities = capability_matrix.get(model_name, {})
-        return model_capabilities.get(task_type, 0.6)  # Default capability
+        return _MODEL_CAPABILITY.get((model_name, task_type), 0.6)  # Default capability
     
     def _estimate_wait_time(self, model_name: str) -> float:
         """Estimate wait time for a model"""
@@ -603,10 +771,9 @@ class LoadBalancer:
         
         if task_model_key in self.task_model_performance:
             times = self.task_model_performance[task_model_key]
-            valid_times = [t for t in times if t != float('inf')]
             
-            if len(valid_times) >= 3:
-                return statistics.median(valid_times)
+            if times.valid_count >= 3:
+                return times.median
         
         # Fall back to general model performance
         if model_name in self.model_metrics:
@@ -639,17 +806,15 @@ class LoadBalancer:
     
     async def _initialize_model_metrics(self):
         """Initialize metrics for all known models"""
-        model_status = await self.orchestrator.get_model_status()
-        if isinstance(model_status, dict):
-            model_status = [model_status]
+        model_status = await self._get_status_list()
         
         for model_info in model_status:
             model_name = model_info["name"]
             if model_name not in self.model_metrics:
-                self.model_metrics[model_name] = ModelMetrics(model_name=model_name)
-                self.model_metrics[model_name].health_score = model_info.get("health_score", 1.0)
+                self._get_metrics(model_name).health_score = model_info.get("health_score", 1.0)
+                self._update_features(model_name)
     
-    async def _update_model_weights(self, models: List[Dict[str, Any]], task_type: TaskType):
+    def _update_model_weights(self, models: List[Dict[str, Any]], task_type: TaskType):
         """Update model weights for weighted round robin"""
         for model_info in models:
             model_name = model_info["name"]
@@ -667,40 +832,21 @@ class LoadBalancer:
             
             self.model_weights[model_name] = max(0.1, weight)
     
-    async def _update_metrics_periodically(self):
-        """Background task to update model metrics"""
-        while True:
-            try:
-                await self._update_model_health_scores()
-                await asyncio.sleep(60)  # Update every minute
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error updating metrics: {e}")
-                await asyncio.sleep(30)
-    
-    async def _update_model_health_scores(self):
-        """Update health scores for all models"""
-        model_status = await self.orchestrator.get_model_status()
-        if isinstance(model_status, dict):
-            model_status = [model_status]
-        
-        async with self._performance_lock:
-            for model_info in model_status:
-                model_name = model_info["name"]
-                if model_name in self.model_metrics:
-                    self.model_metrics[model_name].health_score = model_info.get("health_score", 1.0)
-    
-    async def _calculate_system_load(self) -> Dict[str, float]:
+    async def _on_health_update(self, model_name: str, health_score: float):
+        """Apply a health score change pushed by the orchestrator"""
+        # Never awaits, so the update is atomic on the event loop
+        if model_name in self.model_metrics:
+            self.model_metrics[model_name].health_score = health_score
+            self._update_features(model_name)
+            self._invalidate_status_cache()
+    
+    def _calculate_system_load(self) -> Dict[str, float]:
         """Calculate overall system load metrics"""
-        total_requests = sum(metrics.current_load for metrics in self.model_metrics.values())
-        total_capacity = sum(self._get_model_capacity(name) for name in self.model_metrics.keys())
-        
-        avg_response_time = 0.0
-        if self.model_metrics:
-            response_times = [m.average_response_time for m in self.model_metrics.values() if m.average_response_time > 0]
-            if response_times:
-                avg_response_time = statistics.mean(response_times)
+        total_requests = int(self._loads.sum())
+        total_capacity = int(self._capacities.sum())
+        
+        response_times = self._avg_response_times[self._avg_response_times > 0]
+        avg_response_time = float(response_times.mean()) if response_times.size else 0.0
         
         return {
             "utilization_ratio": total_requests / total_capacity if total_capacity > 0 else 0.0,
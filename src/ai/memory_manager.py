@@ -6,27 +6,41 @@ and economic analysis workloads on high-memory systems.
 """
 
 import asyncio
+import ctypes
 import logging
+import platform
 import time
 import gc
 import psutil
 import os
-from typing import Dict, List, Optional, Any, Tuple
+import sys
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import threading
-from collections import defaultdict
-import weakref
+from collections import defaultdict, OrderedDict, deque
+from itertools import count, islice, repeat
+
+import numpy as np
+
+try:
+    import pynvml
+    NVML_AVAILABLE = True
+except ImportError:
+    NVML_AVAILABLE = False
+    logging.warning("pynvml not available - GPU memory monitoring disabled")
 
 try:
-    import GPUtil
-    GPU_AVAILABLE = True
+    from pympler import asizeof
+    PYMPLER_AVAILABLE = True
 except ImportError:
-    GPU_AVAILABLE = False
-    logging.warning("GPUtil not available - GPU memory monitoring disabled")
+    PYMPLER_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Allocation IDs, unique across every pool and manager in the process
+_allocation_ids = count(1)
+
 
 class MemoryType(Enum):
     """Types of memory being managed"""
@@ -47,17 +61,17 @@ class MemoryPriority(Enum):
     DISPOSABLE = 4  # Can be freed immediately under pressure
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryAllocation:
     """Represents a memory allocation"""
-    id: str
+    id: int
     memory_type: MemoryType
     size_bytes: int
     priority: MemoryPriority
     owner: str
     description: str
-    created_at: float = field(default_factory=time.time)
-    last_accessed: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=time.monotonic)  # monotonic clock
+    last_accessed: float = field(default_factory=time.monotonic)
     access_count: int = 0
     is_pinned: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -85,50 +99,325 @@ class MemoryPool:
     def __init__(self, memory_type: MemoryType, max_size_bytes: int):
         self.memory_type = memory_type
         self.max_size_bytes = max_size_bytes
-        self.allocations: Dict[str, MemoryAllocation] = {}
-        self.free_blocks: List[Tuple[int, int]] = []  # (start, size) pairs
+        # Allocation sizes by ID; nothing else about pooled allocations is read
+        self.allocations: Dict[int, int] = {}
         self.total_allocated = 0
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
     
-    def allocate(self, size_bytes: int, owner: str, priority: MemoryPriority) -> Optional[str]:
+    def allocate(self, size_bytes: int, owner: str, priority: MemoryPriority) -> Optional[int]:
         """Allocate memory from the pool"""
         with self._lock:
             if self.total_allocated + size_bytes > self.max_size_bytes:
                 return None
             
-            allocation_id = f"{owner}_{int(time.time())}_{len(self.allocations)}"
-            allocation = MemoryAllocation(
-                id=allocation_id,
-                memory_type=self.memory_type,
-                size_bytes=size_bytes,
-                priority=priority,
-                owner=owner,
-                description=f"{self.memory_type.value} allocation for {owner}"
-            )
-            
-            self.allocations[allocation_id] = allocation
+            allocation_id = next(_allocation_ids)
+            self.allocations[allocation_id] = size_bytes
             self.total_allocated += size_bytes
             
             return allocation_id
     
-    def deallocate(self, allocation_id: str) -> bool:
+    def deallocate(self, allocation_id: int) -> bool:
         """Deallocate memory from the pool"""
         with self._lock:
-            if allocation_id not in self.allocations:
+            size_bytes = self.allocations.pop(allocation_id, None)
+            if size_bytes is None:
                 return False
             
-            allocation = self.allocations[allocation_id]
-            self.total_allocated -= allocation.size_bytes
-            del self.allocations[allocation_id]
-            
+            self.total_allocated -= size_bytes
             return True
     
+    def reserve(self, size_bytes: int) -> bool:
+        """Take capacity from the pool without creating an allocation record"""
+        with self._lock:
+            if self.total_allocated + size_bytes > self.max_size_bytes:
+                return False
+            self.total_allocated += size_bytes
+            return True
+    
+    def release(self, size_bytes: int):
+        """Return capacity taken with reserve"""
+        with self._lock:
+            self.total_allocated -= size_bytes
+    
     def get_utilization(self) -> float:
         """Get current pool utilization ratio"""
         with self._lock:
             return self.total_allocated / self.max_size_bytes if self.max_size_bytes > 0 else 0.0
 
 
+# Types whose size never depends on referenced objects
+_ATOMIC_TYPES = (int, float, complex, bool, str, bytes, type(None))
+
+
+def _deep_getsizeof(obj: Any) -> int:
+    """Approximate size of an object and everything it references, walked iteratively"""
+    seen = set()
+    pending = deque([obj])
+    total = 0
+    
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            pending.extend(current)
+        elif hasattr(current, '__dict__') and not isinstance(current, type):
+            pending.append(vars(current))
+    
+    return total
+
+
+# Generation 0 collection threshold while the manager runs (CPython
+# defaults to 700, which collects constantly under request load)
+_GC_GEN0_THRESHOLD = 50_000
+
+# Seconds between memory statistics log lines from the monitor
+_STATS_LOG_INTERVAL_SECONDS = 300
+
+# Number of least recently used cache entries considered for eviction
+_EVICTION_SAMPLE_SIZE = 5
+
+# Byte translation table halving every counter, used to age the sketch
+_HALVE_COUNTERS = bytes(value >> 1 for value in range(256))
+
+
+class TinyLFU:
+    """
+    TinyLFU frequency sketch for cache admission
+    
+    A 4-row Count-Min Sketch of 4-bit (saturating) counters, fronted by a
+    doorkeeper bitmap that absorbs each key's first occurrence. After
+    10x capacity recorded accesses the counters are halved and the
+    doorkeeper cleared, so old popularity fades.
+    """
+    
+    ROWS = 4
+    MAX_COUNT = 15
+    
+    def __init__(self, capacity: int):
+        width = 1
+        while width < 8 * max(1, capacity):
+            width <<= 1
+        self._mask = width - 1
+        self._width = width
+        self._counters = bytearray(self.ROWS * width)
+        self._doorkeeper = bytearray(width)
+        self._sample_size = 10 * max(1, capacity)
+        self._additions = 0
+    
+    def _indexes(self, key: str) -> List[int]:
+        """Counter index in each row, by double hashing"""
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [row * self._width + ((h1 + row * h2) & self._mask) for row in range(self.ROWS)]
+    
+    def increment(self, key: str):
+        """Record an access to a key"""
+        indexes = self._indexes(key)
+        door = indexes[0]  # The row 0 index doubles as the doorkeeper slot
+        if not self._doorkeeper[door]:
+            self._doorkeeper[door] = 1
+        else:
+            counters = self._counters
+            for index in indexes:
+                if counters[index] < self.MAX_COUNT:
+                    counters[index] += 1
+        
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._reset()
+    
+    def estimate(self, key: str) -> int:
+        """Estimated access frequency of a key"""
+        indexes = self._indexes(key)
+        counters = self._counters
+        count = min(counters[index] for index in indexes)
+        return count + self._doorkeeper[indexes[0]]
+    
+    def _reset(self):
+        """Age the sketch by halving all counters"""
+        self._counters = bytearray(self._counters.translate(_HALVE_COUNTERS))
+        self._doorkeeper = bytearray(self._width)
+        self._additions //= 2
+
+
+class BloomFilter:
+    """
+    Bloom filter answering "definitely absent" for cache keys
+    
+    A bitset probed at three positions per key. Bits are only ever set, so
+    lock-free reads are safe; removed keys linger until the owner rebuilds
+    the filter from the live keys.
+    """
+    
+    HASHES = 3
+    
+    def __init__(self, capacity: int, keys: Iterable[str] = ()):
+        bits = 1
+        while bits < 64 * max(1, capacity):
+            bits <<= 1
+        self._mask = bits - 1
+        self._bits = bytearray(bits // 8)
+        self.insertions = 0
+        for key in keys:
+            self.add(key)
+    
+    def _positions(self, key: str) -> List[int]:
+        """Bit positions of a key, by double hashing"""
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) & self._mask for i in range(self.HASHES)]
+    
+    def add(self, key: str):
+        """Record a key as possibly present"""
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.insertions += 1
+    
+    def might_contain(self, key: str) -> bool:
+        """False only if the key was never added"""
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+def _warn_if_glibc_malloc():
+    """Log once per process when running on glibc malloc without jemalloc preloaded"""
+    global _ALLOCATOR_CHECKED
+    if _ALLOCATOR_CHECKED:
+        return
+    _ALLOCATOR_CHECKED = True
+    
+    if platform.system() != "Linux" or platform.libc_ver()[0] != "glibc":
+        return
+    if os.environ.get("MALLOC_ARENA_MAX"):
+        return  # Arena contention already mitigated
+    try:
+        if hasattr(ctypes.CDLL(None), "mallctl"):
+            return  # jemalloc is preloaded
+    except OSError:
+        return
+    
+    logger.warning(
+        "Running on glibc ptmalloc2 - consider run_with_jemalloc.sh "
+        "(LD_PRELOAD jemalloc) or MALLOC_ARENA_MAX=2 for lower tail latency under allocation churn"
+    )
+
+
+_ALLOCATOR_CHECKED = False
+
+
+# Compact integer codes for memory types in array-backed tables
+_MEMORY_TYPE_CODES: Dict[MemoryType, int] = {memory_type: code for code, memory_type in enumerate(MemoryType)}
+
+
+class ColumnTable:
+    """
+    Parallel numpy columns with one recyclable row per key
+    
+    Subclasses name their columns and dtypes in COLUMNS. Rows are recycled
+    as keys are removed, and the columns double in size when full, so scans
+    become vectorized masks over the first `rows` entries instead of walks
+    over Python objects.
+    """
+    
+    COLUMNS: Dict[str, Any] = {}
+    
+    def __init__(self, capacity: int = 64):
+        self._row_of: Dict[Any, int] = {}
+        self._free_rows: List[int] = []
+        self.rows = 0  # High-water mark of rows in use
+        self.keys = np.empty(capacity, dtype=object)
+        self.live = np.zeros(capacity, dtype=bool)
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+    
+    def _row(self, key: Any) -> int:
+        """Row holding a key, claiming a free one for new keys"""
+        row = self._row_of.get(key)
+        if row is None:
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                if self.rows == len(self.keys):
+                    self._grow()
+                row = self.rows
+                self.rows += 1
+            self._row_of[key] = row
+            self.keys[row] = key
+            self.live[row] = True
+        return row
+    
+    def remove(self, key: Any):
+        """Release a key's row for reuse"""
+        row = self._row_of.pop(key, None)
+        if row is not None:
+            self.keys[row] = None
+            self.live[row] = False
+            self._free_rows.append(row)
+    
+    def remove_many(self, keys: List[Any]):
+        """Release the rows of several keys at once"""
+        rows = [row for row in map(self._row_of.pop, keys, repeat(None)) if row is not None]
+        if rows:
+            self.keys[rows] = None
+            self.live[rows] = False
+            self._free_rows.extend(rows)
+    
+    def live_keys(self, mask: np.ndarray) -> List[Any]:
+        """Keys of the live rows selected by a mask over the first `rows` entries"""
+        rows = self.rows
+        return self.keys[:rows][self.live[:rows] & mask].tolist()
+    
+    def _grow(self):
+        """Double the capacity of every column"""
+        for name in ("keys", "live", *self.COLUMNS):
+            column = getattr(self, name)
+            grown = np.zeros(2 * len(column), dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+
+
+class AllocationTable(ColumnTable):
+    """Fields of direct allocations inspected by cleanup, keyed by allocation ID"""
+    
+    COLUMNS = {
+        "last_accessed": np.float64,
+        "memory_types": np.int8,
+        "priorities": np.int8,
+        "pinned": np.bool_,
+    }
+    
+    def add(self, allocation: MemoryAllocation):
+        """Record an allocation"""
+        row = self._row(allocation.id)
+        self.last_accessed[row] = allocation.last_accessed
+        self.memory_types[row] = _MEMORY_TYPE_CODES[allocation.memory_type]
+        self.priorities[row] = allocation.priority.value
+        self.pinned[row] = allocation.is_pinned
+
+
+class CacheTable(ColumnTable):
+    """Expiry times and priorities of cache entries, keyed by cache key"""
+    
+    COLUMNS = {
+        "expires_at": np.float64,
+        "priorities": np.int8,
+    }
+    
+    def set(self, key: str, expires_at: float, priority: MemoryPriority):
+        """Record or update a cache entry"""
+        row = self._row(key)
+        self.expires_at[row] = expires_at
+        self.priorities[row] = priority.value
+
+
 class MemoryManager:
     """
     Advanced memory management system for AI workloads
@@ -149,33 +438,54 @@ class MemoryManager:
             config: Configuration dictionary for memory management
         """
         self.config = config or self._default_config()
-        self.allocations: Dict[str, MemoryAllocation] = {}
+        _warn_if_glibc_malloc()
+        self.allocations: Dict[int, MemoryAllocation] = {}
+        # Freed allocation records kept for reuse; the oldest drop off when full
+        self._free_allocation_records: "deque[MemoryAllocation]" = deque(
+            maxlen=self.config.get("allocation_freelist_capacity", 256)
+        )
+        self._allocation_table = AllocationTable()
         self.memory_pools: Dict[MemoryType, MemoryPool] = {}
-        self.cache_storage: Dict[str, Any] = {}
-        self.weak_refs: Dict[str, weakref.ref] = {}
+        # Cache entries in LRU order, least recently used first
+        self.cache_storage: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_table = CacheTable()
+        self._frequency_sketch = TinyLFU(self.config["max_cache_entries"])
+        self._cache_bloom = BloomFilter(self.config["max_cache_entries"])
         
-        # Locks for thread safety
-        self._allocation_lock = threading.RLock()
-        self._cache_lock = threading.RLock()
-        self._stats_lock = threading.RLock()
+        # Locks for thread safety. Neither is re-entered, and the managed
+        # allocation statistics only change under the allocation lock.
+        self._allocation_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
         
         # Background task management
         self._monitor_task: Optional[asyncio.Task] = None
         self._cleanup_task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
+        self._gc_threshold: Optional[Tuple[int, ...]] = None
+        
+        # Performance tracking
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.gc_count = 0
         
-        # Statistics tracking
+        # Statistics tracking. Managed counters change under the allocation
+        # lock; system readings are published as a fresh MemoryStats snapshot
+        # that readers take without locking.
+        self._managed_allocations = 0
+        self._managed_bytes = 0
+        self._last_cleanup_time = 0.0
+        self._gpu_reading: Tuple[int, int] = (0, 0)
+        self._gpu_reading_ts = float("-inf")
+        self._nvml_handle: Optional[Any] = None
+        self._nvml_disabled = not NVML_AVAILABLE
+        self._availability_probe_ttl = self.config.get("availability_probe_ttl", 0.1)
+        self._stats_updated_at = float("-inf")
         self.stats = MemoryStats()
         self._update_system_stats()
         
         # Initialize memory pools
         self._initialize_memory_pools()
         
-        # Performance tracking
-        self.cache_hits = 0
-        self.cache_misses = 0
-        self.gc_count = 0
-        
         logger.info("MemoryManager initialized with total RAM: %.1f GB, GPU memory: %.1f GB", 
                    self.stats.total_system_ram / (1024**3),
                    self.stats.total_gpu_memory / (1024**3))
@@ -207,6 +517,9 @@ class MemoryManager:
             # Monitoring
             "monitoring_interval": 30,                   # Monitor every 30 seconds
             "stats_update_interval": 10,                # Update stats every 10 seconds
+            "gpu_stats_cache_ttl": 1.0,                  # Reuse GPU readings for 1 second
+            "availability_probe_ttl": 0.1,               # Reuse stats for allocation checks for 100ms
+            "allocation_freelist_capacity": 256,         # Freed allocation records kept for reuse
         }
     
     async def start(self):
@@ -218,6 +531,14 @@ class MemoryManager:
         logger.info("Starting MemoryManager background tasks")
         self._stop_event.clear()
         
+        # Move everything allocated so far, the manager, its pools and cache
+        # included, into the permanent generation so routine collections
+        # stop traversing it, and collect generation 0 far less often
+        gc.collect(2)
+        gc.freeze()
+        self._gc_threshold = gc.get_threshold()
+        gc.set_threshold(_GC_GEN0_THRESHOLD, *self._gc_threshold[1:])
+        
         # Start background monitoring and cleanup tasks
         self._monitor_task = asyncio.create_task(self._memory_monitor())
         self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
@@ -243,6 +564,20 @@ class MemoryManager:
         # Cleanup all allocations
         await self.cleanup_all()
         
+        # Restore the collector settings changed by start
+        if self._gc_threshold is not None:
+            gc.set_threshold(*self._gc_threshold)
+            gc.unfreeze()
+            self._gc_threshold = None
+        
+        # Balance the nvmlInit made on the first GPU reading
+        if self._nvml_handle is not None:
+            try:
+                pynvml.nvmlShutdown()
+            except pynvml.NVMLError as e:
+                logger.debug(f"nvmlShutdown failed: {e}")
+            self._nvml_handle = None
+        
         logger.info("MemoryManager stopped")
     
     def allocate_memory(self, 
@@ -252,7 +587,7 @@ class MemoryManager:
                        priority: MemoryPriority = MemoryPriority.MEDIUM,
                        description: str = "",
                        pin_memory: bool = False,
-                       metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+                       metadata: Optional[Dict[str, Any]] = None) -> Optional[int]:
         """
         Allocate memory with specified parameters
         
@@ -269,42 +604,85 @@ class MemoryManager:
             Allocation ID or None if allocation failed
         """
         with self._allocation_lock:
-            # Check if we have enough available memory
-            if not self._check_memory_availability(size_bytes, memory_type):
-                logger.warning(f"Insufficient {memory_type.value} memory for allocation: {size_bytes} bytes")
-                return None
-            
-            # Try to use memory pool first
-            if memory_type in self.memory_pools:
-                pool_id = self.memory_pools[memory_type].allocate(size_bytes, owner, priority)
-                if pool_id:
-                    return pool_id
-            
-            # Create direct allocation
-            allocation_id = f"{owner}_{memory_type.value}_{int(time.time())}_{len(self.allocations)}"
+            return self._allocate_unlocked(size_bytes, memory_type, owner, priority,
+                                           description, pin_memory, metadata)
+    
+    def allocate_many(self, requests: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Allocate several blocks under a single acquisition of the allocation lock
+        
+        Args:
+            requests: Keyword arguments for allocate_memory, one dict per allocation
             
+        Returns:
+            Allocation IDs in request order, None where an allocation failed
+        """
+        with self._allocation_lock:
+            return [self._allocate_unlocked(**request) for request in requests]
+    
+    def _allocate_unlocked(self,
+                           size_bytes: int,
+                           memory_type: MemoryType,
+                           owner: str,
+                           priority: MemoryPriority = MemoryPriority.MEDIUM,
+                           description: str = "",
+                           pin_memory: bool = False,
+                           metadata: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Allocate memory; the caller holds the allocation lock"""
+        # Pool-backed types are bounded by the pool alone, which needs
+        # no system probe
+        pool = self.memory_pools.get(memory_type)
+        if pool is not None:
+            pool_id = pool.allocate(size_bytes, owner, priority)
+            if pool_id is None:
+                logger.warning(f"Insufficient {memory_type.value} memory for allocation: {size_bytes} bytes")
+            return pool_id
+        
+        # Check if we have enough available memory
+        if not self._check_memory_availability(size_bytes, memory_type):
+            logger.warning(f"Insufficient {memory_type.value} memory for allocation: {size_bytes} bytes")
+            return None
+        
+        # Create direct allocation, reusing a freed record when one is
+        # available instead of constructing a new one
+        allocation_id = next(_allocation_ids)
+        description = description or f"{memory_type.value} allocation"
+        
+        if self._free_allocation_records:
+            allocation = self._free_allocation_records.pop()
+            allocation.id = allocation_id
+            allocation.memory_type = memory_type
+            allocation.size_bytes = size_bytes
+            allocation.priority = priority
+            allocation.owner = owner
+            allocation.description = description
+            allocation.created_at = allocation.last_accessed = time.monotonic()
+            allocation.access_count = 0
+            allocation.is_pinned = pin_memory
+            allocation.metadata = metadata or {}
+        else:
             allocation = MemoryAllocation(
                 id=allocation_id,
                 memory_type=memory_type,
                 size_bytes=size_bytes,
                 priority=priority,
                 owner=owner,
-                description=description or f"{memory_type.value} allocation",
+                description=description,
                 is_pinned=pin_memory,
                 metadata=metadata or {}
             )
-            
-            self.allocations[allocation_id] = allocation
-            
-            # Update statistics
-            with self._stats_lock:
-                self.stats.managed_allocations += 1
-                self.stats.total_managed_bytes += size_bytes
-            
-            logger.debug(f"Allocated {size_bytes} bytes of {memory_type.value} for {owner}")
-            return allocation_id
+        
+        self.allocations[allocation_id] = allocation
+        self._allocation_table.add(allocation)
+        
+        # Update statistics
+        self._managed_allocations += 1
+        self._managed_bytes += size_bytes
+        
+        logger.debug(f"Allocated {size_bytes} bytes of {memory_type.value} for {owner}")
+        return allocation_id
     
-    def deallocate_memory(self, allocation_id: str) -> bool:
+    def deallocate_memory(self, allocation_id: int) -> bool:
         """
         Deallocate memory by allocation ID
         
@@ -315,35 +693,61 @@ class MemoryManager:
             True if successfully deallocated, False otherwise
         """
         with self._allocation_lock:
-            # Try memory pools first
-            for pool in self.memory_pools.values():
-                if pool.deallocate(allocation_id):
-                    return True
-            
-            # Direct allocation cleanup
-            if allocation_id not in self.allocations:
-                return False
-            
-            allocation = self.allocations[allocation_id]
-            
-            # Remove from cache if present
-            with self._cache_lock:
-                cache_keys_to_remove = [
-                    key for key, value in self.cache_storage.items()
-                    if hasattr(value, '_allocation_id') and value._allocation_id == allocation_id
-                ]
-                for key in cache_keys_to_remove:
-                    del self.cache_storage[key]
-            
-            # Update statistics
-            with self._stats_lock:
-                self.stats.managed_allocations -= 1
-                self.stats.total_managed_bytes -= allocation.size_bytes
-            
-            del self.allocations[allocation_id]
+            return self._deallocate_unlocked(allocation_id)
+    
+    def deallocate_many(self, allocation_ids: List[int]) -> List[bool]:
+        """
+        Deallocate several allocations under a single acquisition of the allocation lock
+        
+        Args:
+            allocation_ids: IDs of allocations to free
             
-            logger.debug(f"Deallocated {allocation.size_bytes} bytes of {allocation.memory_type.value}")
-            return True
+        Returns:
+            Per-ID results, True where the allocation was freed
+        """
+        with self._allocation_lock:
+            return [self._deallocate_unlocked(allocation_id) for allocation_id in allocation_ids]
+    
+    def _deallocate_unlocked(self, allocation_id: int) -> bool:
+        """Deallocate memory by allocation ID; the caller holds the allocation lock"""
+        # Try memory pools first
+        for pool in self.memory_pools.values():
+            if pool.deallocate(allocation_id):
+                return True
+        
+        # Direct allocation cleanup
+        if allocation_id not in self.allocations:
+            return False
+        
+        allocation = self.allocations.pop(allocation_id)
+        self._allocation_table.remove(allocation_id)
+        
+        # Update statistics
+        self._managed_allocations -= 1
+        self._managed_bytes -= allocation.size_bytes
+        
+        logger.debug(f"Deallocated {allocation.size_bytes} bytes of {allocation.memory_type.value}")
+        self._free_allocation_records.append(allocation)
+        return True
+    
+    def _free_direct_allocations(self, allocation_ids: List[int]) -> Tuple[int, int]:
+        """Free several direct allocations; the caller holds the allocation lock"""
+        # Direct allocations never live in a pool, so the per-pool lookups
+        # of _deallocate_unlocked are skipped
+        freed = [allocation for allocation in map(self.allocations.pop, allocation_ids, repeat(None))
+                 if allocation is not None]
+        if not freed:
+            return 0, 0
+        
+        freed_bytes = sum(allocation.size_bytes for allocation in freed)
+        self._allocation_table.remove_many([allocation.id for allocation in freed])
+        
+        # Update statistics
+        self._managed_allocations -= len(freed)
+        self._managed_bytes -= freed_bytes
+        
+        self._free_allocation_records.extend(freed)
+        return len(freed), freed_bytes
     
     def cache_object(self, 
                     key: str, 
@@ -364,44 +768,60 @@ class MemoryManager:
         Returns:
             True if cached successfully, False otherwise
         """
+        # Everything that doesn't touch shared cache state happens before
+        # taking the lock: size estimation, the pool charge and the entry
+        if size_bytes is None:
+            size_bytes = self._estimate_object_size(obj)
+        
+        # Charge the entry to the data cache pool; the entry itself
+        # records its size and priority
+        data_pool = self.memory_pools[MemoryType.DATA_CACHE]
+        if not data_pool.reserve(size_bytes):
+            logger.warning(f"Failed to allocate memory for cache entry: {key}")
+            return False
+        
+        # Create cache entry with metadata, timed on the monotonic clock
+        now = time.monotonic()
+        ttl = ttl_seconds or self.config["cache_ttl_seconds"]
+        cache_entry = {
+            'object': obj,
+            'size_bytes': size_bytes,
+            'cached_at': now,
+            'ttl_seconds': ttl,
+            'access_count': 0,
+            'last_accessed': now,
+            'priority': priority
+        }
+        
         with self._cache_lock:
             # Check cache size limits
-            if len(self.cache_storage) >= self.config["max_cache_entries"]:
-                self._evict_cache_entries(1)
-            
-            # Estimate size if not provided
-            if size_bytes is None:
-                size_bytes = self._estimate_object_size(obj)
-            
-            # Allocate memory for cache entry
-            allocation_id = self.allocate_memory(
-                size_bytes=size_bytes,
-                memory_type=MemoryType.DATA_CACHE,
-                owner="cache_manager",
-                priority=priority,
-                description=f"Cache entry: {key}"
-            )
-            
-            if not allocation_id:
-                logger.warning(f"Failed to allocate memory for cache entry: {key}")
-                return False
+            if (key not in self.cache_storage and
+                    len(self.cache_storage) >= self.config["max_cache_entries"]):
+                victim = self._select_eviction_victim()
+                if victim is not None:
+                    # Only displace an entry that is accessed less often
+                    sketch = self._frequency_sketch
+                    if sketch.estimate(key) < sketch.estimate(victim):
+                        data_pool.release(size_bytes)
+                        logger.debug(f"Cache admission rejected for key: {key}")
+                        return False
+                    self._remove_cache_entry(victim)
             
-            # Create cache entry with metadata
-            cache_entry = {
-                'object': obj,
-                'size_bytes': size_bytes,
-                'cached_at': time.time(),
-                'ttl_seconds': ttl_seconds or self.config["cache_ttl_seconds"],
-                'access_count': 0,
-                'last_accessed': time.time(),
-                'priority': priority,
-                '_allocation_id': allocation_id
-            }
+            # Mark the key before it becomes visible, so lock-free misses
+            # never skip a stored entry
+            self._cache_bloom.add(key)
             
+            # Replacing an entry releases the old one's share
+            previous = self.cache_storage.get(key)
             self.cache_storage[key] = cache_entry
-            
-            logger.debug(f"Cached object with key: {key}, size: {size_bytes} bytes")
-            return True
+            self.cache_storage.move_to_end(key)
+            self._cache_table.set(key, now + ttl, priority)
+        
+        if previous is not None:
+            data_pool.release(previous['size_bytes'])
+        
+        logger.debug(f"Cached object with key: {key}, size: {size_bytes} bytes")
+        return True
     
     def get_cached_object(self, key: str) -> Optional[Any]:
         """
@@ -413,13 +833,22 @@ class MemoryManager:
         Returns:
             Cached object or None if not found/expired
         """
+        # Keys the filter has never seen are misses without taking the lock;
+        # a lost sketch or counter update under a race is harmless
+        if not self._cache_bloom.might_contain(key):
+            self._frequency_sketch.increment(key)
+            self.cache_misses += 1
+            return None
+        
         with self._cache_lock:
+            self._frequency_sketch.increment(key)
+            
             if key not in self.cache_storage:
                 self.cache_misses += 1
                 return None
             
             entry = self.cache_storage[key]
-            current_time = time.time()
+            current_time = time.monotonic()
             
             # Check if entry has expired
             if current_time - entry['cached_at'] > entry['ttl_seconds']:
@@ -430,12 +859,7 @@ class MemoryManager:
             # Update access statistics
             entry['access_count'] += 1
             entry['last_accessed'] = current_time
-            
-            # Update allocation access time
-            if entry['_allocation_id'] in self.allocations:
-                allocation = self.allocations[entry['_allocation_id']]
-                allocation.last_accessed = current_time
-                allocation.access_count += 1
+            self.cache_storage.move_to_end(key)
             
             self.cache_hits += 1
             return entry['object']
@@ -447,56 +871,56 @@ class MemoryManager:
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get comprehensive memory statistics"""
-        with self._stats_lock:
-            self._update_system_stats()
-            
-            # Calculate cache hit rate
-            total_cache_requests = self.cache_hits + self.cache_misses
-            cache_hit_rate = (self.cache_hits / total_cache_requests 
-                            if total_cache_requests > 0 else 0.0)
-            
-            # Memory pool statistics
-            pool_stats = {}
-            for memory_type, pool in self.memory_pools.items():
-                pool_stats[memory_type.value] = {
-                    "max_size_bytes": pool.max_size_bytes,
-                    "allocated_bytes": pool.total_allocated,
-                    "utilization": pool.get_utilization(),
-                    "allocation_count": len(pool.allocations)
-                }
-            
-            return {
-                "system_memory": {
-                    "total_bytes": self.stats.total_system_ram,
-                    "available_bytes": self.stats.available_system_ram,
-                    "used_bytes": self.stats.used_system_ram,
-                    "utilization": self.stats.used_system_ram / self.stats.total_system_ram
-                },
-                "gpu_memory": {
-                    "total_bytes": self.stats.total_gpu_memory,
-                    "available_bytes": self.stats.available_gpu_memory,
-                    "used_bytes": self.stats.used_gpu_memory,
-                    "utilization": (self.stats.used_gpu_memory / self.stats.total_gpu_memory 
-                                  if self.stats.total_gpu_memory > 0 else 0.0)
-                },
-                "managed_memory": {
-                    "allocations": self.stats.managed_allocations,
-                    "total_bytes": self.stats.total_managed_bytes,
-                    "average_allocation_size": (self.stats.total_managed_bytes / self.stats.managed_allocations
-                                              if self.stats.managed_allocations > 0 else 0)
-                },
-                "cache": {
-                    "entries": len(self.cache_storage),
-                    "hit_rate": cache_hit_rate,
-                    "hits": self.cache_hits,
-                    "misses": self.cache_misses
-                },
-                "memory_pools": pool_stats,
-                "garbage_collection": {
-                    "collections": self.gc_count,
-                    "last_cleanup": self.stats.last_cleanup_time
-                }
+        # System readings come from the last published snapshot
+        stats = self.stats
+        
+        # Calculate cache hit rate
+        total_cache_requests = self.cache_hits + self.cache_misses
+        cache_hit_rate = (self.cache_hits / total_cache_requests 
+                        if total_cache_requests > 0 else 0.0)
+        
+        # Memory pool statistics
+        pool_stats = {}
+        for memory_type, pool in self.memory_pools.items():
+            pool_stats[memory_type.value] = {
+                "max_size_bytes": pool.max_size_bytes,
+                "allocated_bytes": pool.total_allocated,
+                "utilization": pool.get_utilization(),
+                "allocation_count": len(pool.allocations)
+            }
+        
+        return {
+            "system_memory": {
+                "total_bytes": stats.total_system_ram,
+                "available_bytes": stats.available_system_ram,
+                "used_bytes": stats.used_system_ram,
+                "utilization": stats.used_system_ram / stats.total_system_ram
+            },
+            "gpu_memory": {
+                "total_bytes": stats.total_gpu_memory,
+                "available_bytes": stats.available_gpu_memory,
+                "used_bytes": stats.used_gpu_memory,
+                "utilization": (stats.used_gpu_memory / stats.total_gpu_memory 
+                              if stats.total_gpu_memory > 0 else 0.0)
+            },
+            "managed_memory": {
+                "allocations": self._managed_allocations,
+                "total_bytes": self._managed_bytes,
+                "average_allocation_size": (self._managed_bytes / self._managed_allocations
+                                          if self._managed_allocations > 0 else 0)
+            },
+            "cache": {
+                "entries": len(self.cache_storage),
+                "hit_rate": cache_hit_rate,
+                "hits": self.cache_hits,
+                "misses": self.cache_misses
+            },
+            "memory_pools": pool_stats,
+            "garbage_collection": {
+                "collections": self.gc_count,
+                "last_cleanup": self._last_cleanup_time
             }
+        }
     
     async def force_cleanup(self, aggressive: bool = False) -> Dict[str, int]:
         """
@@ -533,18 +957,15 @@ class MemoryManager:
         cleanup_stats["bytes_freed"] = freed_bytes
         
         # Garbage collection
+        # One full collection reaches everything that repeated passes would
+        cleanup_stats["gc_collections"] = gc.collect(2)
+        self.gc_count += 1
+        
+        # Hand the memory freed above back to the OS
         if aggressive:
-            for i in range(3):  # Multiple GC passes for aggressive cleanup
-                collected = gc.collect()
-                cleanup_stats["gc_collections"] += collected
-                self.gc_count += 1
-        else:
-            collected = gc.collect()
-            cleanup_stats["gc_collections"] = collected
-            self.gc_count += 1
+            self._shrink_native_heap()
         
-        with self._stats_lock:
-            self.stats.last_cleanup_time = time.time()
+        self._last_cleanup_time = time.time()
         
         logger.info(f"Cleanup completed: {cleanup_stats}")
         return cleanup_stats
@@ -555,15 +976,11 @@ class MemoryManager:
         
         # Clear all caches
         with self._cache_lock:
-            cache_keys = list(self.cache_storage.keys())
-            for key in cache_keys:
-                self._remove_cache_entry(key)
+            self._remove_cache_entries(list(self.cache_storage.keys()))
         
         # Free all allocations
         with self._allocation_lock:
-            allocation_ids = list(self.allocations.keys())
-            for allocation_id in allocation_ids:
-                self.deallocate_memory(allocation_id)
+            self._free_direct_allocations(list(self.allocations.keys()))
             
             # Clear memory pools
             for pool in self.memory_pools.values():
@@ -575,6 +992,20 @@ class MemoryManager:
         
         logger.info("All managed memory cleaned up")
     
+    def _shrink_native_heap(self):
+        """Return freed native heap and cached CUDA memory to the OS/driver"""
+        # glibc keeps freed pages in its arenas until explicitly trimmed
+        if platform.system() == "Linux":
+            try:
+                ctypes.CDLL("libc.so.6").malloc_trim(0)
+            except (OSError, AttributeError) as e:
+                logger.debug(f"malloc_trim unavailable: {e}")
+        
+        # Only touch CUDA if a model backend has already initialised it
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_initialized():
+            torch.cuda.empty_cache()
+    
     def _initialize_memory_pools(self):
         """Initialize memory pools for different types"""
         self.memory_pools[MemoryType.MODEL_WEIGHTS] = MemoryPool(
@@ -593,100 +1024,160 @@ class MemoryManager:
         )
     
     def _update_system_stats(self):
-        """Update system memory statistics"""
+        """Read system memory statistics and publish them as a new snapshot"""
         # System RAM statistics
         memory_info = psutil.virtual_memory()
-        self.stats.total_system_ram = memory_info.total
-        self.stats.available_system_ram = memory_info.available
-        self.stats.used_system_ram = memory_info.used
+        total_gpu_memory, used_gpu_memory = self._read_gpu_memory()
         
-        # GPU memory statistics
-        if GPU_AVAILABLE:
+        total_requests = self.cache_hits + self.cache_misses
+        
+        # Replacing the reference is atomic, so readers never see a
+        # half-updated snapshot
+        self._stats_updated_at = time.monotonic()
+        self.stats = MemoryStats(
+            total_system_ram=memory_info.total,
+            available_system_ram=memory_info.available,
+            used_system_ram=memory_info.used,
+            total_gpu_memory=total_gpu_memory,
+            available_gpu_memory=total_gpu_memory - used_gpu_memory,
+            used_gpu_memory=used_gpu_memory,
+            managed_allocations=self._managed_allocations,
+            total_managed_bytes=self._managed_bytes,
+            cache_hit_rate=self.cache_hits / total_requests if total_requests > 0 else 0.0,
+            gc_collections=self.gc_count,
+            last_cleanup_time=self._last_cleanup_time
+        )
+    
+    def _read_gpu_memory(self) -> Tuple[int, int]:
+        """Total and used GPU memory in bytes, reusing recent readings"""
+        if self._nvml_disabled:
+            return self._gpu_reading
+        
+        now = time.monotonic()
+        if now - self._gpu_reading_ts < self.config.get("gpu_stats_cache_ttl", 1.0):
+            return self._gpu_reading
+        
+        self._gpu_reading_ts = now
+        if self._nvml_handle is None:
             try:
-                gpus = GPUtil.getGPUs()
-                if gpus:
-                    gpu = gpus[0]  # Use first GPU
-                    self.stats.total_gpu_memory = int(gpu.memoryTotal * 1024 * 1024)  # Convert MB to bytes
-                    self.stats.used_gpu_memory = int(gpu.memoryUsed * 1024 * 1024)
-                    self.stats.available_gpu_memory = self.stats.total_gpu_memory - self.stats.used_gpu_memory
-            except Exception as e:
-                logger.warning(f"Failed to get GPU memory stats: {e}")
+                pynvml.nvmlInit()
+                self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)  # Use first GPU
+            except pynvml.NVMLError as e:
+                # No driver or no device; stop retrying for this manager
+                logger.warning(f"NVML unavailable - GPU memory monitoring disabled: {e}")
+                self._nvml_disabled = True
+                return self._gpu_reading
+        
+        # A direct NVML query, no nvidia-smi subprocess
+        try:
+            info = pynvml.nvmlDeviceGetMemoryInfo(self._nvml_handle)
+            self._gpu_reading = (int(info.total), int(info.used))
+        except pynvml.NVMLError as e:
+            logger.warning(f"Failed to get GPU memory stats: {e}")
+        return self._gpu_reading
     
     def _check_memory_availability(self, size_bytes: int, memory_type: MemoryType) -> bool:
         """Check if requested memory is available"""
-        self._update_system_stats()
+        # Allocation bursts share one reading instead of probing the system
+        # each time; the monitor keeps the snapshot fresh otherwise
+        if time.monotonic() - self._stats_updated_at > self._availability_probe_ttl:
+            self._update_system_stats()
+        stats = self.stats
         
         if memory_type == MemoryType.SYSTEM_RAM:
-            return self.stats.available_system_ram >= size_bytes
+            return stats.available_system_ram >= size_bytes
         elif memory_type == MemoryType.GPU_MEMORY:
-            return self.stats.available_gpu_memory >= size_bytes
-        else:
-            # For managed memory types, check against pool limits
-            if memory_type in self.memory_pools:
-                pool = self.memory_pools[memory_type]
-                return (pool.max_size_bytes - pool.total_allocated) >= size_bytes
-            return True
+            return stats.available_gpu_memory >= size_bytes
+        # Other managed types without a pool are unbounded
+        return True
     
     def _estimate_object_size(self, obj: Any) -> int:
-        """Estimate the size of an object in bytes"""
-        try:
-            import sys
+        """Estimate the size of an object in bytes, including referenced objects"""
+        if isinstance(obj, _ATOMIC_TYPES):
             return sys.getsizeof(obj)
-        except:
-            # Fallback estimation based on object type
-            if isinstance(obj, str):
-                return len(obj.encode('utf-8'))
-            elif isinstance(obj, (list, tuple)):
-                return sum(self._estimate_object_size(item) for item in obj)
-            elif isinstance(obj, dict):
-                return sum(self._estimate_object_size(k) + self._estimate_object_size(v) 
-                          for k, v in obj.items())
-            else:
-                return 1024  # Default 1KB estimate
+        
+        # Arrays and tensors report their buffer size directly
+        nbytes = getattr(obj, 'nbytes', None)
+        if isinstance(nbytes, int):
+            return nbytes
+        if hasattr(obj, 'element_size') and hasattr(obj, 'numel'):
+            return obj.element_size() * obj.numel()
+        
+        try:
+            if PYMPLER_AVAILABLE:
+                return asizeof.asizeof(obj)
+            return _deep_getsizeof(obj)
+        except Exception:
+            return 1024  # Default 1KB estimate
     
     def _remove_cache_entry(self, key: str) -> bool:
-        """Remove a cache entry and its associated memory allocation"""
-        if key not in self.cache_storage:
+        """Remove a cache entry and release its share of the data cache pool"""
+        entry = self.cache_storage.pop(key, None)
+        if entry is None:
             return False
         
-        entry = self.cache_storage[key]
-        
-        # Deallocate associated memory
-        if '_allocation_id' in entry:
-            self.deallocate_memory(entry['_allocation_id'])
-        
-        del self.cache_storage[key]
+        self._cache_table.remove(key)
+        self.memory_pools[MemoryType.DATA_CACHE].release(entry['size_bytes'])
         return True
     
+    def _remove_cache_entries(self, keys: List[str]) -> int:
+        """Remove several cache entries, releasing their pool capacity in one step"""
+        removed = []
+        released_bytes = 0
+        for key in keys:
+            entry = self.cache_storage.pop(key, None)
+            if entry is not None:
+                removed.append(key)
+                released_bytes += entry['size_bytes']
+        
+        if removed:
+            self._cache_table.remove_many(removed)
+            self.memory_pools[MemoryType.DATA_CACHE].release(released_bytes)
+        return len(removed)
+    
+    def _rebuild_cache_bloom_if_stale(self):
+        """Rebuild the miss filter once removed keys dominate it; the caller holds the cache lock"""
+        if self._cache_bloom.insertions > 4 * self.config["max_cache_entries"]:
+            # Readers keep using the old filter until the reference is swapped
+            self._cache_bloom = BloomFilter(self.config["max_cache_entries"], self.cache_storage)
+    
+    def _select_eviction_victim(self) -> Optional[str]:
+        """Pick the least frequently used of the least recently used cache entries"""
+        candidates = [
+            key for key, entry in islice(self.cache_storage.items(), _EVICTION_SAMPLE_SIZE)
+            if not entry.get('is_pinned', False)
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=self._frequency_sketch.estimate)
+    
     def _evict_cache_entries(self, count: int) -> int:
         """Evict least recently used cache entries"""
-        if not self.cache_storage:
-            return 0
-        
-        # Sort by last accessed time (oldest first)
-        entries = list(self.cache_storage.items())
-        entries.sort(key=lambda x: x[1]['last_accessed'])
-        
-        evicted = 0
-        for key, entry in entries[:count]:
+        # The storage is kept in access order, so the victims are the first
+        # non-pinned entries
+        victims = []
+        for key, entry in self.cache_storage.items():
+            if len(victims) >= count:
+                break
             if not entry.get('is_pinned', False):  # Don't evict pinned entries
-                self._remove_cache_entry(key)
-                evicted += 1
+                victims.append(key)
         
-        return evicted
+        return self._remove_cache_entries(victims)
     
     async def _memory_monitor(self):
         """Background task to monitor memory usage"""
         logger.info("Started memory monitor")
+        next_stats_log = time.monotonic() + _STATS_LOG_INTERVAL_SECONDS
         
         while not self._stop_event.is_set():
             try:
                 self._update_system_stats()
+                snapshot = self.stats
                 
                 # Check for memory pressure
-                ram_utilization = self.stats.used_system_ram / self.stats.total_system_ram
-                gpu_utilization = (self.stats.used_gpu_memory / self.stats.total_gpu_memory 
-                                 if self.stats.total_gpu_memory > 0 else 0.0)
+                ram_utilization = snapshot.used_system_ram / snapshot.total_system_ram
+                gpu_utilization = (snapshot.used_gpu_memory / snapshot.total_gpu_memory 
+                                 if snapshot.total_gpu_memory > 0 else 0.0)
                 
                 # Handle memory pressure
                 if ram_utilization > self.config["critical_memory_threshold"]:
@@ -701,7 +1192,9 @@ class MemoryManager:
                     # GPU-specific cleanup could be implemented here
                 
                 # Log memory statistics periodically
-                if int(time.time()) % 300 == 0:  # Every 5 minutes
+                now = time.monotonic()
+                if now >= next_stats_log:
+                    next_stats_log = now + _STATS_LOG_INTERVAL_SECONDS
                     stats = self.get_memory_stats()
                     logger.info(
                         f"Memory stats - RAM: {ram_utilization:.1%}, "
@@ -723,19 +1216,26 @@ class MemoryManager:
     async def _periodic_cleanup(self):
         """Background task for periodic cleanup"""
         logger.info("Started periodic cleanup task")
+        next_cleanup = time.monotonic()
+        next_gc = next_cleanup + self.config["gc_frequency"]
         
         while not self._stop_event.is_set():
             try:
-                await self._normal_cache_cleanup()
+                now = time.monotonic()
+                if now >= next_cleanup:
+                    next_cleanup = now + self.config["cache_cleanup_interval"]
+                    await self._normal_cache_cleanup()
                 
                 # Periodic garbage collection
-                if int(time.time()) % self.config["gc_frequency"] == 0:
+                if now >= next_gc:
+                    next_gc = now + self.config["gc_frequency"]
                     collected = gc.collect()
                     if collected > 0:
                         logger.debug(f"Garbage collection freed {collected} objects")
                     self.gc_count += 1
                 
-                await asyncio.sleep(self.config["cache_cleanup_interval"])
+                # Sleep until whichever job is due next
+                await asyncio.sleep(max(0.1, min(next_cleanup, next_gc) - time.monotonic()))
                 
             except asyncio.CancelledError:
                 break
@@ -747,18 +1247,13 @@ class MemoryManager:
     
     async def _normal_cache_cleanup(self) -> int:
         """Normal cache cleanup - remove expired entries"""
-        removed_count = 0
-        current_time = time.time()
+        current_time = time.monotonic()
         
         with self._cache_lock:
-            expired_keys = []
-            for key, entry in self.cache_storage.items():
-                if current_time - entry['cached_at'] > entry['ttl_seconds']:
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
-                if self._remove_cache_entry(key):
-                    removed_count += 1
+            table = self._cache_table
+            expired_keys = table.live_keys(table.expires_at[:table.rows] < current_time)
+            removed_count = self._remove_cache_entries(expired_keys)
+            self._rebuild_cache_bloom_if_stale()
         
         if removed_count > 0:
             logger.debug(f"Removed {removed_count} expired cache entries")
@@ -767,18 +1262,11 @@ class MemoryManager:
     
     async def _aggressive_cache_cleanup(self) -> int:
         """Aggressive cache cleanup - remove low priority and old entries"""
-        removed_count = 0
-        
         with self._cache_lock:
             # Remove all low priority entries
-            low_priority_keys = [
-                key for key, entry in self.cache_storage.items()
-                if entry['priority'] in [MemoryPriority.LOW, MemoryPriority.DISPOSABLE]
-            ]
-            
-            for key in low_priority_keys:
-                if self._remove_cache_entry(key):
-                    removed_count += 1
+            table = self._cache_table
+            low_priority_keys = table.live_keys(table.priorities[:table.rows] >= MemoryPriority.LOW.value)
+            removed_count = self._remove_cache_entries(low_priority_keys)
             
             # Remove oldest entries if still over limit
             if len(self.cache_storage) > self.config["max_cache_entries"] / 2:
@@ -786,6 +1274,8 @@ class MemoryManager:
                     len(self.cache_storage) - self.config["max_cache_entries"] // 2
                 )
                 removed_count += additional_removed
+            
+            self._rebuild_cache_bloom_if_stale()
         
         if removed_count > 0:
             logger.info(f"Aggressive cleanup removed {removed_count} cache entries")
@@ -794,33 +1284,24 @@ class MemoryManager:
     
     async def _cleanup_unused_allocations(self, aggressive: bool) -> Tuple[int, int]:
         """Cleanup unused memory allocations"""
-        freed_allocations = 0
-        freed_bytes = 0
-        current_time = time.time()
+        current_time = time.monotonic()
         
         with self._allocation_lock:
-            allocations_to_free = []
+            table = self._allocation_table
+            rows = table.rows
+            idle_time = current_time - table.last_accessed[:rows]
+            is_temporary = table.memory_types[:rows] == _MEMORY_TYPE_CODES[MemoryType.TEMPORARY]
+            is_low_priority = table.priorities[:rows] >= MemoryPriority.LOW.value
             
-            for allocation_id, allocation in self.allocations.items():
-                # Skip pinned allocations unless aggressive cleanup
-                if allocation.is_pinned and not aggressive:
-                    continue
-                
-                # Free unused temporary allocations
-                if allocation.memory_type == MemoryType.TEMPORARY:
-                    if current_time - allocation.last_accessed > 300:  # 5 minutes
-                        allocations_to_free.append(allocation_id)
-                
-                # Free low priority allocations that haven't been accessed
-                elif (allocation.priority in [MemoryPriority.LOW, MemoryPriority.DISPOSABLE] and
-                      current_time - allocation.last_accessed > 1800):  # 30 minutes
-                    allocations_to_free.append(allocation_id)
+            # Free unused temporary allocations after 5 minutes, and low
+            # priority allocations that haven't been accessed for 30
+            to_free = np.where(is_temporary, idle_time > 300, is_low_priority & (idle_time > 1800))
+            
+            # Skip pinned allocations unless aggressive cleanup
+            if not aggressive:
+                to_free &= ~table.pinned[:rows]
             
-            for allocation_id in allocations_to_free:
-                allocation = self.allocations[allocation_id]
-                if self.deallocate_memory(allocation_id):
-                    freed_allocations += 1
-                    freed_bytes += allocation.size_bytes
+            freed_allocations, freed_bytes = self._free_direct_allocations(table.live_keys(to_free))
         
         if freed_allocations > 0:
             logger.debug(f"Freed {freed_allocations} allocations ({freed_bytes} bytes)")
@@ -8,18 +8,24 @@ model lifecycle management for economic analysis workflows.
 import asyncio
 import logging
 import time
-from typing import Dict, List, Optional, Any, Union
+from typing import Deque, Dict, FrozenSet, List, Optional, Any, Union, Callable, Awaitable
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 import os
-from concurrent.futures import ThreadPoolExecutor
+import random
+import sys
 import psutil
-import GPUtil
+import pynvml
 
 logger = logging.getLogger(__name__)
 
 
+# Requests considered by the sliding-window health error rate
+HEALTH_WINDOW_SIZE = 128
+
+
 class ModelPriority(Enum):
     """Model priority levels for resource allocation"""
     HIGH = "high"
@@ -36,7 +42,7 @@ class ModelStatus(Enum):
     UNLOADED = "unloaded"
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     """Configuration for individual models"""
     name: str
@@ -45,14 +51,18 @@ class ModelConfig:
     gpu_memory_gb: float
     ram_memory_gb: float
     max_concurrent_requests: int = 1
-    specialized_domains: List[str] = field(default_factory=list)
+    specialized_domains: FrozenSet[str] = field(default_factory=frozenset)
     api_endpoint: Optional[str] = None
     model_type: str = "ollama"  # ollama, vllm, transformers
     context_length: int = 32768
     temperature: float = 0.7
+    
+    def __post_init__(self):
+        # Routing tests task types against these on every request
+        self.specialized_domains = frozenset(map(sys.intern, self.specialized_domains))
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelInstance:
     """Runtime model instance information"""
     config: ModelConfig
@@ -63,6 +73,22 @@ class ModelInstance:
     error_count: int = 0
     last_used: float = field(default_factory=time.time)
     health_score: float = 1.0
+    # Outcomes of the most recent requests (True for an error), for a
+    # health error rate that follows recent behaviour
+    recent_outcomes: Deque[bool] = field(default_factory=lambda: deque(maxlen=HEALTH_WINDOW_SIZE), repr=False)
+    recent_errors: int = 0
+    
+    def record_outcome(self, success: bool):
+        """Count a finished request in the lifetime totals and the recent window"""
+        failed = not success
+        outcomes = self.recent_outcomes
+        if len(outcomes) == outcomes.maxlen and outcomes[0]:
+            self.recent_errors -= 1  # The oldest outcome is about to drop out
+        outcomes.append(failed)
+        self.recent_errors += failed
+        
+        self.total_requests += 1
+        self.error_count += failed
 
 
 class ModelOrchestrator:
@@ -81,12 +107,14 @@ class ModelOrchestrator:
             config_path: Path to model configuration JSON file
         """
         self.models: Dict[str, ModelInstance] = {}
-        self.executor = ThreadPoolExecutor(max_workers=4)
         self.is_running = False
         self._lock = asyncio.Lock()
+        self.health_callbacks: List[Callable[[str, float], Awaitable[None]]] = []
+        self._nvml_handle = self._init_nvml()
         
         # Load configuration
         self.config = self._load_config(config_path)
+        self._configure_cuda_allocator()
         
         # Initialize models based on configuration
         self._initialize_models()
@@ -151,9 +179,24 @@ class ModelOrchestrator:
             },
             "health_check_interval": 30,
             "request_timeout": 300,
-            "retry_attempts": 3
+            "retry_attempts": 3,
+            # Expandable segments stop KV-cache churn fragmenting the CUDA caching allocator
+            "cuda_alloc_conf": "expandable_segments:True"
         }
     
+    def _configure_cuda_allocator(self):
+        """Set PYTORCH_CUDA_ALLOC_CONF for local backends unless the environment already does"""
+        # Only read when the first CUDA context is created, so this must run
+        # before any backend loads a model
+        alloc_conf = self.config.get("cuda_alloc_conf", "expandable_segments:True")
+        if alloc_conf:
+            os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", alloc_conf)
+        
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_initialized():
+            logger.warning("CUDA already initialised - PYTORCH_CUDA_ALLOC_CONF changes will not apply")
+        logger.info(f"PYTORCH_CUDA_ALLOC_CONF={os.environ.get('PYTORCH_CUDA_ALLOC_CONF', '<unset>')}")
+    
     def _initialize_models(self):
         """Initialize model instances from configuration"""
         for model_config in self.config["models"]:
@@ -165,51 +208,97 @@ class ModelOrchestrator:
     def _start_background_tasks(self):
         """Start background monitoring and maintenance tasks"""
         self.is_running = True
-        asyncio.create_task(self._health_monitor())
-        asyncio.create_task(self._resource_monitor())
+        asyncio.create_task(self._monitor_loop())
         logger.info("Started background monitoring tasks")
     
-    async def _health_monitor(self):
-        """Background task to monitor model health and performance"""
+    async def _monitor_loop(self):
+        """Background task running health and resource checks on one timer"""
+        # One task wakes the loop once per due check instead of two tasks
+        # sleeping independently; the jitter keeps several orchestrators
+        # from polling in lockstep
+        now = time.monotonic()
+        next_health = now
+        next_resources = now
+        
         while self.is_running:
-            try:
-                for model_name, instance in self.models.items():
-                    if instance.status == ModelStatus.READY:
-                        # Perform health check
-                        health_score = await self._check_model_health(model_name)
-                        instance.health_score = health_score
-                        
-                        # Log health issues
-                        if health_score < 0.5:
-                            logger.warning(f"Model {model_name} health score low: {health_score}")
+            now = time.monotonic()
+            
+            if now >= next_health:
+                try:
+                    await self._check_health()
+                    next_health = now + self.config["health_check_interval"]
+                except Exception as e:
+                    logger.error(f"Health monitor error: {e}")
+                    next_health = now + 10
+            
+            if now >= next_resources:
+                try:
+                    await self._check_resources()
+                    next_resources = now + 10
+                except Exception as e:
+                    logger.error(f"Resource monitor error: {e}")
+                    next_resources = now + 30
+            
+            delay = min(next_health, next_resources) - time.monotonic()
+            await asyncio.sleep(max(0.0, delay) + random.uniform(0, 1))
+    
+    async def _check_health(self):
+        """Check the health and performance of every ready model"""
+        for model_name, instance in self.models.items():
+            if instance.status == ModelStatus.READY:
+                # Perform health check
+                health_score = await self._check_model_health(model_name)
+                if health_score != instance.health_score:
+                    instance.health_score = health_score
+                    await self._trigger_health_callbacks(model_name, health_score)
                 
-                await asyncio.sleep(self.config["health_check_interval"])
-            except Exception as e:
-                logger.error(f"Health monitor error: {e}")
-                await asyncio.sleep(10)
+                # Log health issues
+                if health_score < 0.5:
+                    logger.warning(f"Model {model_name} health score low: {health_score}")
     
-    async def _resource_monitor(self):
-        """Monitor system resource usage and adjust model allocation"""
-        while self.is_running:
+    def register_health_callback(self, callback: Callable[[str, float], Awaitable[None]]):
+        """Register a callback invoked with (model_name, health_score) when a model's health changes"""
+        if callback not in self.health_callbacks:
+            self.health_callbacks.append(callback)
+    
+    async def _trigger_health_callbacks(self, model_name: str, health_score: float):
+        """Notify registered callbacks of a health score change"""
+        for callback in self.health_callbacks:
             try:
-                # Check GPU usage
-                gpu_info = GPUtil.getGPUs()
-                if gpu_info:
-                    gpu_usage = gpu_info[0].memoryUtil
-                    if gpu_usage > self.config["resource_limits"]["gpu_utilization_threshold"]:
-                        logger.warning(f"High GPU utilization: {gpu_usage:.2%}")
-                        await self._handle_resource_pressure("gpu")
-                
-                # Check RAM usage
-                ram_usage = psutil.virtual_memory().percent / 100
-                if ram_usage > self.config["resource_limits"]["ram_utilization_threshold"]:
-                    logger.warning(f"High RAM utilization: {ram_usage:.2%}")
-                    await self._handle_resource_pressure("ram")
-                
-                await asyncio.sleep(10)
+                await callback(model_name, health_score)
             except Exception as e:
-                logger.error(f"Resource monitor error: {e}")
-                await asyncio.sleep(30)
+                logger.error(f"Health callback error for model {model_name}: {e}")
+    
+    def _init_nvml(self) -> Optional[Any]:
+        """Initialise NVML once and return the first GPU's handle, or None without a GPU"""
+        try:
+            pynvml.nvmlInit()
+            return pynvml.nvmlDeviceGetHandleByIndex(0)
+        except pynvml.NVMLError as e:
+            logger.warning(f"NVML unavailable - GPU monitoring disabled: {e}")
+            return None
+    
+    def _gpu_memory_info(self) -> Optional[Any]:
+        """Current GPU memory info (total, used, free in bytes) from NVML"""
+        if self._nvml_handle is None:
+            return None
+        return pynvml.nvmlDeviceGetMemoryInfo(self._nvml_handle)
+    
+    async def _check_resources(self):
+        """Check system resource usage and adjust model allocation"""
+        # Check GPU usage
+        gpu_info = self._gpu_memory_info()
+        if gpu_info:
+            gpu_usage = gpu_info.used / gpu_info.total
+            if gpu_usage > self.config["resource_limits"]["gpu_utilization_threshold"]:
+                logger.warning(f"High GPU utilization: {gpu_usage:.2%}")
+                await self._handle_resource_pressure("gpu")
+        
+        # Check RAM usage
+        ram_usage = psutil.virtual_memory().percent / 100
+        if ram_usage > self.config["resource_limits"]["ram_utilization_threshold"]:
+            logger.warning(f"High RAM utilization: {ram_usage:.2%}")
+            await self._handle_resource_pressure("ram")
     
     async def load_model(self, model_name: str) -> bool:
         """
@@ -339,27 +428,40 @@ class ModelOrchestrator:
                     instance.current_requests < instance.config.max_concurrent_requests):
                     return preferred_model
             
-            # Find best available model for task
-            candidates = []
+            # Find best available model for task in a single pass; the first
+            # model wins ties, as with a stable sort
+            selected_model = None
+            best_score = float("-inf")
             
             for model_name, instance in self.models.items():
                 if (instance.status == ModelStatus.READY and
                     instance.current_requests < instance.config.max_concurrent_requests):
                     
                     score = self._calculate_model_score(instance, task_type, priority)
-                    candidates.append((model_name, score))
+                    if score > best_score:
+                        selected_model, best_score = model_name, score
             
-            if not candidates:
+            if selected_model is None:
                 logger.warning("No available models for request routing")
                 return None
             
-            # Sort by score (highest first) and return best match
-            candidates.sort(key=lambda x: x[1], reverse=True)
-            selected_model = candidates[0][0]
-            
             logger.debug(f"Routed {task_type} task to model: {selected_model}")
             return selected_model
     
+    def record_request_outcome(self, model_name: str, success: bool):
+        """
+        Record the outcome of a finished request for a model's health tracking
+        
+        Args:
+            model_name: Model that handled the request
+            success: Whether the request completed successfully
+        """
+        instance = self.models.get(model_name)
+        if instance is None:
+            logger.debug(f"Ignoring outcome for unknown model: {model_name}")
+            return
+        instance.record_outcome(success)
+    
     def _calculate_model_score(self, 
                               instance: ModelInstance, 
                               task_type: str, 
@@ -398,9 +500,9 @@ class ModelOrchestrator:
         """Check if sufficient resources are available for model"""
         # Check GPU memory availability
         try:
-            gpu_info = GPUtil.getGPUs()
+            gpu_info = self._gpu_memory_info()
             if gpu_info:
-                available_gpu_memory = (1 - gpu_info[0].memoryUtil) * gpu_info[0].memoryTotal / 1024  # GB
+                available_gpu_memory = gpu_info.free / (1024**3)  # GB
                 if available_gpu_memory < config.gpu_memory_gb:
                     logger.warning(f"Insufficient GPU memory: need {config.gpu_memory_gb}GB, available {available_gpu_memory:.1f}GB")
                     return False
@@ -440,9 +542,9 @@ class ModelOrchestrator:
             elif response_time > 5:
                 health_score -= 0.1
             
-            # Error rate factor
-            if instance.total_requests > 0:
-                error_rate = instance.error_count / instance.total_requests
+            # Error rate factor over the recent request window
+            if instance.recent_outcomes:
+                error_rate = instance.recent_errors / len(instance.recent_outcomes)
                 health_score -= error_rate * 0.5
             
             # Time since last use factor
@@ -543,7 +645,7 @@ class ModelOrchestrator:
                 "error_count": instance.error_count,
                 "health_score": instance.health_score,
                 "last_used": instance.last_used,
-                "specialized_domains": instance.config.specialized_domains,
+                "specialized_domains": sorted(instance.config.specialized_domains),
                 "gpu_memory_gb": instance.config.gpu_memory_gb,
                 "ram_memory_gb": instance.config.ram_memory_gb
             }
@@ -565,6 +667,7 @@ class ModelOrchestrator:
         for model_name in list(self.models.keys()):
             await self.unload_model(model_name)
         
-        # Shutdown executor
-        self.executor.shutdown(wait=True)
+        if self._nvml_handle is not None:
+            pynvml.nvmlShutdown()
+            self._nvml_handle = None
         logger.info("Model Orchestrator shutdown complete")
\ No newline at end of file
@@ -256,6 +256,7 @@ class TaskQueue:
             "assigned_model": task.assigned_model,
             "retry_count": task.retry_count,
             "error": task.error,
+            "result": task.result,
             "processing_time": self._calculate_processing_time(task),
             "wait_time": self._calculate_wait_time(task)
         }
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the AI coordinator's system monitoring.
+"""
+
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+# Add project root to path so the ai package imports as src.ai
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from src.ai.ai_coordinator import AICoordinator, AnalysisRequest, AnalysisType, _ResultCache
+from src.ai.task_queue import Task, TaskQueue, TaskStatus, TaskType
+
+
+def make_coordinator():
+    """Coordinator with mocked subsystems, skipping the real constructor."""
+    coordinator = object.__new__(AICoordinator)
+    coordinator.active_analyses = {}
+    coordinator.completed_analyses = {}
+    coordinator.performance_metrics = {"average_processing_time": 0.0}
+    coordinator._processing_time_sum = 0.0
+    coordinator._processing_time_count = 0
+
+    coordinator.orchestrator = MagicMock()
+    coordinator.orchestrator.get_model_status = AsyncMock(
+        return_value=[{"name": "llama_70b_verification", "health_score": 0.2}]
+    )
+    coordinator.task_queue = MagicMock()
+    coordinator.task_queue.get_queue_stats = AsyncMock(side_effect=RuntimeError("queue down"))
+    coordinator.load_balancer = MagicMock()
+    coordinator.load_balancer.get_load_balancing_stats = AsyncMock(return_value={})
+    coordinator.memory_manager = MagicMock()
+    coordinator.memory_manager.get_memory_stats.return_value = {
+        "system_memory": {"utilization": 0.5}
+    }
+    return coordinator
+
+
+async def test_health_check_survives_failed_queue_stats(caplog):
+    """A failing queue reports an error but the remaining checks still run."""
+    coordinator = make_coordinator()
+
+    performance = await coordinator.get_system_performance()
+    assert "error" in performance["task_queue"]
+
+    with caplog.at_level(logging.WARNING, logger="src.ai.ai_coordinator"):
+        await coordinator._check_system_health(performance)
+
+    assert "Unhealthy models detected" in caplog.text
+    assert "task queue backlog" not in caplog.text
+
+
+async def test_finished_tasks_record_model_outcomes():
+    """Completed and failed tasks feed their model's health; cancelled ones do not."""
+    coordinator = make_coordinator()
+    coordinator._task_futures = {}
+
+    for status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED):
+        task = Task(task_type=TaskType.DATA_ANALYSIS, content="", assigned_model="qwen_32b")
+        task.status = status
+        await coordinator._on_task_finished(task)
+
+    assert coordinator.orchestrator.record_request_outcome.call_args_list == [
+        (("qwen_32b", True),),
+        (("qwen_32b", False),),
+    ]
+
+
+def test_result_cache_expires_entries_behind_recently_read_ones(monkeypatch):
+    """Reading an entry moves it in LRU order without hiding older expiries."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = _ResultCache(maxsize=2, ttl=10.0)
+
+    cache["a"] = 1
+    now[0] += 5
+    cache["b"] = 2
+    assert cache["a"] == 1  # a is now the most recently used
+
+    now[0] += 6  # a has expired, b has not
+    assert len(cache) == 1
+    assert "a" not in cache
+    assert cache["b"] == 2
+
+    # LRU eviction still drops the least recently used live entry
+    cache["c"] = 3
+    assert cache["b"] == 2
+    cache["d"] = 4
+    assert "c" not in cache
+    assert len(cache) == 2
+
+
+async def test_submitted_task_context_is_json_serialisable():
+    """Tasks receive the enhanced context as a plain, serialisable dict."""
+    coordinator = make_coordinator()
+    coordinator.task_queue = TaskQueue()
+    coordinator._task_futures = {}
+    coordinator._finished_analyses = asyncio.Queue()
+    coordinator._submit_sem = asyncio.Semaphore(1)
+    coordinator._content_preambles = {analysis_type: "" for analysis_type in AnalysisType}
+    coordinator._static_context = {
+        "economic_framework": "Australian macroeconomic analysis",
+        "data_sources": ("RBA", "ABS"),
+        "focus_region": "Australia",
+        "rba_circular_flow": True,
+        "verification_enabled": True,
+    }
+
+    caller_context = {"region": "NSW", "focus_region": "ignored"}
+    task_id = await coordinator.submit_analysis(AnalysisRequest(
+        analysis_type=AnalysisType.DATA_ANALYSIS,
+        content="GDP growth",
+        context=caller_context,
+    ))
+
+    context = coordinator.task_queue.tasks[task_id].context
+    assert type(context) is dict
+    decoded = json.loads(json.dumps(context))
+    assert decoded["region"] == "NSW"
+    assert decoded["focus_region"] == "Australia"
+    assert decoded["data_sources"] == ["RBA", "ABS"]
+    assert caller_context == {"region": "NSW", "focus_region": "ignored"}
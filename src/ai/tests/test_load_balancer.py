@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for the load balancer's model selection.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+# Add project root to path so the ai package imports as src.ai
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from src.ai.load_balancer import LoadBalancer, LoadBalancingStrategy
+from src.ai.task_queue import TaskType
+
+
+def make_load_balancer(current_requests=0):
+    orchestrator = MagicMock()
+    orchestrator.get_model_status = AsyncMock(return_value=[{
+        "name": "llama_70b_verification",
+        "status": "ready",
+        "current_requests": current_requests,
+    }])
+    return LoadBalancer(orchestrator, LoadBalancingStrategy.LEAST_CONNECTIONS)
+
+
+async def test_assignment_within_status_ttl_does_not_oversubscribe():
+    """A model at capacity is not picked again from a snapshot taken before the assignment."""
+    load_balancer = make_load_balancer()
+
+    decision = await load_balancer.select_model(TaskType.VERIFICATION)
+    assert decision.selected_model == "llama_70b_verification"
+    await load_balancer.record_task_assignment(decision.selected_model)
+
+    # llama has capacity 1, even though the orchestrator has not caught up
+    assert await load_balancer.select_model(TaskType.VERIFICATION) is None
+    assert await load_balancer.select_model(
+        TaskType.VERIFICATION, preferred_model="llama_70b_verification"
+    ) is None
+
+    await load_balancer.record_task_completion(
+        "llama_70b_verification", TaskType.VERIFICATION, response_time=1.0, success=True
+    )
+    decision = await load_balancer.select_model(TaskType.VERIFICATION)
+    assert decision.selected_model == "llama_70b_verification"
+
+
+async def test_status_is_reread_after_assignment():
+    """Recording an assignment drops the cached status snapshot."""
+    load_balancer = make_load_balancer()
+
+    await load_balancer.select_model(TaskType.VERIFICATION)
+    await load_balancer.select_model(TaskType.VERIFICATION)
+    assert load_balancer.orchestrator.get_model_status.await_count == 1
+
+    await load_balancer.record_task_assignment("llama_70b_verification")
+    await load_balancer.select_model(TaskType.VERIFICATION)
+    assert load_balancer.orchestrator.get_model_status.await_count == 2
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory manager's cache admission, miss filter and array-backed tables.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path so the ai package imports as src.ai
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from src.ai.memory_manager import (
+    BloomFilter,
+    CacheTable,
+    MemoryAllocation,
+    MemoryManager,
+    MemoryPriority,
+    MemoryType,
+    TinyLFU,
+)
+
+
+CACHE_ENTRIES = 64
+
+
+def make_manager(**overrides):
+    """Manager with the default config apart from the given settings."""
+    config = MemoryManager().config
+    config.update({"max_cache_entries": CACHE_ENTRIES, **overrides})
+    return MemoryManager(config)
+
+
+def fill_cache(manager, count=CACHE_ENTRIES, size_bytes=100):
+    keys = [f"entry-{i}" for i in range(count)]
+    for key in keys:
+        assert manager.cache_object(key, key, size_bytes=size_bytes)
+    return keys
+
+
+def assert_pool_matches_entries(manager):
+    """The data cache pool is charged exactly the sizes of the stored entries."""
+    pool = manager.memory_pools[MemoryType.DATA_CACHE]
+    assert pool.total_allocated == sum(entry["size_bytes"] for entry in manager.cache_storage.values())
+
+
+def test_frequently_missed_key_displaces_cold_entry():
+    """A key requested often while absent is admitted over a cold LRU entry."""
+    manager = make_manager()
+    keys = fill_cache(manager)
+
+    for _ in range(5):
+        assert manager.get_cached_object("hot") is None
+
+    assert manager.cache_object("hot", "value", size_bytes=100)
+    assert "hot" in manager.cache_storage
+    # The victim comes from the least recently used sample
+    assert sum(key not in manager.cache_storage for key in keys[:5]) == 1
+    assert len(manager.cache_storage) == CACHE_ENTRIES
+    assert_pool_matches_entries(manager)
+
+
+def test_cold_key_rejected_when_full():
+    """A never-requested key does not displace entries that are being read."""
+    manager = make_manager()
+    keys = fill_cache(manager)
+    for _ in range(3):
+        for key in keys:
+            assert manager.get_cached_object(key) == key
+
+    assert not manager.cache_object("cold", "value", size_bytes=100)
+    assert "cold" not in manager.cache_storage
+    assert set(manager.cache_storage) == set(keys)
+    assert_pool_matches_entries(manager)
+
+
+def test_sketch_reset_halves_counters():
+    """Ageing halves the counters and clears the doorkeeper."""
+    sketch = TinyLFU(16)
+    for _ in range(6):
+        sketch.increment("key")
+    assert sketch.estimate("key") == 6  # Doorkeeper plus five counted accesses
+
+    sketch._reset()
+    assert sketch.estimate("key") == 2
+
+    # The sketch ages itself after 10x capacity recorded accesses
+    for _ in range(10 * 16 - sketch._additions):
+        sketch.increment("key")
+    assert sketch.estimate("key") <= TinyLFU.MAX_COUNT // 2 + 1
+
+
+def test_pool_charge_follows_replace_evict_and_reject():
+    """Replacing, evicting and rejecting entries keep the pool charge exact."""
+    manager = make_manager()
+    keys = fill_cache(manager)
+    assert_pool_matches_entries(manager)
+
+    # Replace with a different size
+    assert manager.cache_object(keys[-1], "bigger", size_bytes=500)
+    assert_pool_matches_entries(manager)
+
+    # Admit a hot key over a cold one
+    for _ in range(5):
+        manager.get_cached_object("hot")
+    assert manager.cache_object("hot", "value", size_bytes=300)
+    assert_pool_matches_entries(manager)
+
+    # Reject a cold key once the remaining entries are warm
+    for _ in range(3):
+        for key in list(manager.cache_storage):
+            manager.get_cached_object(key)
+    assert not manager.cache_object("cold", "value", size_bytes=700)
+    assert_pool_matches_entries(manager)
+
+    assert manager._evict_cache_entries(10) == 10
+    assert_pool_matches_entries(manager)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Every added key is reported as possibly present, even past capacity."""
+    keys = [f"key-{i}" for i in range(1000)]
+    bloom = BloomFilter(100, keys[:500])
+    for key in keys[500:]:
+        bloom.add(key)
+
+    assert all(bloom.might_contain(key) for key in keys)
+    assert bloom.insertions == 1000
+
+
+def test_stored_keys_survive_bloom_rebuild():
+    """Rebuilding the miss filter after churn keeps every live key findable."""
+    manager = make_manager(max_cache_entries=8)
+    for i in range(4 * 8):
+        manager.cache_object(f"churn-{i}", i, size_bytes=10)
+        manager.remove_cached_object(f"churn-{i}")
+    for i in range(4):
+        manager.cache_object(f"live-{i}", i, size_bytes=10)
+
+    bloom = manager._cache_bloom
+    asyncio.run(manager._normal_cache_cleanup())
+    assert manager._cache_bloom is not bloom
+    assert manager._cache_bloom.insertions == 4
+
+    for i in range(4):
+        assert manager.get_cached_object(f"live-{i}") == i
+    # Keys stored after the rebuild are marked in the new filter
+    manager.cache_object("after", "value", size_bytes=10)
+    assert manager.get_cached_object("after") == "value"
+
+
+def test_bloom_rebuild_waits_for_four_times_capacity():
+    """The filter is only rebuilt once insertions exceed 4x the cache capacity."""
+    manager = make_manager(max_cache_entries=8)
+    for i in range(4 * 8):
+        manager.cache_object(f"churn-{i}", i, size_bytes=10)
+        manager.remove_cached_object(f"churn-{i}")
+
+    bloom = manager._cache_bloom
+    asyncio.run(manager._normal_cache_cleanup())
+    assert manager._cache_bloom is bloom
+
+    manager.cache_object("one-more", "value", size_bytes=10)
+    asyncio.run(manager._normal_cache_cleanup())
+    assert manager._cache_bloom is not bloom
+    assert manager.get_cached_object("one-more") == "value"
+
+
+def test_column_table_grows_past_initial_capacity():
+    """Columns double when full and keep the values already stored."""
+    table = CacheTable()
+    for i in range(100):
+        table.set(f"key-{i}", float(i), MemoryPriority.MEDIUM)
+
+    assert table.rows == 100
+    assert len(table.keys) == len(table.expires_at) == len(table.priorities) == 128
+    assert table.expires_at[table._row_of["key-0"]] == 0.0
+    assert table.expires_at[table._row_of["key-99"]] == 99.0
+    assert table.live_keys(np.ones(table.rows, dtype=bool)) == [f"key-{i}" for i in range(100)]
+
+
+def test_column_table_reuses_freed_rows():
+    """Removed keys free their rows for new keys instead of growing the table."""
+    table = CacheTable()
+    for i in range(10):
+        table.set(f"key-{i}", float(i), MemoryPriority.MEDIUM)
+
+    freed_row = table._row_of["key-3"]
+    table.remove("key-3")
+    table.set("new", 42.0, MemoryPriority.LOW)
+    assert table._row_of["new"] == freed_row
+    assert table.expires_at[freed_row] == 42.0
+
+    table.remove_many(["key-5", "key-6", "missing"])
+    table.set("newer", 1.0, MemoryPriority.LOW)
+    table.set("newest", 2.0, MemoryPriority.LOW)
+    assert table.rows == 10
+
+
+def test_live_keys_never_returns_removed_keys():
+    """Freed rows are excluded from every scan, whatever the mask selects."""
+    table = CacheTable()
+    for i in range(70):
+        table.set(f"key-{i}", float(i), MemoryPriority.MEDIUM)
+
+    table.remove("key-0")
+    table.remove_many([f"key-{i}" for i in range(60, 70)])
+    removed = {"key-0", *(f"key-{i}" for i in range(60, 70))}
+
+    everything = table.live_keys(np.ones(table.rows, dtype=bool))
+    assert removed.isdisjoint(everything)
+    assert len(everything) == 59
+    expired = table.live_keys(table.expires_at[:table.rows] < 65.0)
+    assert set(expired) == {f"key-{i}" for i in range(1, 60)}
+
+
+def add_allocation(manager, memory_type, priority, idle_seconds, pinned=False):
+    """Record a direct allocation last accessed idle_seconds ago."""
+    allocation = MemoryAllocation(
+        id=len(manager.allocations) + 1_000_000,
+        memory_type=memory_type,
+        size_bytes=1024,
+        priority=priority,
+        owner="test",
+        description="",
+        last_accessed=time.monotonic() - idle_seconds,
+        is_pinned=pinned,
+    )
+    manager.allocations[allocation.id] = allocation
+    manager._allocation_table.add(allocation)
+    manager._managed_allocations += 1
+    manager._managed_bytes += allocation.size_bytes
+    return allocation.id
+
+
+def test_cleanup_frees_only_idle_unpinned_low_priority_or_temporary():
+    """Cleanup applies the same rules as the per-allocation loop it replaced."""
+    manager = make_manager()
+    temporary_idle = add_allocation(manager, MemoryType.TEMPORARY, MemoryPriority.HIGH, 400)
+    temporary_recent = add_allocation(manager, MemoryType.TEMPORARY, MemoryPriority.LOW, 100)
+    temporary_pinned = add_allocation(manager, MemoryType.TEMPORARY, MemoryPriority.LOW, 400, pinned=True)
+    low_idle = add_allocation(manager, MemoryType.SYSTEM_RAM, MemoryPriority.LOW, 2000)
+    disposable_idle = add_allocation(manager, MemoryType.GPU_MEMORY, MemoryPriority.DISPOSABLE, 2000)
+    low_recent = add_allocation(manager, MemoryType.SYSTEM_RAM, MemoryPriority.LOW, 1000)
+    medium_idle = add_allocation(manager, MemoryType.SYSTEM_RAM, MemoryPriority.MEDIUM, 5000)
+    low_pinned = add_allocation(manager, MemoryType.SYSTEM_RAM, MemoryPriority.LOW, 2000, pinned=True)
+
+    freed, freed_bytes = asyncio.run(manager._cleanup_unused_allocations(aggressive=False))
+    assert (freed, freed_bytes) == (3, 3 * 1024)
+    assert set(manager.allocations) == {
+        temporary_recent, temporary_pinned, low_recent, medium_idle, low_pinned
+    }
+    assert temporary_idle not in manager.allocations
+    assert low_idle not in manager.allocations
+    assert disposable_idle not in manager.allocations
+
+    # Aggressive cleanup also frees idle pinned allocations
+    freed, _ = asyncio.run(manager._cleanup_unused_allocations(aggressive=True))
+    assert freed == 2
+    assert set(manager.allocations) == {temporary_recent, low_recent, medium_idle}
+
+    table = manager._allocation_table
+    assert set(table.live_keys(np.ones(table.rows, dtype=bool))) == set(manager.allocations)
+    assert manager._managed_allocations == 3
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for the model orchestrator's request outcome tracking.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path so the ai package imports as src.ai
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from src.ai.model_orchestrator import (
+    HEALTH_WINDOW_SIZE,
+    ModelConfig,
+    ModelInstance,
+    ModelOrchestrator,
+    ModelPriority,
+)
+
+
+def make_instance():
+    config = ModelConfig(
+        name="qwen_32b",
+        model_path="qwen2.5:32b",
+        priority=ModelPriority.HIGH,
+        gpu_memory_gb=20.0,
+        ram_memory_gb=8.0,
+    )
+    return ModelInstance(config=config)
+
+
+def test_record_outcome_counts_errors():
+    """Errors are counted in both the lifetime totals and the recent window."""
+    instance = make_instance()
+
+    for success in (True, False, True, False, False):
+        instance.record_outcome(success)
+
+    assert instance.total_requests == 5
+    assert instance.error_count == 3
+    assert instance.recent_errors == 3
+    assert list(instance.recent_outcomes) == [False, True, False, True, True]
+
+
+def test_record_outcome_evicts_oldest():
+    """A full window drops its oldest outcome and that outcome's error."""
+    instance = make_instance()
+
+    instance.record_outcome(False)
+    for _ in range(HEALTH_WINDOW_SIZE - 1):
+        instance.record_outcome(True)
+    assert instance.recent_errors == 1
+    assert len(instance.recent_outcomes) == HEALTH_WINDOW_SIZE
+
+    # Pushes the initial error out of the window
+    instance.record_outcome(True)
+    assert instance.recent_errors == 0
+    assert len(instance.recent_outcomes) == HEALTH_WINDOW_SIZE
+
+    # Lifetime totals keep every request
+    assert instance.total_requests == HEALTH_WINDOW_SIZE + 1
+    assert instance.error_count == 1
+
+
+def test_record_request_outcome():
+    """The orchestrator records outcomes for known models and ignores the rest."""
+    orchestrator = object.__new__(ModelOrchestrator)
+    instance = make_instance()
+    orchestrator.models = {"qwen_32b": instance}
+
+    orchestrator.record_request_outcome("qwen_32b", False)
+    orchestrator.record_request_outcome("unknown_model", False)
+
+    assert instance.total_requests == 1
+    assert instance.recent_errors == 1
@@ -10,10 +10,18 @@ import asyncio
 import logging
 import json
 import time
+from dataclasses import asdict
 from typing import Dict, Any
 import os
 import sys
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    # Not available on Windows; the stock asyncio loop is used instead
+    UVLOOP_AVAILABLE = False
+
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -315,7 +323,7 @@ class EconCellAITester:
             self.test_results["load_balancing"] = {
                 "status": "success",
                 "load_balancer_stats": lb_stats,
-                "model_selection": selection_result.__dict__ if selection_result else None
+                "model_selection": asdict(selection_result) if selection_result else None
             }
             
             logger.info("✅ Load balancing test successful")
@@ -475,5 +483,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Run the test suite
-    asyncio.run(main())
\ No newline at end of file
+    # Run the test suite, on uvloop when it is installed
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file